@@ -1,5 +1,11 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ApiConfig(AppConfig):
     name = 'api'
+
+    def ready(self):
+        if settings.DLS_SERVICE_WARM_UP:
+            from .services import dls_service
+            dls_service.warm_up()
@@ -0,0 +1,158 @@
+"""
+Async-native versions of the hot endpoints, for the ASGI application.
+
+DRF's ``APIView`` is synchronous, so under ASGI each request to it is handed
+to a worker thread and back. These views are plain Django views with
+``async`` handlers instead: they parse, validate, calculate and render on
+the event loop without a thread hop, and return the same status codes,
+headers and bodies as their DRF counterparts in ``api.views``.
+``api/urls.py`` serves them when ``DLS_ASYNC_VIEWS`` is enabled, which
+``config/asgi.py`` does by default.
+"""
+
+import io
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.http import parse_etags
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import NotAcceptable, ParseError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from .responses import rendered_bodies
+from .serializers import DLSRequestSerializer
+from .services import dls_service, get_resource_table_payload
+from .views import ResourceTableView
+
+
+class AsyncAPIView(View):
+    """
+    Base class for the async views, handling JSON in and out like DRF does
+    with the default parser and the configured renderers.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Like APIView, authentication is stateless so CSRF does not apply
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        # Like APIView, the renderer is negotiated before the handler runs
+        renderers = [renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES]
+        try:
+            self.renderer, self.media_type = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS().select_renderer(
+                Request(request), renderers
+            )
+        except NotAcceptable as e:
+            self.renderer, self.media_type = renderers[0], renderers[0].media_type
+            return self.respond({"detail": e.detail}, status=status.HTTP_406_NOT_ACCEPTABLE)
+        return await super().dispatch(request, *args, **kwargs)
+
+    def parse(self, request):
+        """
+        Returns the request's JSON body, or a 400/415 response if it has none that can be parsed.
+        """
+        if not request.body:
+            return {}
+        parser = api_settings.DEFAULT_PARSER_CLASSES[0]()
+        if request.content_type != parser.media_type:
+            return self.respond(
+                {"detail": f'Unsupported media type "{request.META.get("CONTENT_TYPE", "")}" in request.'},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+        try:
+            return parser.parse(
+                io.BytesIO(request.body),
+                parser_context={"encoding": request.encoding or settings.DEFAULT_CHARSET}
+            )
+        except ParseError as e:
+            return self.respond({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+
+    def respond(self, data, status=status.HTTP_200_OK, headers=None) -> HttpResponse:
+        return self.respond_rendered(self.renderer.render(data, self.media_type, {}), status, headers)
+
+    def respond_rendered(self, body: bytes, status=status.HTTP_200_OK, headers=None) -> HttpResponse:
+        response = HttpResponse(body, status=status, headers=headers)
+        if not body:
+            del response["Content-Type"]
+        else:
+            # Like DRF's Response, the renderer's media type, not the accepted one
+            charset = self.renderer.charset
+            response["Content-Type"] = (
+                f"{self.renderer.media_type}; charset={charset}" if charset else self.renderer.media_type
+            )
+        response["Vary"] = "Accept"
+        response["Allow"] = ", ".join(self._allowed_methods())
+        return response
+
+
+class AsyncDLSScoreView(AsyncAPIView):
+    """
+    ``DLSScoreView`` for the event loop.
+    """
+
+    async def post(self, request):
+        data = self.parse(request)
+        if isinstance(data, HttpResponse):
+            return data
+
+        validated_data, errors = DLSRequestSerializer.validate_data(data)
+        if errors:
+            return self.respond(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            par_score = await dls_service.acalculate(validated_data)
+        except Exception as e:
+            return self.respond({"status": "error", "message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return self.respond({
+            "par_score": par_score,
+            "revised_target": par_score + 1,
+            "messages": ["Target calculated successfully."]
+        })
+
+
+class AsyncResourceTableView(AsyncAPIView):
+    """
+    ``ResourceTableView`` for the event loop.
+    """
+
+    async def get(self, request):
+        match_format = request.GET.get("match_format", "T20")
+        table_version = request.GET.get("version") or None
+        try:
+            data, etag = get_resource_table_payload(match_format, table_version)
+        except KeyError:
+            return self.respond(
+                {"status": "error", "message": ResourceTableView.unknown_table_message(match_format, table_version)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if table_version is None:
+            max_age = ResourceTableView.active_cache_max_age
+        else:
+            max_age = ResourceTableView.cache_max_age
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={max_age}",
+        }
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in if_none_match or "*" in if_none_match:
+            return self.respond_rendered(b"", status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        # Shared with ResourceTableView's responses
+        body, _ = rendered_bodies.get_or_render(
+            (("resource-table", etag), type(self.renderer), self.media_type),
+            lambda: (self.renderer.render(data, self.media_type, {}), self.media_type)
+        )
+        return self.respond_rendered(body, headers=headers)
+
+
+class AsyncHealthCheckView(AsyncAPIView):
+    """
+    ``HealthCheckView`` for the event loop.
+    """
+
+    async def get(self, request):
+        return self.respond({"status": "ok"})
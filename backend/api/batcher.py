@@ -0,0 +1,148 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+from django.conf import settings
+
+
+class _Batch:
+    """
+    Requests collected during one batching window.
+    """
+
+    __slots__ = ("items", "results", "dispatched_at", "full", "done")
+
+    def __init__(self):
+        self.items: List[Any] = []
+        self.results: Optional[List[Any]] = None
+        self.dispatched_at = 0.0
+        self.full = threading.Event()
+        self.done = threading.Event()
+
+
+class MicroBatcher:
+    """
+    Collects concurrent single-scenario requests into batches.
+
+    The first request of a batch leads it: it waits up to ``window`` seconds
+    (less if ``max_size`` requests arrive first) for other requests to join,
+    evaluates the whole batch with one call of ``calculate_many`` and hands
+    every caller its own result. No background thread is involved, so each
+    worker process batches only its own concurrent requests, and a lone
+    request pays at most one window of added latency.
+    """
+
+    def __init__(
+        self,
+        calculate_many: Callable[[List[Any]], List[Union[Any, Exception]]],
+        window: float = 0.002,
+        max_size: int = 256,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            calculate_many: Evaluates a list of items, returning a result or an exception per item
+            window: Seconds the leading request waits for others to join
+            max_size: Requests that close a batch before its window ends
+            enabled: Whether callers should batch at all
+        """
+        self.calculate_many = calculate_many
+        self.window = window
+        self.max_size = max_size
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._batch: Optional[_Batch] = None
+        self._stats_lock = threading.Lock()
+        self.clear()
+
+    def submit(self, item: Any) -> Any:
+        """
+        Evaluates an item as part of the current batch, blocking until its result is ready.
+
+        Raises:
+            Exception: The item's error, as returned by ``calculate_many``.
+        """
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _Batch()
+            index = len(batch.items)
+            batch.items.append(item)
+            if len(batch.items) >= self.max_size:
+                # Later requests start a new batch
+                self._batch = None
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._dispatch(batch)
+        else:
+            batch.done.wait()
+
+        self._record_wait(batch.dispatched_at - enqueued_at)
+        result = batch.results[index]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _dispatch(self, batch: _Batch):
+        batch.dispatched_at = time.perf_counter()
+        try:
+            batch.results = self.calculate_many(batch.items)
+        except Exception as e:
+            batch.results = [e] * len(batch.items)
+        finally:
+            with self._stats_lock:
+                self._batches += 1
+                self._max_batch_size = max(self._max_batch_size, len(batch.items))
+            batch.done.set()
+
+    def _record_wait(self, seconds: float):
+        with self._stats_lock:
+            self._requests += 1
+            self._total_wait += seconds
+            self._max_wait = max(self._max_wait, seconds)
+
+    def clear(self):
+        with self._stats_lock:
+            self._batches = 0
+            self._requests = 0
+            self._max_batch_size = 0
+            self._total_wait = 0.0
+            self._max_wait = 0.0
+
+    def stats(self) -> Dict[str, Union[bool, int, float]]:
+        """
+        Returns the achieved batch sizes and the latency added by waiting for
+        a batch to be dispatched, in milliseconds.
+        """
+        with self._stats_lock:
+            batches, requests = self._batches, self._requests
+            return {
+                "enabled": self.enabled,
+                "window_ms": self.window * 1000,
+                "max_size": self.max_size,
+                "batches": batches,
+                "requests": requests,
+                "mean_batch_size": requests / batches if batches else 0.0,
+                "max_batch_size": self._max_batch_size,
+                "mean_wait_ms": self._total_wait / requests * 1000 if requests else 0.0,
+                "max_wait_ms": self._max_wait * 1000,
+            }
+
+
+def build_micro_batcher(calculate_many: Callable[[List[Any]], List[Union[Any, Exception]]]) -> MicroBatcher:
+    """
+    Builds a batcher configured by ``DLS_MICRO_BATCHING``.
+    """
+    config = settings.DLS_MICRO_BATCHING
+    return MicroBatcher(
+        calculate_many,
+        window=config.get("WINDOW_MS", 2) / 1000,
+        max_size=config.get("MAX_SIZE", 256),
+        enabled=config.get("ENABLED", False),
+    )
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, Set
+
+
+class Subscription:
+    """
+    A subscriber's queue of messages on one channel.
+
+    The queue is bounded; when a slow subscriber falls behind, the oldest
+    message is dropped, since only the latest par score matters.
+    """
+
+    def __init__(self, broker: "LocalBroker", channel: str, max_queue_size: int):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+
+    def put(self, message: Any):
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    async def get(self) -> Any:
+        return await self.queue.get()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        while True:
+            yield await self.get()
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker:
+    """
+    In-process publish/subscribe broker.
+
+    Subscribers are asyncio consumers (e.g. streaming responses under ASGI);
+    publishers may be synchronous views running in any thread. Each message
+    is computed once by the publisher and fanned out to every subscriber of
+    the channel. Channels only reach subscribers in the same process.
+    """
+
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str) -> Subscription:
+        """
+        Subscribes the running event loop to a channel.
+        """
+        subscription = Subscription(self, channel, self.max_queue_size)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(channel, ()))
+
+    def publish(self, channel: str, message: Any) -> int:
+        """
+        Delivers a message to every subscriber of a channel.
+
+        Safe to call from any thread. Returns the number of subscribers the
+        message was delivered to.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, message)
+            except RuntimeError:
+                # The subscriber's event loop has closed
+                self.unsubscribe(subscription)
+        return len(subscriptions)
+
+
+live_broker = LocalBroker()
@@ -0,0 +1,222 @@
+import hashlib
+from abc import ABC, abstractmethod
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.module_loading import import_string
+from calculators.dls_calculator import DLSCalculator
+from calculators.table_provider import resource_tables
+from .validators import SCENARIO_RULES
+
+
+_MISSING = object()
+
+
+class ResultCacheBackend(ABC):
+    """
+    Storage interface for ``ResultCache``.
+    """
+
+    @abstractmethod
+    def get(self, key: Tuple) -> Any:
+        """
+        Returns the cached value, or ``_MISSING`` when there is none.
+        """
+
+    @abstractmethod
+    def set(self, key: Tuple, value: Any):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    @property
+    def in_process(self) -> bool:
+        """
+        Whether lookups stay in this process, with no I/O that could block an event loop.
+        """
+        return False
+
+
+class LocalLRUBackend(ResultCacheBackend):
+    """
+    Per-process LRU cache with an optional time to live (in seconds).
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def in_process(self):
+        return True
+
+
+class DjangoCacheBackend(ResultCacheBackend):
+    """
+    Stores results in one of Django's configured caches (``CACHES``), so a
+    shared cache such as Redis or Memcached can serve every worker.
+
+    The cache may hold other entries too, so results are not cleared by
+    flushing it: their keys include a generation stored in the cache, and
+    ``clear`` starts a new one. Entries of earlier generations are never read
+    again and expire like any other entry.
+    """
+
+    def __init__(self, alias: str = "default", timeout: Optional[float] = None, key_prefix: str = "dls-result"):
+        self.alias = alias
+        self.timeout = timeout
+        self.key_prefix = key_prefix
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def _generation_key(self) -> str:
+        return f"{self.key_prefix}:generation"
+
+    def _generation(self) -> str:
+        cache = self.cache
+        generation = cache.get(self._generation_key)
+        if generation is None:
+            # First use, or the generation was evicted; either way no stored
+            # result can be reached any more, so any new generation will do
+            cache.add(self._generation_key, uuid.uuid4().hex, None)
+            generation = cache.get(self._generation_key)
+        return generation
+
+    def _cache_key(self, key: Tuple) -> str:
+        return f"{self.key_prefix}:{self._generation()}:{hashlib.sha1(repr(key).encode()).hexdigest()}"
+
+    def get(self, key):
+        return self.cache.get(self._cache_key(key), _MISSING)
+
+    def set(self, key, value):
+        self.cache.set(self._cache_key(key), value, self.timeout)
+
+    def clear(self):
+        self.cache.set(self._generation_key, uuid.uuid4().hex, None)
+
+    @property
+    def in_process(self):
+        return isinstance(self.cache, LocMemCache)
+
+
+class ResultCache:
+    """
+    Memoizes calculation results with hit and miss counters for monitoring.
+
+    Exceptions raised while computing are not cached.
+    """
+
+    def __init__(self, backend: ResultCacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if not self.enabled:
+            return compute()
+
+        value = self.backend.get(key)
+        if value is not _MISSING:
+            with self._lock:
+                self.hits += 1
+            return value
+
+        with self._lock:
+            self.misses += 1
+        value = compute()
+        self.backend.set(key, value)
+        return value
+
+    @property
+    def in_process(self) -> bool:
+        """
+        Whether ``get_or_compute`` never waits on another process.
+        """
+        return not self.enabled or self.backend.in_process
+
+    def clear(self):
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Union[str, int, float, bool]]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+
+def result_cache_key(validated_data: Dict[str, Union[str, Dict[str, Union[int, float]]]]) -> Tuple:
+    """
+    Canonical key for a validated DLS request.
+
+    Only the scenario's required inputs take part, in rule order, and overs
+    are normalized to balls, since the calculator only ever uses them as
+    balls: 20, 20.0 and "20" all produce the same key. The resource table
+    version is resolved, so results of different table versions never mix.
+    """
+    scenario = validated_data["scenario_type"]
+    match_format = validated_data["match_format"]
+    inputs = validated_data["inputs"]
+    values = tuple(
+        DLSCalculator._convert_overs_to_balls(inputs[field]) if "overs" in field else inputs[field]
+        for field in SCENARIO_RULES[scenario].required_inputs
+    )
+    table_version = validated_data.get("table_version") or resource_tables.active_version(match_format)
+    return (scenario, match_format, table_version, values)
+
+
+def build_result_cache() -> ResultCache:
+    """
+    Builds the result cache configured by ``DLS_RESULT_CACHE``.
+    """
+    config = settings.DLS_RESULT_CACHE
+    backend_class = import_string(config["BACKEND"])
+    return ResultCache(backend_class(**config.get("OPTIONS", {})), enabled=config.get("ENABLED", True))
+
+
+result_cache = build_result_cache()
@@ -0,0 +1,85 @@
+import re
+from typing import Any, Callable, Dict
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.util import camel_to_underscore, camelize_re, underscore_to_camel
+from .validators import ScenarioValidator
+
+
+# Keys of the API's responses, converted up front alongside the input fields.
+RESPONSE_KEYS = (
+    "par_score", "revised_target", "messages", "status", "message", "inputs", "errors",
+    "scenario_type", "match_format", "non_field_errors", "count", "succeeded", "failed",
+    "results", "index", "session_id", "overs_used", "balls_used", "wickets_lost",
+    "encoding", "dtype", "par_scores", "result_cache", "hit_ratio",
+)
+
+
+class KeyMap:
+    """
+    Memoized key conversion between snake_case and camelCase.
+
+    Conversions match ``djangorestframework_camel_case`` exactly, but each key
+    only goes through the regex once. The map is seeded with the API's known
+    keys; other keys are memoized up to ``max_size`` entries, so keys sent by
+    clients cannot grow it without bound.
+    """
+
+    def __init__(self, convert: Callable[[str], str], seed: Dict[str, str], max_size: int = 4096):
+        self.convert = convert
+        self.max_size = max_size
+        self._keys = dict(seed)
+
+    def __getitem__(self, key: str) -> str:
+        converted = self._keys.get(key)
+        if converted is None:
+            converted = self.convert(key)
+            if len(self._keys) < self.max_size:
+                self._keys[key] = converted
+        return converted
+
+
+def _to_camel(key: str) -> str:
+    return re.sub(camelize_re, underscore_to_camel, key) if "_" in key else key
+
+
+_snake_keys = list(ScenarioValidator.field_map) + list(RESPONSE_KEYS)
+
+camel_keys = KeyMap(_to_camel, {key: _to_camel(key) for key in _snake_keys})
+snake_keys = KeyMap(camel_to_underscore, {
+    **{_to_camel(key): key for key in _snake_keys},
+    **{key: camel_to_underscore(key) for key in _snake_keys},
+})
+
+
+def camelize(data: Any) -> Any:
+    """
+    ``djangorestframework_camel_case.util.camelize`` using the precomputed key map.
+    """
+    if isinstance(data, Promise):
+        data = force_str(data)
+    if isinstance(data, dict):
+        converted = {}
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+            converted[camel_keys[key] if isinstance(key, str) else key] = camelize(value)
+        return converted
+    if isinstance(data, (list, tuple)):
+        return [camelize(item) for item in data]
+    return data
+
+
+def underscoreize(data: Any) -> Any:
+    """
+    ``djangorestframework_camel_case.util.underscoreize`` for parsed JSON,
+    using the precomputed key map.
+    """
+    if isinstance(data, dict):
+        return {
+            snake_keys[key] if isinstance(key, str) else key: underscoreize(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [underscoreize(item) for item in data]
+    return data
@@ -0,0 +1,290 @@
+"""
+A fast lane for ``POST /calculate-dls-score/`` in front of the Django application.
+
+A calculation takes a few microseconds, while a request through Django's
+handler, the middleware and DRF's request, negotiation and response
+machinery costs far more. ``FastLaneWSGI`` and ``FastLaneASGI`` wrap the
+WSGI and ASGI applications and answer successful calculations themselves:
+they parse the body with the API's JSON parser, validate it with the
+compiled scenario rules of ``DLSRequestSerializer``, calculate with
+``dls_service`` and render with the API's renderer, adding the headers the
+middleware would. Any other request, including every request the API
+answers with an error, is passed to Django unchanged, so responses are the
+same byte for byte either way.
+
+The lane is off unless ``DLS_FAST_LANE`` is enabled, and only covers the
+middleware and settings it mirrors; with any other configuration it turns
+itself off and everything goes to Django.
+"""
+
+import io
+import re
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+from corsheaders.conf import conf as cors_conf
+from django.conf import settings
+from django.http.request import split_domain_port, validate_host
+from django.urls import resolve, reverse
+from rest_framework.exceptions import ParseError
+from rest_framework.settings import api_settings
+from .async_views import AsyncDLSScoreView
+from .serializers import DLSRequestSerializer
+from .services import dls_service
+from .views import DLSScoreView
+
+
+# The middleware whose response headers the lane adds itself
+MIRRORED_MIDDLEWARE = [
+    'corsheaders.middleware.CorsMiddleware',
+    'api.middleware.SecurityMiddleware',
+    'api.middleware.CommonMiddleware',
+    'api.middleware.XFrameOptionsMiddleware',
+]
+
+# Accept header values for which DRF picks the default renderer as is
+_DEFAULT_RENDERER_ACCEPTS = {"*/*", "application/*", "application/json"}
+
+Headers = List[Tuple[str, str]]
+
+
+class FastLane:
+    """
+    The protocol-independent part of the fast lane.
+    """
+
+    def __init__(self):
+        self.path = reverse("api:calculate_dls_score")
+        self.parser = api_settings.DEFAULT_PARSER_CLASSES[0]()
+        self.renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        self.enabled = settings.DLS_FAST_LANE and self._mirrors_stack()
+        if self.enabled:
+            self.headers, self.security_headers = self._response_headers()
+
+    def _mirrors_stack(self) -> bool:
+        """
+        Whether requests to the calculation endpoint go through exactly the steps the lane reproduces.
+        """
+        view_class = getattr(resolve(self.path).func, "view_class", None)
+        return (
+            view_class in (DLSScoreView, AsyncDLSScoreView)
+            and list(settings.MIDDLEWARE) == MIRRORED_MIDDLEWARE
+            and self.parser.media_type == "application/json"
+            and self.renderer.media_type == "application/json"
+            and not api_settings.DEFAULT_AUTHENTICATION_CLASSES
+            and not api_settings.DEFAULT_THROTTLE_CLASSES
+            and not settings.SECURE_SSL_REDIRECT
+            and not settings.SECURE_HSTS_SECONDS
+            and not settings.PREPEND_WWW
+            and not settings.DISALLOWED_USER_AGENTS
+            and not settings.USE_X_FORWARDED_HOST
+            and cors_conf.CORS_ALLOW_ALL_ORIGINS
+            and not cors_conf.CORS_ALLOW_CREDENTIALS
+            and not cors_conf.CORS_EXPOSE_HEADERS
+            and re.match(cors_conf.CORS_URLS_REGEX, self.path) is not None
+        )
+
+    def _response_headers(self) -> Tuple[Headers, Headers]:
+        """
+        Returns the headers before and after Content-Length, in the order
+        the view and the middleware add them.
+        """
+        headers = [
+            ("Content-Type", self.renderer.media_type),
+            ("Vary", "Accept, origin"),
+            ("Allow", "POST, OPTIONS"),
+            ("X-Frame-Options", getattr(settings, "X_FRAME_OPTIONS", "DENY").upper()),
+        ]
+        security_headers = []
+        if settings.SECURE_CONTENT_TYPE_NOSNIFF:
+            security_headers.append(("X-Content-Type-Options", "nosniff"))
+        referrer_policy = settings.SECURE_REFERRER_POLICY
+        if referrer_policy:
+            if isinstance(referrer_policy, str):
+                referrer_policy = [value.strip() for value in referrer_policy.split(",")]
+            security_headers.append(("Referrer-Policy", ",".join(referrer_policy)))
+        if settings.SECURE_CROSS_ORIGIN_OPENER_POLICY:
+            security_headers.append(("Cross-Origin-Opener-Policy", settings.SECURE_CROSS_ORIGIN_OPENER_POLICY))
+        return headers, security_headers
+
+    def can_serve(
+        self,
+        query_string: str,
+        content_type: Optional[str],
+        content_length: Optional[int],
+        accept: Optional[str],
+        host: Optional[str],
+        origin: Optional[str],
+    ) -> bool:
+        """
+        Whether the request's headers are ones the lane answers exactly like Django.
+        """
+        if query_string or content_length is None or not 0 < content_length <= settings.DATA_UPLOAD_MAX_MEMORY_SIZE:
+            return False
+        media_type, _, parameters = (content_type or "").partition(";")
+        if media_type.strip().lower() != "application/json":
+            return False
+        if parameters and parameters.strip().lower().replace(" ", "") != "charset=utf-8":
+            return False
+        if accept is not None and (
+            ";" in accept or _DEFAULT_RENDERER_ACCEPTS.isdisjoint(value.strip() for value in accept.split(","))
+        ):
+            return False
+        if host is None:
+            return False
+        domain, _ = split_domain_port(host)
+        if not domain or not validate_host(domain, settings.ALLOWED_HOSTS):
+            return False
+        if origin:
+            try:
+                urlsplit(origin)
+            except ValueError:
+                return False
+        return True
+
+    def validate(self, body: bytes) -> Optional[Dict[str, Union[str, Dict[str, Union[int, float]]]]]:
+        """
+        Returns the request's validated data, or ``None`` if it is not a valid request.
+        """
+        try:
+            data = self.parser.parse(io.BytesIO(body))
+        except ParseError:
+            return None
+        validated_data, errors = DLSRequestSerializer.validate_data(data)
+        return None if errors else validated_data
+
+    def render(self, par_score: int, origin: Optional[str]) -> Tuple[Headers, bytes]:
+        """
+        Returns the headers and body of ``DLSScoreView``'s response for a par score.
+        """
+        body = self.renderer.render({
+            "par_score": par_score,
+            "revised_target": par_score + 1,
+            "messages": ["Target calculated successfully."]
+        })
+        headers = [*self.headers, ("Content-Length", str(len(body))), *self.security_headers]
+        if origin:
+            headers.append(("access-control-allow-origin", "*"))
+        return headers, body
+
+
+def _content_length(value: Optional[Union[str, bytes]]) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class FastLaneWSGI:
+    """
+    WSGI application answering calculations in the fast lane and passing everything else to ``application``.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self.lane = FastLane()
+
+    def __call__(self, environ, start_response):
+        lane = self.lane
+        if not (lane.enabled and environ.get("REQUEST_METHOD") == "POST" and environ.get("PATH_INFO") == lane.path):
+            return self.application(environ, start_response)
+
+        content_length = _content_length(environ.get("CONTENT_LENGTH"))
+        origin = environ.get("HTTP_ORIGIN")
+        if not lane.can_serve(
+            environ.get("QUERY_STRING", ""),
+            environ.get("CONTENT_TYPE"),
+            content_length,
+            environ.get("HTTP_ACCEPT"),
+            environ.get("HTTP_HOST"),
+            origin,
+        ):
+            return self.application(environ, start_response)
+
+        body = environ["wsgi.input"].read(content_length)
+        validated_data = lane.validate(body)
+        if validated_data is not None:
+            try:
+                par_score = dls_service.calculate(validated_data)
+            except Exception:
+                # Django answers with the error
+                pass
+            else:
+                headers, response_body = lane.render(par_score, origin)
+                start_response("200 OK", headers)
+                return [response_body]
+
+        environ["wsgi.input"] = io.BytesIO(body)
+        return self.application(environ, start_response)
+
+
+class FastLaneASGI:
+    """
+    ASGI application answering calculations in the fast lane and passing everything else to ``application``.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self.lane = FastLane()
+
+    async def __call__(self, scope, receive, send):
+        lane = self.lane
+        if not (
+            lane.enabled
+            and scope["type"] == "http"
+            and scope["method"] == "POST"
+            and scope["path"] == lane.path
+        ):
+            return await self.application(scope, receive, send)
+
+        headers = {}
+        for name, value in scope["headers"]:
+            headers.setdefault(name.decode("latin1").lower(), value.decode("latin1"))
+        content_length = _content_length(headers.get("content-length"))
+        origin = headers.get("origin")
+        if not lane.can_serve(
+            scope.get("query_string", b"").decode("latin1"),
+            headers.get("content-type"),
+            content_length,
+            headers.get("accept"),
+            headers.get("host"),
+            origin,
+        ):
+            return await self.application(scope, receive, send)
+
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+
+        validated_data = lane.validate(body) if len(body) == content_length else None
+        if validated_data is not None:
+            try:
+                par_score = await dls_service.acalculate(validated_data)
+            except Exception:
+                # Django answers with the error
+                pass
+            else:
+                response_headers, response_body = lane.render(par_score, origin)
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(name.encode("latin1"), value.encode("latin1")) for name, value in response_headers],
+                })
+                await send({"type": "http.response.body", "body": response_body})
+                return
+
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return await self.application(scope, replay, send)
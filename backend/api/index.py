@@ -3,6 +3,10 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_wsgi_application()
+django_application = get_wsgi_application()
+
+from api.fastlane import FastLaneWSGI
+
+application = FastLaneWSGI(django_application)
 
 app = application
@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+from django.core.management.base import BaseCommand, CommandError
+from calculators.table_provider import ACTIVE_VERSIONS_FILE, resource_tables
+
+
+class Command(BaseCommand):
+    help = (
+        "Activates a resource table version for a match type by updating active.json in DLS_RESOURCE_TABLE_DIR. "
+        "Running workers pick up the change on their next check."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("match_type", nargs="?")
+        parser.add_argument("version", nargs="?")
+        parser.add_argument("--list", action="store_true", help="List the loaded versions and the active ones")
+
+    def handle(self, *args, **options):
+        resource_tables.reload()
+        if options["list"]:
+            for match_type, versions in resource_tables.versions().items():
+                active = resource_tables.active_version(match_type)
+                listed = ", ".join(f"{version} (active)" if version == active else version for version in versions)
+                self.stdout.write(f"{match_type}: {listed}")
+            return
+
+        match_type, version = options["match_type"], options["version"]
+        if not match_type or not version:
+            raise CommandError("Give a match type and a version, or --list.")
+        directory = resource_tables.directory
+        if not directory:
+            raise CommandError("DLS_RESOURCE_TABLE_DIR is not set.")
+        if not resource_tables.has_version(match_type, version):
+            raise CommandError(f"Resource table version {version} for {match_type} does not exist.")
+
+        path = os.path.join(directory, ACTIVE_VERSIONS_FILE)
+        active = {}
+        if os.path.exists(path):
+            with open(path) as file:
+                active = json.load(file)
+        active[match_type] = version
+
+        # Written next to active.json and moved into place, so workers never read a partial file
+        with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False) as file:
+            json.dump(active, file, indent=2, sort_keys=True)
+        os.chmod(file.name, 0o644)
+        os.replace(file.name, path)
+
+        resource_tables.reload()
+        self.stdout.write(f"{match_type} now uses resource table {version}")
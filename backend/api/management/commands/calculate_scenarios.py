@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from django.core.management.base import BaseCommand, CommandError
+from api.pipeline import FORMATS, guess_format, init_worker, stream_results
+
+
+class Command(BaseCommand):
+    help = (
+        "Calculates DLS par scores for a CSV or JSONL file of scenarios. Records are streamed in chunks, "
+        "calculated in parallel worker processes and written in input order."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", help="Scenario file, or - for standard input")
+        parser.add_argument("-o", "--output", default="-", help="Results file, or - for standard output")
+        parser.add_argument("--input-format", choices=FORMATS, help="Defaults to the input file extension")
+        parser.add_argument("--output-format", choices=FORMATS, help="Defaults to the output file extension")
+        parser.add_argument("--chunk-size", type=int, default=10000, help="Records per chunk")
+        parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes; 1 disables the pool")
+
+    def handle(self, *args, **options):
+        input_format = options["input_format"] or guess_format(options["input"])
+        if input_format is None:
+            raise CommandError("Cannot tell the input format from the file name; use --input-format.")
+        output_format = options["output_format"] or guess_format(options["output"]) or input_format
+        if options["chunk_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--chunk-size and --workers must be positive.")
+
+        start = time.perf_counter()
+        rows = 0
+        with ExitStack() as stack:
+            source = sys.stdin if options["input"] == "-" else stack.enter_context(
+                open(options["input"], newline="", encoding="utf-8")
+            )
+            target = sys.stdout if options["output"] == "-" else stack.enter_context(
+                open(options["output"], "w", newline="", encoding="utf-8")
+            )
+            executor = None
+            if options["workers"] > 1:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=options["workers"], initializer=init_worker)
+                )
+
+            for chunk_rows, output in stream_results(
+                source,
+                input_format,
+                output_format,
+                chunk_size=options["chunk_size"],
+                executor=executor,
+                max_in_flight=2 * options["workers"],
+            ):
+                target.write(output)
+                rows += chunk_rows
+
+        elapsed = time.perf_counter() - start
+        self.stderr.write(f"{rows} rows in {elapsed:.2f} s ({rows / elapsed if elapsed else 0:,.0f} rows/s)")
@@ -0,0 +1,42 @@
+import threading
+from collections import defaultdict
+from typing import Dict, Union
+
+
+class LatencyCounters:
+    """
+    Thread-safe per-key call counts and latencies (in seconds) for monitoring.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = defaultdict(int)
+        self._totals: Dict[str, float] = defaultdict(float)
+        self._maxima: Dict[str, float] = defaultdict(float)
+
+    def record(self, key: str, seconds: float):
+        with self._lock:
+            self._counts[key] += 1
+            self._totals[key] += seconds
+            if seconds > self._maxima[key]:
+                self._maxima[key] = seconds
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
+            self._totals.clear()
+            self._maxima.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Returns the count and the mean and maximum latency, in milliseconds, per key.
+        """
+        with self._lock:
+            return {
+                key: {
+                    "count": count,
+                    "mean_ms": self._totals[key] / count * 1000,
+                    "max_ms": self._maxima[key] * 1000,
+                }
+                for key, count in sorted(self._counts.items())
+            }
@@ -0,0 +1,34 @@
+from django.middleware import clickjacking, common, security
+
+
+class InlineAsyncMiddlewareMixin:
+    """
+    Runs a ``MiddlewareMixin`` middleware's hooks inline on the event loop.
+
+    In async mode ``MiddlewareMixin`` calls ``process_request`` and
+    ``process_response`` through ``sync_to_async``, a hop to the single
+    thread-sensitive worker thread and back for each hook of each request.
+    The hooks of the middleware below only read the request and set
+    headers, so they are safe to call directly. Sync mode is unchanged.
+    """
+
+    async def __acall__(self, request):
+        response = None
+        if hasattr(self, "process_request"):
+            response = self.process_request(request)
+        response = response or await self.get_response(request)
+        if hasattr(self, "process_response"):
+            response = self.process_response(request, response)
+        return response
+
+
+class SecurityMiddleware(InlineAsyncMiddlewareMixin, security.SecurityMiddleware):
+    pass
+
+
+class CommonMiddleware(InlineAsyncMiddlewareMixin, common.CommonMiddleware):
+    pass
+
+
+class XFrameOptionsMiddleware(InlineAsyncMiddlewareMixin, clickjacking.XFrameOptionsMiddleware):
+    pass
@@ -0,0 +1,26 @@
+import codecs
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from .camel_case import underscoreize
+
+
+class ORJSONCamelCaseParser(JSONParser):
+    """
+    camelCase JSON parser decoding with orjson.
+
+    Produces the same snake_case data as ``CamelCaseJSONParser``.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            body = stream.read()
+            if codecs.lookup(encoding).name != 'utf-8':
+                body = body.decode(encoding)
+            return underscoreize(orjson.loads(body))
+        except (ValueError, orjson.JSONDecodeError) as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
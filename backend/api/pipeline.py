@@ -0,0 +1,197 @@
+"""
+Streaming calculation of scenario files.
+
+Every stage is a generator pulling from the one before it, so records are
+read, validated, calculated and written incrementally. Memory is bounded by
+the chunk size (times the number of chunks in flight when a process pool is
+used) rather than by the size of the file, and a slow writer holds back the
+reader instead of letting results pile up.
+
+CSV records are flat: ``scenario_type``, ``match_format``, an optional
+``table_version`` and one column per input, with empty cells for inputs the
+scenario does not use. JSONL records
+are request bodies of the calculation endpoint, in camelCase or snake_case.
+"""
+
+import csv
+import io
+import os
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import django
+import orjson
+from calculators.parallel import ordered_map
+from .camel_case import camelize, snake_keys, underscoreize
+from .serializers import DLSRequestSerializer
+from .services import dls_service
+
+
+FORMATS = ("csv", "jsonl")
+CSV_RESULT_COLUMNS = ["index", "status", "par_score", "revised_target", "error"]
+
+Record = Union[Dict, Exception]
+
+
+def guess_format(path: str) -> Optional[str]:
+    """
+    The file format implied by a file name, if any.
+    """
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    if extension == "ndjson":
+        return "jsonl"
+    return extension if extension in FORMATS else None
+
+
+def read_records(lines: Iterable[str], input_format: str) -> Iterator[Record]:
+    """
+    Lazily parses lines into request payloads.
+
+    Blank JSONL lines are skipped. A line that cannot be parsed yields its
+    error in place of a record, so the rest of the file is unaffected.
+    """
+    if input_format == "jsonl":
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield underscoreize(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                yield ValueError(f"JSON parse error - {e}")
+        return
+
+    rows = csv.reader(lines)
+    header = next(rows, None)
+    if header is None:
+        return
+    fields = [snake_keys[field.strip()] for field in header]
+    for row in rows:
+        if not row:
+            continue
+        values = dict(zip(fields, row))
+        record = {
+            "scenario_type": values.pop("scenario_type", None),
+            "match_format": values.pop("match_format", None),
+        }
+        table_version = values.pop("table_version", "")
+        if table_version != "":
+            record["table_version"] = table_version
+        record["inputs"] = {field: value for field, value in values.items() if value != ""}
+        yield record
+
+
+def chunked(records: Iterable[Record], chunk_size: int) -> Iterator[Tuple[int, List[Record]]]:
+    """
+    Groups records into lists of ``chunk_size``, each with the index of its first record.
+    """
+    records = iter(records)
+    start = 0
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def calculate_chunk(start: int, records: List[Record]) -> List[Dict]:
+    """
+    Validates and calculates a chunk of records.
+
+    Valid records are calculated in one vectorized pass per match format and
+    scenario. Results have the shape of the batch endpoint's results: an
+    invalid record gets the errors the API would return.
+    """
+    results: List[Dict] = []
+    valid_items, valid_results = [], []
+    for index, record in enumerate(records, start):
+        if isinstance(record, Exception):
+            results.append({"index": index, "status": "error", "message": str(record)})
+            continue
+        validated_data, errors = DLSRequestSerializer.validate_data(record)
+        if errors:
+            results.append({"index": index, "status": "error", "errors": errors})
+            continue
+        result = {"index": index, "status": "success"}
+        valid_items.append(validated_data)
+        valid_results.append(result)
+        results.append(result)
+
+    for result, outcome in zip(valid_results, dls_service.calculate_many(valid_items)):
+        if isinstance(outcome, Exception):
+            result["status"] = "error"
+            result["message"] = str(outcome)
+        else:
+            result["par_score"] = outcome
+            result["revised_target"] = outcome + 1
+
+    return results
+
+
+def format_results(results: List[Dict], output_format: str) -> str:
+    """
+    Formats results as JSONL (camelCase, like the API) or CSV rows.
+    """
+    if output_format == "jsonl":
+        return b"".join(orjson.dumps(camelize(result)) + b"\n" for result in results).decode()
+
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    for result in results:
+        error = orjson.dumps(result["errors"]).decode() if "errors" in result else result.get("message", "")
+        writer.writerow([
+            result["index"], result["status"], result.get("par_score", ""), result.get("revised_target", ""), error
+        ])
+    return output.getvalue()
+
+
+def process_chunk(task: Tuple[int, List[Record], str]) -> Tuple[int, str]:
+    """
+    Calculates and formats one chunk; runs in worker processes.
+
+    Returns:
+        The number of records and their formatted results
+    """
+    start, records, output_format = task
+    return len(records), format_results(calculate_chunk(start, records), output_format)
+
+
+def init_worker():
+    """
+    Sets up Django and loads the calculators once per worker process.
+    """
+    django.setup()
+    dls_service.warm_up()
+
+
+def stream_results(
+    lines: Iterable[str],
+    input_format: str,
+    output_format: str,
+    chunk_size: int = 10000,
+    executor: Optional[Executor] = None,
+    max_in_flight: int = 2,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Lazily calculates a scenario file, chunk by chunk, in input order.
+
+    Args:
+        lines: The input, e.g., an open file
+        input_format: 'csv' or 'jsonl'
+        output_format: 'csv' or 'jsonl'
+        chunk_size: Records calculated at once
+        executor: Optional process pool (initialized with ``init_worker``) to calculate chunks in
+        max_in_flight: Chunks submitted to the executor ahead of the consumer
+
+    Yields:
+        The number of records in each chunk and their formatted results;
+        CSV output starts with a header line
+    """
+    if output_format == "csv":
+        yield 0, ",".join(CSV_RESULT_COLUMNS) + "\n"
+
+    tasks = (
+        (start, records, output_format)
+        for start, records in chunked(read_records(lines, input_format), chunk_size)
+    )
+    yield from ordered_map(process_chunk, tasks, executor, max_in_flight=max_in_flight)
@@ -0,0 +1,71 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Tuple
+from rest_framework.response import Response
+
+
+class RenderedBodies:
+    """
+    LRU store of rendered response bodies and their content types.
+
+    Bounded so that bodies of data that is no longer served, such as
+    retired resource table versions, are eventually dropped.
+    """
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[bytes, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key: Hashable, render: Callable[[], Tuple[bytes, str]]) -> Tuple[bytes, str]:
+        """
+        Returns the stored body and content type for ``key``, rendering and storing them if there are none.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            entry = render()
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Bodies of static data, sized like the resource table payload cache
+rendered_bodies = RenderedBodies(max_size=32)
+
+
+class CachedRenderResponse(Response):
+    """
+    A Response for static data whose rendered body is reused across requests.
+
+    The body is rendered once per (cache key, renderer, media type) and kept
+    in ``rendered_bodies``, so ``cache_key`` must identify data that never
+    changes.
+    """
+
+    def __init__(self, data, cache_key: Hashable, **kwargs):
+        super().__init__(data, **kwargs)
+        self.cache_key = cache_key
+
+    @property
+    def rendered_content(self):
+        key = (self.cache_key, type(self.accepted_renderer), self.accepted_media_type)
+        body, content_type = rendered_bodies.get_or_render(key, self._render)
+        self['Content-Type'] = content_type
+        return body
+
+    def _render(self) -> Tuple[bytes, str]:
+        body = super().rendered_content
+        return body, self['Content-Type']
@@ -1,7 +1,11 @@
-from typing import Dict
+from typing import Dict, Optional, Tuple
+from django.conf import settings
 from rest_framework import serializers
+from rest_framework.fields import empty
+from rest_framework.serializers import as_serializer_error
+from calculators.table_provider import resource_tables
 from .enums import DLS_SCENARIO_CHOICES
-from .validators import SCENARIO_RULES
+from .validators import COMPILED_SCENARIO_RULES, ScenarioValidator
 
 
 class DLSRequestSerializer(serializers.Serializer):
@@ -13,39 +17,250 @@ class DLSRequestSerializer(serializers.Serializer):
     scenario_type = serializers.ChoiceField(choices=DLS_SCENARIO_CHOICES)
     match_format = serializers.ChoiceField(choices=["ODI", "T20", "T10"])
     inputs = serializers.DictField()
+    table_version = serializers.CharField(required=False)
 
-    def validate(self, data):
+    @classmethod
+    def _well_formed(cls, data) -> Optional[Dict]:
+        """
+        The request with only its declared fields if it can skip DRF's field
+        validation: a dict with a known scenario and match format, a dict of
+        inputs and, optionally, a non-blank table version. Otherwise ``None``.
+        """
+        if type(data) is not dict:
+            return None
         scenario = data.get("scenario_type")
-        inputs_data: Dict[str, str] = data.get("inputs", {})
-        rule = SCENARIO_RULES[scenario]
+        match_format = data.get("match_format")
+        inputs = data.get("inputs")
+        if not (
+            type(scenario) is str and scenario in cls._declared_fields["scenario_type"].choices
+            and type(match_format) is str and match_format in cls._declared_fields["match_format"].choices
+            and type(inputs) is dict
+        ):
+            return None
+
+        request = {"scenario_type": scenario, "match_format": match_format, "inputs": inputs}
+        if "table_version" in data:
+            table_version = data["table_version"]
+            if type(table_version) is not str or not table_version or table_version != table_version.strip():
+                return None
+            request["table_version"] = table_version
+        return request
+
+    @staticmethod
+    def _check_request(data: Dict) -> Optional[Dict]:
+        """
+        Checks the table version and, with the compiled scenario rules, the
+        inputs of a request whose fields are valid. Converts the inputs in place.
+
+        Returns:
+            The errors, if any
+        """
+        table_version = data.get("table_version")
+        if table_version is not None and not resource_tables.has_version(data["match_format"], table_version):
+            return {"table_version": [f"Unknown resource table version for {data['match_format']}."]}
+
+        # Required inputs, conversion of strings from JSON body to numbers and
+        # additional validations based on the scenario
+        inputs, errors = COMPILED_SCENARIO_RULES[data.get("scenario_type")](data.get("inputs", {}))
+        if errors:
+            return {"inputs": errors}
+
+        data["inputs"] = inputs
+        return None
+
+    @classmethod
+    def validate_data(cls, data) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Validates a request body outside of a view, e.g., a record of a scenario file.
+
+        Well-formed requests are checked with the compiled scenario rules
+        without instantiating the serializer.
+
+        Returns:
+            A tuple of the validated data and the errors, one of which is ``None``
+        """
+        request = cls._well_formed(data)
+        if request is None:
+            serializer = cls(data=data)
+            if serializer.is_valid():
+                return serializer.validated_data, None
+            return None, serializer.errors
+
+        errors = cls._check_request(request)
+        if errors:
+            return None, errors
+        return request, None
+
+    def run_validation(self, data=empty):
+        """
+        Validates well-formed requests with the compiled scenario rules.
+
+        Anything else, such as an unknown scenario or a missing field, goes
+        through DRF's field validation so its errors are unchanged.
+        """
+        request = self._well_formed(data)
+        if request is None:
+            return super().run_validation(data)
+
+        try:
+            return self.validate(request)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError(detail=as_serializer_error(exc))
+
+    def validate(self, data):
+        errors = self._check_request(data)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return data
+
+
+class DLSBatchRequestSerializer(serializers.ListSerializer):
+
+    """
+    Serializer for a batch of DLS request items.
+
+    Unlike ``DLSRequestSerializer(many=True)``, items are validated
+    independently: ``validated_data`` keeps the batch order and holds the
+    ``ValidationError`` of each invalid item in its place, so one bad
+    scenario does not reject the whole batch.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("child", DLSRequestSerializer())
+        kwargs.setdefault("allow_empty", False)
+        kwargs.setdefault("max_length", settings.DLS_BATCH_MAX_SIZE)
+        super().__init__(*args, **kwargs)
+
+    def run_child_validation(self, data):
+        try:
+            return super().run_child_validation(data)
+        except serializers.ValidationError as exc:
+            return exc
+
+
+class InterruptionSerializer(serializers.Serializer):
+
+    """
+    Serializer for one interruption of a match timeline.
+    """
+
+    innings = serializers.ChoiceField(choices=[1, 2])
+    overs_used = serializers.FloatField(min_value=0)
+    wickets_lost = serializers.IntegerField(min_value=0, max_value=9)
+    revised_overs = serializers.FloatField(min_value=0)
+
+
+class TimelineRequestSerializer(serializers.Serializer):
+
+    """
+    Serializer for a match timeline: the match and its interruptions, in match order.
+    """
 
-        # Validating missing fields in inputs for the requested scenario
-        missing = [input_field for input_field in rule.required_inputs if inputs_data.get(input_field) is None]
-        if missing:
+    match_format = serializers.ChoiceField(choices=["ODI", "T20", "T10"])
+    overs_available_to_team_1_at_start = serializers.FloatField(min_value=0)
+    runs_scored_by_team_1 = serializers.IntegerField(min_value=0)
+    overs_available_to_team_2_at_start = serializers.FloatField(min_value=0)
+    interruptions = InterruptionSerializer(many=True, max_length=100)
+    table_version = serializers.CharField(required=False)
+
+    def validate(self, data):
+        errors = ScenarioValidator.validate_second_innings_delayed_inputs(data)
+        table_version = data.get("table_version")
+        if table_version is not None and not resource_tables.has_version(data["match_format"], table_version):
+            errors["table_version"] = [f"Unknown resource table version for {data['match_format']}."]
+        if errors:
+            raise serializers.ValidationError(errors)
+        return data
+
+
+class LiveSessionSerializer(serializers.Serializer):
+
+    """
+    Serializer for starting a live chase session.
+    """
+
+    match_format = serializers.ChoiceField(choices=["ODI", "T20", "T10"])
+    overs_available_to_team_1_at_start = serializers.FloatField(min_value=0)
+    runs_scored_by_team_1 = serializers.IntegerField(min_value=0)
+    overs_available_to_team_2_at_start = serializers.FloatField(min_value=0)
+
+    def validate(self, data):
+        errors = {}
+        ScenarioValidator._validate_greater(
+            data, errors,
+            "overs_available_to_team_1_at_start",
+            "overs_available_to_team_2_at_start",
+            strict=False
+        )
+        # Team 1's resources are the divisor of every par score
+        if data["overs_available_to_team_1_at_start"] <= 0:
+            errors["overs_available_to_team_1_at_start"] = ["Must be greater than 0."]
+        if errors:
+            raise serializers.ValidationError(errors)
+        return data
+
+
+class LiveEventSerializer(serializers.Serializer):
+
+    """
+    Serializer for a scoring event in a live chase session.
+
+    ``ball`` records a legal delivery (``wicket`` marks a wicket on it),
+    ``wicket`` records a wicket without a legal delivery, and ``state`` sets
+    ``overs_used`` and/or ``wickets_lost`` directly.
+    """
+
+    event = serializers.ChoiceField(choices=["ball", "wicket", "state"])
+    wicket = serializers.BooleanField(required=False, default=False)
+    overs_used = serializers.FloatField(required=False, min_value=0)
+    wickets_lost = serializers.IntegerField(required=False, min_value=0, max_value=9)
+
+    def validate(self, data):
+        if data["event"] == "state" and "overs_used" not in data and "wickets_lost" not in data:
+            raise serializers.ValidationError("A state event requires overs_used or wickets_lost.")
+        return data
+
+
+class ParCurveRequestSerializer(serializers.Serializer):
+
+    """
+    Serializer for a par-curve request.
+
+    The interruption fields are optional but must be given together.
+    """
+
+    interruption_fields = [
+        "overs_used_by_team_2_during_interruption",
+        "wickets_lost_by_team_2_during_interruption",
+        "revised_overs_to_team_2_after_resumption",
+    ]
+
+    match_format = serializers.ChoiceField(choices=["ODI", "T20", "T10"])
+    overs_available_to_team_1_at_start = serializers.FloatField(min_value=0)
+    runs_scored_by_team_1 = serializers.IntegerField(min_value=0)
+    overs_available_to_team_2_at_start = serializers.FloatField(min_value=0)
+    overs_used_by_team_2_during_interruption = serializers.FloatField(required=False, min_value=0)
+    wickets_lost_by_team_2_during_interruption = serializers.IntegerField(required=False, min_value=0, max_value=9)
+    revised_overs_to_team_2_after_resumption = serializers.FloatField(required=False, min_value=0)
+    encoding = serializers.ChoiceField(choices=["json", "base64"], default="json")
+    table_version = serializers.CharField(required=False)
+
+    def validate(self, data):
+        given = [field for field in self.interruption_fields if field in data]
+        if given and len(given) != len(self.interruption_fields):
             raise serializers.ValidationError({
-                "inputs": {field: ["This field is required."] for field in missing}
+                field: ["This field is required with an interruption."]
+                for field in self.interruption_fields if field not in data
             })
 
-        # converting strings from JSON body to numbers
-        valid_inputs = {}
-        for key, value in inputs_data.items():
-            try:
-                if "wickets" in key or "runs" in key:
-                    valid_inputs[key] = int(float(value))
-                else:
-                    valid_inputs[key] = float(value)
-            except (ValueError, TypeError):
-                raise serializers.ValidationError({
-                    "inputs": {key: ["Must be a number."]}
-                })
-
-        # Updating inputs_data with converted values for the validator to use
-        inputs_data.update(valid_inputs)
-        data['inputs'] = inputs_data
-
-        # Additional validations based on the scenario
-        errors = rule.validator(inputs_data)
+        if given:
+            errors = ScenarioValidator.validate_second_innings_interrupted_inputs(data)
+        else:
+            errors = ScenarioValidator.validate_second_innings_delayed_inputs(data)
+        table_version = data.get("table_version")
+        if table_version is not None and not resource_tables.has_version(data["match_format"], table_version):
+            errors["table_version"] = [f"Unknown resource table version for {data['match_format']}."]
         if errors:
-            raise serializers.ValidationError({"inputs": errors})
+            raise serializers.ValidationError(errors)
 
         return data
@@ -1,27 +1,301 @@
+import hashlib
+import json
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from weakref import WeakKeyDictionary
+import numpy as np
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from .batcher import build_micro_batcher
+from .cache import result_cache, result_cache_key
 from .enums import DLSScenarioEnum
+from .metrics import LatencyCounters
+from .singleflight import SingleFlight
+from .validators import SCENARIO_RULES
 from calculators.dls_calculator import DLSCalculator
+from calculators.live_tracker import LiveParTracker
+from calculators.resource_table import ResourceTable
+from calculators.table_provider import resource_tables
 from rest_framework.exceptions import ValidationError
-from typing import Dict, Callable, Union
+from typing import Dict, Callable, List, Optional, Tuple, Union
 
 
 class DLSService:
+    """
+    Long-lived, thread-safe entry point to the DLS calculators.
+
+    One calculator is built per resource table and its scenario methods are
+    bound on first use, so a request costs one lookup in the dispatch table.
+    Requests use the active table version of their match format unless they
+    pin one with ``table_version``.
+    """
+
+    scenario_map_getters: Dict[str, str] = {
+        DLSScenarioEnum.FIRST_INNINGS_CURTAILED.value: "calculate_par_score_first_innings_cut_short",
+        DLSScenarioEnum.FIRST_INNINGS_INTERRUPTED.value: "calculate_par_score_first_innings_interrupted",
+        DLSScenarioEnum.SECOND_INNINGS_CURTAILED.value: "calculate_par_score_second_innings_cut_short",
+        DLSScenarioEnum.SECOND_INNINGS_DELAYED.value: "calculate_par_score_second_innings_delayed",
+        DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value: "calculate_par_score_second_innings_interrupted",
+    }
 
     def __init__(self):
-        self.scenario_map_getters: Dict[str, str] = {
-            DLSScenarioEnum.FIRST_INNINGS_CURTAILED.value: "calculate_par_score_first_innings_cut_short",
-            DLSScenarioEnum.FIRST_INNINGS_INTERRUPTED.value: "calculate_par_score_first_innings_interrupted",
-            DLSScenarioEnum.SECOND_INNINGS_CURTAILED.value: "calculate_par_score_second_innings_cut_short",
-            DLSScenarioEnum.SECOND_INNINGS_DELAYED.value: "calculate_par_score_second_innings_delayed",
-            DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value: "calculate_par_score_second_innings_interrupted",
-        }
+        self.latency = LatencyCounters()
+        self.batcher = build_micro_batcher(self.calculate_many)
+        self.flights = SingleFlight()
+
+    def dispatch(self, match_format: str, scenario: str, table_version: Optional[str] = None) -> Callable:
+        """
+        The calculator method of a scenario, bound to the requested table
+        version of a match format, or to its active version.
+
+        Raises:
+            KeyError: If there is no such table version.
+        """
+        table = resource_tables.get(match_format, table_version)
+        # The bound methods reference the table, so they are kept on the
+        # table itself: a table that is no longer loaded is dropped with its
+        # methods once nothing else references it
+        methods = table.memo.get(DLSService)
+        if methods is None:
+            calculator = DLSCalculator.from_table(table)
+            methods = table.memo.setdefault(DLSService, {
+                scenario_name: getattr(calculator, method_name)
+                for scenario_name, method_name in self.scenario_map_getters.items()
+            })
+        return methods[scenario]
+
+    def warm_up(self):
+        """
+        Builds the calculators and the ratio index of every loaded table, so
+        the first requests do not pay for them.
+
+        The ``resource_used`` index is left to be built on first use: it is
+        a cube per table and would add most of the warm-up's cost to every
+        cold start, while only the interruption and curtailment scenarios
+        read it.
+        """
+        for (match_format, table_version), table in resource_tables.tables().items():
+            self.dispatch(match_format, next(iter(self.scenario_map_getters)), table_version)
+            table.resource_ratio
 
     def calculate(self, validated_data: Dict[str, Union[str, Dict[str, Union[int, float]]]]) -> int:
-        scenario = validated_data["scenario_type"]
-        match_format = validated_data["match_format"]
-        inputs: Dict[str, Union[int, float]] = validated_data["inputs"]
+        """
+        Calculates the par score for a validated request, memoized in the result cache.
+
+        Identical concurrent requests (same canonical key) share one
+        calculation. With micro-batching enabled, a cache miss joins the
+        current batch of concurrent requests instead of being calculated on
+        its own.
+        """
+        start = time.perf_counter()
+        try:
+            key = result_cache_key(validated_data)
+            return self.flights.do(key, lambda: self._cached_calculate(key, validated_data))
+        finally:
+            self.latency.record(validated_data["scenario_type"], time.perf_counter() - start)
+
+    async def acalculate(self, validated_data: Dict[str, Union[str, Dict[str, Union[int, float]]]]) -> int:
+        """
+        ``calculate`` for coroutines.
+
+        A calculation takes microseconds, so when the result cache is in
+        process it runs inline on the event loop rather than paying for a hop
+        to a worker thread and back. With a shared result cache, whose
+        lookups block on the network, or with micro-batching enabled,
+        requests wait in a worker thread instead, and identical concurrent
+        requests share one wait.
+        """
+        start = time.perf_counter()
+        try:
+            key = result_cache_key(validated_data)
+            if result_cache.in_process and not self.batcher.enabled:
+                return self._cached_calculate(key, validated_data)
+            return await self.flights.ado(
+                key,
+                lambda: sync_to_async(self._cached_calculate, thread_sensitive=False)(key, validated_data)
+            )
+        finally:
+            self.latency.record(validated_data["scenario_type"], time.perf_counter() - start)
+
+    def _cached_calculate(self, key: Tuple, validated_data: Dict[str, Union[str, Dict[str, Union[int, float]]]]) -> int:
+        compute = self.batcher.submit if self.batcher.enabled else self._calculate
+        return result_cache.get_or_compute(key, lambda: compute(validated_data))
+
+    def _calculate(self, validated_data: Dict[str, Union[str, Dict[str, Union[int, float]]]]) -> int:
+        calculator_method = self.dispatch(
+            validated_data["match_format"], validated_data["scenario_type"], validated_data.get("table_version")
+        )
+        return round(calculator_method(**validated_data["inputs"]))
+
+    def calculate_many(
+        self,
+        validated_items: List[Dict[str, Union[str, Dict[str, Union[int, float]]]]]
+    ) -> List[Union[int, Exception]]:
+        """
+        Calculates par scores for many validated requests.
+
+        Items are grouped by (match format, table version, scenario) and each group is
+        evaluated in one pass of the calculator's vectorized method. Results
+        are returned in input order; an item whose calculation fails gets its
+        exception in place of a score so the rest of the batch is unaffected.
+        """
+        groups: Dict[Tuple[str, Optional[str], str], List[int]] = defaultdict(list)
+        for index, item in enumerate(validated_items):
+            groups[(item["match_format"], item.get("table_version"), item["scenario_type"])].append(index)
+
+        results: List[Union[int, Exception]] = [None] * len(validated_items)
+        for (match_format, table_version, scenario), indices in groups.items():
+            group_items = [validated_items[index] for index in indices]
+            calculator_method = self.dispatch(match_format, scenario, table_version)
+            for index, result in zip(indices, self._calculate_group(calculator_method, scenario, group_items)):
+                results[index] = result
+
+        return results
+
+    def _calculate_group(
+        self,
+        calculator_method: Callable,
+        scenario: str,
+        group_items: List[Dict[str, Union[str, Dict[str, Union[int, float]]]]]
+    ) -> List[Union[int, Exception]]:
+        """
+        Calculates one (match format, table version, scenario) group with the
+        vectorized form of the group's calculator method.
+
+        Items the vectorized pass cannot answer (a failure anywhere in the
+        group, or a non-finite score) are recalculated one by one so each
+        gets the same result or error as the single-scenario endpoint.
+        """
+        columns = {
+            input_field: np.array([item["inputs"][input_field] for item in group_items])
+            for input_field in SCENARIO_RULES[scenario].required_inputs
+        }
+        try:
+            vectorized_method = getattr(calculator_method.__self__, f"{calculator_method.__name__}_many")
+            par_scores = np.round(vectorized_method(**columns)).tolist()
+        except Exception:
+            par_scores = [math.nan] * len(group_items)
+
+        results: List[Union[int, Exception]] = []
+        for item, par_score in zip(group_items, par_scores):
+            if math.isfinite(par_score):
+                results.append(int(par_score))
+                continue
+            try:
+                results.append(round(calculator_method(**item["inputs"])))
+            except Exception as e:
+                results.append(e)
+
+        return results
+
+
+# Payloads by resource table, dropped with their table
+_resource_table_payloads: "WeakKeyDictionary[ResourceTable, Tuple[Dict[str, list], str]]" = WeakKeyDictionary()
+_resource_table_payloads_lock = threading.Lock()
+
+
+def get_resource_table_payload(match_format: str, table_version: Optional[str] = None) -> Tuple[Dict[str, list], str]:
+    """
+    Returns the resource table response data for a match format, at the
+    given table version or the active one, and its strong ETag.
+
+    Raises:
+        KeyError: If there is no such table.
+    """
+    table = resource_tables.get(match_format, table_version)
+    payload = _resource_table_payloads.get(table)
+    if payload is None:
+        with _resource_table_payloads_lock:
+            payload = _resource_table_payloads.get(table)
+            if payload is None:
+                payload = _resource_table_payloads[table] = _build_resource_table_payload(table)
+    return payload
+
+
+def _build_resource_table_payload(table: ResourceTable) -> Tuple[Dict[str, list], str]:
+    # Tables never change once loaded, so both are built once per table
+    rows = np.column_stack([table.balls, table.resources.T])[::-1]
+    data = {
+        "columns": list(table.columns),
+        "data": rows.tolist(),
+    }
+    digest = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+    return data, f'"{digest[:32]}"'
+
+
+class LiveSession:
+    """
+    A live chase held by ``LiveSessionStore``: a tracker plus a lock that
+    serializes updates from concurrent scorer requests.
+    """
+
+    def __init__(self, session_id: str, tracker: LiveParTracker):
+        self.session_id = session_id
+        self.tracker = tracker
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Union[str, int, float]]:
+        par_score = round(self.tracker.par_score)
+        return {
+            "session_id": self.session_id,
+            "match_format": self.tracker.match_type,
+            "overs_used": self.tracker.overs_used,
+            "balls_used": self.tracker.balls_used,
+            "wickets_lost": self.tracker.wickets_lost,
+            "par_score": par_score,
+            "revised_target": par_score + 1,
+        }
+
+
+class LiveSessionStore:
+    """
+    In-process store of live chase sessions.
+
+    Sessions live in the memory of the worker that created them, so
+    deployments with several workers need sticky routing per session. The
+    store is bounded: idle sessions expire after ``DLS_LIVE_SESSION_TTL``
+    seconds and the least recently used session is dropped once
+    ``DLS_LIVE_SESSION_MAX_COUNT`` is reached.
+    """
+
+    def __init__(self):
+        self._sessions: "OrderedDict[str, LiveSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, tracker: LiveParTracker) -> LiveSession:
+        session = LiveSession(uuid.uuid4().hex, tracker)
+        with self._lock:
+            self._expire()
+            while len(self._sessions) >= settings.DLS_LIVE_SESSION_MAX_COUNT:
+                self._sessions.popitem(last=False)
+            self._sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id: str) -> Optional[LiveSession]:
+        with self._lock:
+            self._expire()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_used = time.monotonic()
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def _expire(self):
+        cutoff = time.monotonic() - settings.DLS_LIVE_SESSION_TTL
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.last_used >= cutoff:
+                break
+            self._sessions.popitem(last=False)
 
-        calculator = DLSCalculator(match_format)
-        calculator_method_name = self.scenario_map_getters[scenario]
-        calculator_method: Callable = getattr(calculator, calculator_method_name)
 
-        return round(calculator_method(**inputs))
+dls_service = DLSService()
+live_sessions = LiveSessionStore()
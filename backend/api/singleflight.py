@@ -0,0 +1,116 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, Union
+
+
+class _Call:
+    """
+    An in-flight call that identical concurrent calls wait for.
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls.
+
+    While a call for a key is running, further calls for the same key do not
+    run their function; they wait for the running call and share its result
+    or its exception. Nothing is kept once the call finishes, so unlike a
+    cache this never serves a stale result.
+
+    ``do`` serves threads (the WSGI server's worker threads) and ``ado``
+    coroutines on an event loop (the ASGI server); each has its own set of
+    in-flight calls.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self.clear()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Returns ``function()``, or the result of an identical call already in flight.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._collapsed += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns ``await function()``, or the result of an identical call already in flight on this loop.
+
+        The call runs as its own task and every caller awaits it shielded, so
+        a caller that is cancelled (e.g. a client that disconnects) does not
+        cancel the call for the others.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        task = self._async_calls.get(flight_key)
+        with self._lock:
+            if task is None:
+                self._executed += 1
+            else:
+                self._collapsed += 1
+
+        if task is None:
+            task = loop.create_task(function())
+            self._async_calls[flight_key] = task
+            task.add_done_callback(lambda done: self._finish_async(flight_key, done))
+        return await asyncio.shield(task)
+
+    def _finish_async(self, flight_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task):
+        del self._async_calls[flight_key]
+        # Mark the exception as retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def clear(self):
+        with self._lock:
+            self._executed = 0
+            self._collapsed = 0
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Returns the calls that ran, the calls collapsed into a running one, and the collapsed share.
+        """
+        with self._lock:
+            executed, collapsed = self._executed, self._collapsed
+            in_flight = len(self._calls) + len(self._async_calls)
+        calls = executed + collapsed
+        return {
+            "executed": executed,
+            "collapsed": collapsed,
+            "collapsed_ratio": collapsed / calls if calls else 0.0,
+            "in_flight": in_flight,
+        }
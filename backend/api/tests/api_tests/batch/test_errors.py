@@ -0,0 +1,110 @@
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from api.enums import DLSScenarioEnum
+
+
+class BatchErrorTests(APITestCase):
+
+    def setUp(self):
+        self.url = reverse("api:calculate_dls_score_batch")
+        self.valid_item = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+            "match_format": "T20",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 20.0,
+                "runs_scored_by_team_1": 180,
+                "overs_available_to_team_2_at_start": 15.0
+            }
+        }
+
+    def test_invalid_item_does_not_fail_batch(self):
+        """
+        Validation errors are reported per item while valid items still succeed.
+        """
+        invalid_item = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+            "match_format": "T20",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 20.0,
+                "overs_available_to_team_2_at_start": 15.0
+            }
+        }
+
+        response = self.client.post(self.url, [self.valid_item, invalid_item], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['succeeded'], 1)
+        self.assertEqual(response.data['failed'], 1)
+        self.assertEqual(response.data['results'][0]['status'], "success")
+        self.assertEqual(response.data['results'][1]['status'], "error")
+        self.assertIn('runs_scored_by_team_1', response.data['results'][1]['errors']['inputs'])
+
+    def test_invalid_scenario_type_item(self):
+        """
+        An unknown scenario type is reported against its own item.
+        """
+        invalid_item = dict(self.valid_item, scenario_type="InvalidScenario")
+
+        response = self.client.post(self.url, [invalid_item, self.valid_item], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('scenario_type', response.data['results'][0]['errors'])
+        self.assertEqual(response.data['results'][1]['status'], "success")
+
+    def test_calculation_error_is_reported_per_item(self):
+        """
+        A failure during calculation is reported with the single endpoint's error message.
+        """
+        invalid_item = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_CURTAILED.value,
+            "match_format": "T20",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 20.0,
+                "runs_scored_by_team_1": 180,
+                "overs_available_to_team_2_at_start": 20.0,
+                "overs_used_by_team_2_during_curtailed": 10.0,
+                "wickets_lost_by_team_2_during_curtailed": 12
+            }
+        }
+
+        valid_item = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_CURTAILED.value,
+            "match_format": "T20",
+            "inputs": dict(invalid_item["inputs"], wickets_lost_by_team_2_during_curtailed=2)
+        }
+
+        response = self.client.post(self.url, [invalid_item, valid_item, self.valid_item], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['status'], "error")
+        self.assertIn('message', response.data['results'][0])
+        self.assertEqual(response.data['results'][1]['status'], "success")
+        self.assertEqual(response.data['results'][2]['status'], "success")
+
+    def test_body_must_be_a_list(self):
+        """
+        Ensure 400 Bad Request when the body is not a list of scenarios.
+        """
+        response = self.client.post(self.url, self.valid_item, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('non_field_errors', response.data)
+
+    def test_empty_batch(self):
+        """
+        Ensure 400 Bad Request for an empty batch.
+        """
+        response = self.client.post(self.url, [], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(DLS_BATCH_MAX_SIZE=2)
+    def test_batch_too_large(self):
+        """
+        Ensure 400 Bad Request when the batch exceeds the configured maximum size.
+        """
+        response = self.client.post(self.url, [self.valid_item] * 3, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,79 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from api.enums import DLSScenarioEnum
+
+
+class BatchSuccessTests(APITestCase):
+
+    def setUp(self):
+        self.url = reverse("api:calculate_dls_score_batch")
+        self.single_url = reverse("api:calculate_dls_score")
+        self.items = [
+            {
+                "scenario_type": DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value,
+                "match_format": "T20",
+                "inputs": {
+                    "overs_available_to_team_1_at_start": 20.0,
+                    "runs_scored_by_team_1": 230,
+                    "overs_available_to_team_2_at_start": 20.0,
+                    "overs_used_by_team_2_during_interruption": 5.0,
+                    "wickets_lost_by_team_2_during_interruption": 4,
+                    "revised_overs_to_team_2_after_resumption": 7
+                }
+            },
+            {
+                "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+                "match_format": "ODI",
+                "inputs": {
+                    "overs_available_to_team_1_at_start": 50.0,
+                    "runs_scored_by_team_1": 280,
+                    "overs_available_to_team_2_at_start": 40.0
+                }
+            },
+            {
+                "scenario_type": DLSScenarioEnum.FIRST_INNINGS_CURTAILED.value,
+                "match_format": "T20",
+                "inputs": {
+                    "overs_available_to_team_1_at_start": 20.0,
+                    "runs_scored_by_team_1": 150,
+                    "wickets_lost_by_team_1_during_curtailed": 2,
+                    "overs_used_by_team_1_during_curtailed": 15.0,
+                    "overs_available_to_team_2_at_start": 15.0
+                }
+            },
+        ]
+
+    def test_batch_matches_single_requests(self):
+        """
+        Each batch result equals the result of posting the item on its own.
+        """
+        response = self.client.post(self.url, self.items, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(response.data['succeeded'], 3)
+        self.assertEqual(response.data['failed'], 0)
+
+        for index, item in enumerate(self.items):
+            single = self.client.post(self.single_url, item, format='json')
+            result = response.data['results'][index]
+            self.assertEqual(result['index'], index)
+            self.assertEqual(result['status'], "success")
+            self.assertEqual(result['par_score'], single.data['par_score'])
+            self.assertEqual(result['revised_target'], single.data['revised_target'])
+
+    def test_batch_keeps_request_order(self):
+        """
+        Results follow request order even when scenarios are grouped for calculation.
+        """
+        items = self.items * 4
+        response = self.client.post(self.url, items, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([result['index'] for result in response.data['results']], list(range(12)))
+        self.assertEqual(
+            [result['par_score'] for result in response.data['results'][:3]],
+            [result['par_score'] for result in response.data['results'][9:]]
+        )
+        self.assertEqual(response.data['results'][0]['par_score'], 106)
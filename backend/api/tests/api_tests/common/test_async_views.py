@@ -0,0 +1,182 @@
+import asyncio
+from unittest.mock import patch
+import orjson
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient, SimpleTestCase, override_settings
+from django.urls import path, reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api.async_views import AsyncDLSScoreView, AsyncHealthCheckView, AsyncResourceTableView
+from api.cache import DjangoCacheBackend, ResultCache, result_cache
+from api.enums import DLSScenarioEnum
+from api.services import DLSService
+
+
+def interrupted_request(**inputs):
+    return {
+        "scenarioType": DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value,
+        "matchFormat": "T20",
+        "inputs": {
+            "oversAvailableToTeam1AtStart": 20.0,
+            "runsScoredByTeam1": 180,
+            "oversAvailableToTeam2AtStart": 20.0,
+            "oversUsedByTeam2DuringInterruption": 12.3,
+            "wicketsLostByTeam2DuringInterruption": 4,
+            "revisedOversToTeam2AfterResumption": 16.0,
+            **inputs,
+        },
+    }
+
+
+# Serves the async views at the same paths when used as ROOT_URLCONF
+urlpatterns = [
+    path("calculate-dls-score/", AsyncDLSScoreView.as_view()),
+    path("resource-table/", AsyncResourceTableView.as_view()),
+    path("health-check/", AsyncHealthCheckView.as_view()),
+]
+
+
+class AsyncViewParityTests(APITestCase):
+    """
+    The async views, served through the ASGI handler, answer exactly like the
+    DRF views they replace.
+    """
+
+    compared_headers = ("Content-Type", "Allow", "Vary", "ETag", "Cache-Control", "X-Frame-Options")
+
+    def setUp(self):
+        self.async_client = AsyncClient()
+        result_cache.clear()
+
+    def async_request(self, method, *args, **kwargs):
+        with override_settings(ROOT_URLCONF=__name__):
+            return async_to_sync(getattr(self.async_client, method))(*args, **kwargs)
+
+    def assertSameResponse(self, response, async_response):
+        self.assertEqual(async_response.status_code, response.status_code)
+        self.assertEqual(async_response.content, response.content)
+        for header in self.compared_headers:
+            self.assertEqual(async_response.get(header), response.get(header), header)
+
+    def post_both(self, body, content_type="application/json", **headers):
+        url = reverse("api:calculate_dls_score")
+        response = self.client.post(url, data=body, content_type=content_type, headers=headers)
+        return response, self.async_request("post", url, data=body, content_type=content_type, headers=headers)
+
+    def get_both(self, url, **headers):
+        response = self.client.get(url, headers=headers)
+        return response, self.async_request("get", url, headers=headers)
+
+    def test_calculation(self):
+        response, async_response = self.post_both(orjson.dumps(interrupted_request()))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertSameResponse(response, async_response)
+
+    def test_errors(self):
+        bodies = [
+            orjson.dumps(interrupted_request(wicketsLostByTeam2DuringInterruption=12)),
+            orjson.dumps(interrupted_request(oversUsedByTeam2DuringInterruption=25.0)),
+            orjson.dumps({**interrupted_request(), "scenarioType": "unknown"}),
+            orjson.dumps({**interrupted_request(), "tableVersion": "T20-1999"}),
+            orjson.dumps([interrupted_request()]),
+            b'{"scenarioType": ',
+            b"",
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                response, async_response = self.post_both(body)
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertSameResponse(response, async_response)
+
+    def test_calculation_error(self):
+        with patch.object(DLSService, "_calculate", side_effect=ValueError("calculator unavailable")):
+            response, async_response = self.post_both(orjson.dumps(interrupted_request()))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertSameResponse(response, async_response)
+
+    def test_content_negotiation(self):
+        for accept, expected_status in (
+            ("text/html", status.HTTP_406_NOT_ACCEPTABLE),
+            ("application/json; indent=4", status.HTTP_200_OK),
+            ("text/html, application/*;q=0.8", status.HTTP_200_OK),
+        ):
+            with self.subTest(accept=accept):
+                response, async_response = self.post_both(orjson.dumps(interrupted_request()), accept=accept)
+
+                self.assertEqual(response.status_code, expected_status)
+                self.assertSameResponse(response, async_response)
+
+        for accept in ("text/html", "application/json; indent=4"):
+            with self.subTest(accept=accept):
+                response, async_response = self.get_both(reverse("api:resource_table"), accept=accept)
+
+                self.assertSameResponse(response, async_response)
+
+    def test_unsupported_media_type(self):
+        response, async_response = self.post_both(b"scenarioType=unknown", content_type="text/plain")
+
+        self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        self.assertSameResponse(response, async_response)
+
+    def test_resource_table(self):
+        url = reverse("api:resource_table")
+        for query in ("", "?match_format=ODI", "?match_format=T20&version=T20", "?match_format=XYZ", "?version=none"):
+            with self.subTest(query=query):
+                response, async_response = self.get_both(url + query)
+
+                self.assertSameResponse(response, async_response)
+
+    def test_resource_table_not_modified(self):
+        url = reverse("api:resource_table")
+        etag = self.client.get(url)["ETag"]
+
+        response, async_response = self.get_both(url, if_none_match=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertSameResponse(response, async_response)
+
+    def test_health_check(self):
+        response, async_response = self.get_both(reverse("api:health_check"))
+
+        self.assertSameResponse(response, async_response)
+
+
+class AsyncCalculationTests(SimpleTestCase):
+
+    validated_data = {
+        "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+        "match_format": "T20",
+        "inputs": {
+            "overs_available_to_team_1_at_start": 20.0,
+            "runs_scored_by_team_1": 180,
+            "overs_available_to_team_2_at_start": 14.0,
+        },
+    }
+
+    def test_calculates_on_the_event_loop(self):
+        service = DLSService()
+        validated_data = self.validated_data
+
+        with patch("api.services.sync_to_async") as sync_to_async:
+            par_score = asyncio.run(service.acalculate(validated_data))
+
+        self.assertEqual(par_score, service._calculate(validated_data))
+        sync_to_async.assert_not_called()
+
+    @override_settings(CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "shared": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    })
+    def test_shared_cache_is_used_from_a_worker_thread(self):
+        service = DLSService()
+        validated_data = self.validated_data
+
+        with patch("api.services.result_cache", ResultCache(DjangoCacheBackend(alias="shared"))):
+            with patch("api.services.sync_to_async", wraps=sync_to_async) as hop:
+                par_score = asyncio.run(service.acalculate(validated_data))
+
+        self.assertEqual(par_score, service._calculate(validated_data))
+        hop.assert_called_once()
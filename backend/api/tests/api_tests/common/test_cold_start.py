@@ -0,0 +1,13 @@
+from django.test import SimpleTestCase
+from benchmarks.cold_start import measure_cold_start
+
+
+class ColdStartTests(SimpleTestCase):
+
+    def test_wsgi_import_does_not_load_pandas(self):
+        """
+        Cold starts of the serverless entry point must not import pandas.
+        """
+        result = measure_cold_start()
+
+        self.assertFalse(result["pandas"])
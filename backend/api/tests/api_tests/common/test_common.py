@@ -37,7 +37,7 @@ class CommonAPITests(APITestCase):
         self.assertIn("columns", response.data)
         self.assertIn("data", response.data)
 
-    @patch('api.views.DLSService.calculate')
+    @patch('api.services.DLSService.calculate')
     def test_calculate_dls_score_generic_exception(self, mock_calculate):
         """
         Ensure API returns a 400 error on a generic, unexpected exception during calculation.
@@ -0,0 +1,68 @@
+from django.test import SimpleTestCase
+from rest_framework import serializers
+from api.serializers import DLSRequestSerializer
+from api.validators import COMPILED_SCENARIO_RULES, SCENARIO_RULES
+
+
+VALID_INPUTS = {
+    "overs_available_to_team_1_at_start": "50",
+    "runs_scored_by_team_1": 250.7,
+    "overs_available_to_team_2_at_start": 50.0,
+    "overs_used_by_team_2_during_interruption": 20.3,
+    "wickets_lost_by_team_2_during_interruption": "3",
+    "revised_overs_to_team_2_after_resumption": 40,
+}
+
+
+class CompiledValidationTests(SimpleTestCase):
+    """
+    The compiled fast path must give the same result as DRF's field validation.
+    """
+
+    def validate(self, data, fast):
+        serializer = DLSRequestSerializer(data=data)
+        try:
+            if fast:
+                return serializer.run_validation(data)
+            return serializers.Serializer.run_validation(serializer, data)
+        except serializers.ValidationError as exc:
+            return exc.detail
+
+    def assert_same_result(self, inputs, scenario="SecondInningsInterrupted"):
+        data = {"scenario_type": scenario, "match_format": "ODI", "inputs": inputs}
+        fast = self.validate(data, fast=True)
+        self.assertEqual(fast, self.validate(data, fast=False))
+        return fast
+
+    def test_valid_inputs(self):
+        result = self.assert_same_result(dict(VALID_INPUTS, extra_runs_value="4.9"))
+        self.assertEqual(result["inputs"]["runs_scored_by_team_1"], 250)
+        self.assertEqual(result["inputs"]["overs_available_to_team_1_at_start"], 50.0)
+        self.assertEqual(result["inputs"]["extra_runs_value"], 4)
+
+    def test_missing_inputs(self):
+        inputs = dict(VALID_INPUTS, runs_scored_by_team_1=None)
+        del inputs["revised_overs_to_team_2_after_resumption"]
+        result = self.assert_same_result(inputs)
+        self.assertEqual(set(result["inputs"]), {"runs_scored_by_team_1", "revised_overs_to_team_2_after_resumption"})
+
+    def test_non_numeric_inputs(self):
+        for value in ["ten", [1], {"overs": 1}, ""]:
+            result = self.assert_same_result(dict(VALID_INPUTS, overs_available_to_team_2_at_start=value))
+            self.assertEqual(result["inputs"], {"overs_available_to_team_2_at_start": ["Must be a number."]})
+
+    def test_cross_field_rules(self):
+        for scenario in COMPILED_SCENARIO_RULES:
+            inputs = {field: 60 for field in SCENARIO_RULES[scenario].required_inputs}
+            inputs["overs_available_to_team_1_at_start"] = 10
+            self.assert_same_result(inputs, scenario)
+
+    def test_malformed_requests_use_field_validation(self):
+        for data in [
+            {"scenario_type": "Unknown", "match_format": "ODI", "inputs": VALID_INPUTS},
+            {"scenario_type": "SecondInningsDelayed", "match_format": "T5", "inputs": VALID_INPUTS},
+            {"scenario_type": "SecondInningsDelayed", "match_format": "ODI", "inputs": []},
+            {"match_format": "ODI"},
+            ["not", "a", "dict"],
+        ]:
+            self.assertEqual(self.validate(data, fast=True), self.validate(data, fast=False))
@@ -0,0 +1,213 @@
+import asyncio
+import io
+import sys
+import orjson
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import SimpleTestCase, override_settings
+from api.cache import result_cache
+from api.enums import DLSScenarioEnum
+from api.fastlane import FastLane, FastLaneASGI, FastLaneWSGI
+
+PATH = "/calculate-dls-score/"
+
+
+def interrupted_request(**inputs):
+    return orjson.dumps({
+        "scenarioType": DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value,
+        "matchFormat": "T20",
+        "inputs": {
+            "oversAvailableToTeam1AtStart": 20.0,
+            "runsScoredByTeam1": 180,
+            "oversAvailableToTeam2AtStart": 20.0,
+            "oversUsedByTeam2DuringInterruption": 12.3,
+            "wicketsLostByTeam2DuringInterruption": 4,
+            "revisedOversToTeam2AfterResumption": 16.0,
+            **inputs,
+        },
+    })
+
+
+# (body, request headers) answered by the lane itself
+SERVED = [
+    (interrupted_request(), {}),
+    (interrupted_request(runsScoredByTeam1=231), {"Origin": "https://dls.example"}),
+    (interrupted_request(), {"Accept": "application/json, text/plain, */*"}),
+    (interrupted_request(), {"Content-Type": "application/json; charset=utf-8"}),
+]
+
+# Requests passed to Django
+PASSED = [
+    (interrupted_request(wicketsLostByTeam2DuringInterruption=12), {}),
+    (interrupted_request(oversUsedByTeam2DuringInterruption=25.0), {"Origin": "https://dls.example"}),
+    (orjson.dumps([orjson.loads(interrupted_request())]), {}),
+    (b'{"scenarioType": ', {}),
+    (interrupted_request(), {"Content-Type": "text/plain"}),
+    (interrupted_request(), {"Accept": "application/json; indent=4"}),
+    (interrupted_request(), {"Accept": "text/html"}),
+    (interrupted_request(), {"Query": "format=json"}),
+    (interrupted_request(), {"Host": "bad host"}),
+]
+
+
+class CountingApplication:
+    """
+    Forwards to an application, counting the requests it receives.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.application(*args)
+
+
+@override_settings(DLS_FAST_LANE=True)
+class FastLaneConformanceTests(SimpleTestCase):
+    """
+    The fast lane answers exactly like ``DLSScoreView`` behind the full Django stack.
+    """
+
+    def setUp(self):
+        result_cache.clear()
+
+    def wsgi_request(self, application, body, headers):
+        headers = {"Content-Type": "application/json", "Host": "testserver", **headers}
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "SCRIPT_NAME": "",
+            "PATH_INFO": PATH,
+            "QUERY_STRING": headers.pop("Query", ""),
+            "CONTENT_TYPE": headers.pop("Content-Type"),
+            "CONTENT_LENGTH": str(len(body)),
+            "SERVER_NAME": "testserver",
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.url_scheme": "http",
+            **{f"HTTP_{name.upper().replace('-', '_')}": value for name, value in headers.items()},
+        }
+        response = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            response["status"] = status
+            response["headers"] = list(response_headers)
+
+        result = application(environ, start_response)
+        response["body"] = b"".join(result)
+        if hasattr(result, "close"):
+            result.close()
+        return response
+
+    def asgi_request(self, application, body, headers):
+        headers = {"Content-Type": "application/json", "Host": "testserver", **headers}
+        query_string = headers.pop("Query", "")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": PATH,
+            "raw_path": PATH.encode(),
+            "root_path": "",
+            "query_string": query_string.encode(),
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in {**headers, "Content-Length": str(len(body))}.items()
+            ],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        # Two chunks, to check the body is read and replayed whole
+        messages = [
+            {"type": "http.request", "body": body[:10], "more_body": True},
+            {"type": "http.request", "body": body[10:], "more_body": False},
+        ]
+        response = {"body": b""}
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            await asyncio.Event().wait()
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = list(message["headers"])
+            else:
+                response["body"] += message.get("body", b"")
+
+        asyncio.run(application(scope, receive, send))
+        return response
+
+    def test_wsgi(self):
+        django_application = CountingApplication(WSGIHandler())
+        application = FastLaneWSGI(django_application)
+        for requests, calls in ((SERVED, 0), (PASSED, 1)):
+            for body, headers in requests:
+                with self.subTest(body=body, headers=headers):
+                    django_application.calls = 0
+
+                    response = self.wsgi_request(application, body, headers)
+
+                    self.assertEqual(response, self.wsgi_request(WSGIHandler(), body, headers))
+                    self.assertEqual(django_application.calls, calls)
+
+    def test_asgi(self):
+        django_application = CountingApplication(ASGIHandler())
+        application = FastLaneASGI(django_application)
+        for requests, calls in ((SERVED, 0), (PASSED, 1)):
+            for body, headers in requests:
+                with self.subTest(body=body, headers=headers):
+                    django_application.calls = 0
+
+                    response = self.asgi_request(application, body, headers)
+
+                    self.assertEqual(response, self.asgi_request(ASGIHandler(), body, headers))
+                    self.assertEqual(django_application.calls, calls)
+
+    def test_served_response(self):
+        response = self.wsgi_request(FastLaneWSGI(WSGIHandler()), *SERVED[1])
+
+        self.assertEqual(response["status"], "200 OK")
+        self.assertEqual(orjson.loads(response["body"])["revisedTarget"], orjson.loads(response["body"])["parScore"] + 1)
+        self.assertIn(("access-control-allow-origin", "*"), response["headers"])
+
+    def test_other_endpoints_pass_through(self):
+        response = {}
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "SCRIPT_NAME": "",
+            "PATH_INFO": "/health-check/",
+            "QUERY_STRING": "",
+            "SERVER_NAME": "testserver",
+            "SERVER_PORT": "80",
+            "HTTP_HOST": "testserver",
+            "wsgi.input": io.BytesIO(),
+            "wsgi.errors": sys.stderr,
+            "wsgi.url_scheme": "http",
+        }
+
+        body = b"".join(FastLaneWSGI(WSGIHandler())(environ, lambda status, headers: response.update(status=status)))
+
+        self.assertEqual(response["status"], "200 OK")
+        self.assertEqual(orjson.loads(body), {"status": "ok"})
+
+    def test_disabled_for_unmirrored_configuration(self):
+        self.assertTrue(FastLane().enabled)
+        with override_settings(MIDDLEWARE=["django.middleware.common.CommonMiddleware"]):
+            self.assertFalse(FastLane().enabled)
+        with override_settings(SECURE_SSL_REDIRECT=True):
+            self.assertFalse(FastLane().enabled)
+        with override_settings(DLS_FAST_LANE=False):
+            self.assertFalse(FastLane().enabled)
+
+
+class FastLaneSettingsTests(SimpleTestCase):
+
+    def test_disabled_by_default(self):
+        self.assertFalse(FastLane().enabled)
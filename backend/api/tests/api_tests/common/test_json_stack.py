@@ -0,0 +1,94 @@
+import io
+import uuid
+from decimal import Decimal
+import numpy as np
+from django.test import SimpleTestCase
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from rest_framework.exceptions import ErrorDetail, ParseError
+from api.parsers import ORJSONCamelCaseParser
+from api.renderers import ORJSONCamelCaseRenderer
+
+
+class ORJSONCamelCaseRendererTests(SimpleTestCase):
+
+    def assert_same_output(self, data):
+        self.assertEqual(ORJSONCamelCaseRenderer().render(data), CamelCaseJSONRenderer().render(data))
+
+    def test_calculation_response(self):
+        self.assert_same_output({"par_score": 106, "revised_target": 107, "messages": ["Target calculated successfully."]})
+
+    def test_error_response(self):
+        self.assert_same_output({
+            "inputs": {
+                "overs_used_by_team_2_during_interruption": [
+                    ErrorDetail("Must be lesser than oversAvailableToTeam2AtStart", code="invalid")
+                ],
+            }
+        })
+
+    def test_list_item_errors(self):
+        self.assert_same_output({
+            "items": {
+                0: {"match_format": [ErrorDetail('"Test" is not a valid choice.', code="invalid_choice")]},
+                3: [ErrorDetail("This field is required.", code="required")],
+            }
+        })
+
+    def test_batch_response(self):
+        results = [
+            {"index": index, "status": "success", "par_score": index, "revised_target": index + 1}
+            for index in range(100)
+        ]
+        self.assert_same_output({"count": 100, "succeeded": 100, "failed": 0, "results": results})
+
+    def test_unknown_keys_floats_and_unicode(self):
+        self.assert_same_output({
+            "some_new_key": [1.5, 100.0, 0.1, None, True],
+            "nested_list": [{"team_1_key": "café  "}],
+            "table": (("balls", 0), ("x_y", 1)),
+        })
+
+    def test_numpy_and_python_types(self):
+        value = uuid.uuid4()
+        rendered = ORJSONCamelCaseRenderer().render({
+            "par_score": np.float64(12.5),
+            "decimal_value": Decimal("1.5"),
+            "uuid_value": value,
+        })
+
+        self.assertEqual(rendered, f'{{"parScore":12.5,"decimalValue":1.5,"uuidValue":"{value}"}}'.encode())
+
+    def test_indent_falls_back_to_json_renderer(self):
+        data = {"par_score": 10}
+        self.assertEqual(
+            ORJSONCamelCaseRenderer().render(data, "application/json; indent=4"),
+            CamelCaseJSONRenderer().render(data, "application/json; indent=4"),
+        )
+
+    def test_none(self):
+        self.assertEqual(ORJSONCamelCaseRenderer().render(None), b"")
+
+
+class ORJSONCamelCaseParserTests(SimpleTestCase):
+
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), "application/json", {})
+
+    def assert_same_output(self, body):
+        self.assertEqual(self.parse(ORJSONCamelCaseParser(), body), self.parse(CamelCaseJSONParser(), body))
+
+    def test_calculation_request(self):
+        self.assert_same_output(
+            b'{"scenarioType": "SecondInningsInterrupted", "matchFormat": "T20", "inputs": {'
+            b'"oversAvailableToTeam1AtStart": "20.0", "runsScoredByTeam1": 230,'
+            b'"oversAvailableToTeam2AtStart": 20.0, "oversUsedByTeam2DuringInterruption": 5.0,'
+            b'"wicketsLostByTeam2DuringInterruption": 4, "revisedOversToTeam2AfterResumption": 7}}'
+        )
+
+    def test_snake_case_and_unknown_keys(self):
+        self.assert_same_output(b'[{"scenario_type": "X", "someNewKey": {"deepKey2Value": [1, 2]}}]')
+
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError):
+            self.parse(ORJSONCamelCaseParser(), b'{"scenarioType": ')
@@ -0,0 +1,113 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api.batcher import MicroBatcher
+from api.cache import result_cache
+from api.enums import DLSScenarioEnum
+from api.services import DLSService, dls_service
+
+
+def delayed_request(overs_available_to_team_2_at_start, match_format="T20"):
+    return {
+        "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+        "match_format": match_format,
+        "inputs": {
+            "overs_available_to_team_1_at_start": 20.0,
+            "runs_scored_by_team_1": 180,
+            "overs_available_to_team_2_at_start": overs_available_to_team_2_at_start,
+        },
+    }
+
+
+class MicroBatcherTests(SimpleTestCase):
+
+    def submit_concurrently(self, batcher, items):
+        barrier = threading.Barrier(len(items))
+
+        def submit(item):
+            barrier.wait()
+            try:
+                return batcher.submit(item)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(len(items)) as executor:
+            return list(executor.map(submit, items))
+
+    def test_concurrent_requests_share_batches(self):
+        batches = []
+
+        def calculate_many(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(calculate_many, window=0.2, max_size=100)
+
+        self.assertEqual(self.submit_concurrently(batcher, list(range(8))), [item * 2 for item in range(8)])
+        self.assertLess(len(batches), 8)
+        self.assertEqual(sorted(item for batch in batches for item in batch), list(range(8)))
+        stats = batcher.stats()
+        self.assertEqual(stats["requests"], 8)
+        self.assertEqual(stats["batches"], len(batches))
+        self.assertGreater(stats["mean_batch_size"], 1)
+
+    def test_full_batch_is_dispatched_before_the_window_ends(self):
+        batcher = MicroBatcher(lambda items: list(items), window=10, max_size=4)
+
+        start = time.perf_counter()
+        self.assertEqual(self.submit_concurrently(batcher, [1, 2, 3, 4]), [1, 2, 3, 4])
+
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(batcher.stats()["max_batch_size"], 4)
+
+    def test_errors_reach_only_their_callers(self):
+        batcher = MicroBatcher(
+            lambda items: [ValueError(item) if item < 0 else item for item in items],
+            window=0.05,
+        )
+
+        results = self.submit_concurrently(batcher, [1, -1, 2])
+
+        self.assertEqual(results[0], 1)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], 2)
+
+    def test_failed_batch_fails_every_caller(self):
+        def calculate_many(items):
+            raise RuntimeError("calculator unavailable")
+
+        batcher = MicroBatcher(calculate_many, window=0.05)
+
+        for result in self.submit_concurrently(batcher, [1, 2]):
+            self.assertIsInstance(result, RuntimeError)
+
+
+class BatchedServiceTests(SimpleTestCase):
+
+    @override_settings(DLS_MICRO_BATCHING={"ENABLED": True, "WINDOW_MS": 50, "MAX_SIZE": 64})
+    def test_batched_results_match_direct_calculation(self):
+        result_cache.clear()
+        service = DLSService()
+        requests = [delayed_request(overs, match_format) for overs in (10, 12.3, 15, 20) for match_format in ("T20", "T10")]
+        requests[-1]["inputs"]["overs_available_to_team_2_at_start"] = 10.0
+
+        with ThreadPoolExecutor(len(requests)) as executor:
+            par_scores = list(executor.map(service.calculate, requests))
+
+        self.assertEqual(par_scores, [DLSService()._calculate(request) for request in requests])
+        self.assertTrue(service.batcher.enabled)
+        self.assertLess(service.batcher.stats()["batches"], len(requests))
+
+
+class MicroBatchingMetricsTests(APITestCase):
+
+    def test_metrics_report_batching(self):
+        response = self.client.get(reverse("api:metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["micro_batching"], dls_service.batcher.stats())
+        self.assertFalse(response.data["micro_batching"]["enabled"])
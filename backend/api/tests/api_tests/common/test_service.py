@@ -0,0 +1,96 @@
+import gc
+import weakref
+from unittest import mock
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api.cache import result_cache
+from api.enums import DLSScenarioEnum
+from api.services import DLSService, dls_service
+from calculators.dls_calculator import DLSCalculator
+from calculators.resource_table import ResourceTable
+from calculators.table_provider import resource_tables
+
+
+class DLSServiceDispatchTests(SimpleTestCase):
+
+    def test_dispatch_covers_every_format_and_scenario(self):
+        service = DLSService()
+        for match_format in ["ODI", "T20", "T10"]:
+            for scenario, method_name in DLSService.scenario_map_getters.items():
+                method = service.dispatch(match_format, scenario)
+                self.assertIs(method.__self__, service.dispatch(match_format, DLSScenarioEnum.SECOND_INNINGS_DELAYED.value).__self__)
+                self.assertIs(method.__self__.resource_table, resource_tables.get(match_format))
+                self.assertIs(method, service.dispatch(match_format, scenario, "standard"))
+                self.assertEqual(method.__name__, method_name)
+
+    def test_dispatch_is_dropped_with_its_table(self):
+        service = DLSService()
+        table = ResourceTable("T20")
+        with mock.patch.object(resource_tables, "get", return_value=table):
+            method = service.dispatch("T20", DLSScenarioEnum.SECOND_INNINGS_DELAYED.value)
+            self.assertIs(service.dispatch("T20", DLSScenarioEnum.SECOND_INNINGS_DELAYED.value), method)
+        table_ref = weakref.ref(table)
+
+        del table, method
+        gc.collect()
+
+        self.assertIsNone(table_ref())
+
+    def test_dispatch_matches_a_fresh_calculator(self):
+        validated_data = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value,
+            "match_format": "T20",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 20.0,
+                "runs_scored_by_team_1": 180,
+                "overs_available_to_team_2_at_start": 20.0,
+                "overs_used_by_team_2_during_interruption": 8.2,
+                "wickets_lost_by_team_2_during_interruption": 3,
+                "revised_overs_to_team_2_after_resumption": 14.0,
+            },
+        }
+        expected = round(DLSCalculator("T20").calculate_par_score_second_innings_interrupted(**validated_data["inputs"]))
+        self.assertEqual(DLSService()._calculate(validated_data), expected)
+
+    def test_warm_up_builds_the_cheap_lookup_indexes(self):
+        for table in resource_tables.tables().values():
+            vars(table).pop("resource_used", None)
+
+        service = DLSService()
+        service.warm_up()
+        for table in resource_tables.tables().values():
+            self.assertIn("resource_ratio", vars(table))
+            self.assertNotIn("resource_used", vars(table))
+
+
+class ScenarioLatencyMetricsTests(APITestCase):
+
+    def setUp(self):
+        result_cache.clear()
+        dls_service.latency.clear()
+
+    def test_latency_is_counted_per_scenario(self):
+        payload = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+            "match_format": "ODI",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 50.0,
+                "runs_scored_by_team_1": 250,
+                "overs_available_to_team_2_at_start": 40.0,
+            }
+        }
+        for _ in range(2):
+            self.client.post(reverse("api:calculate_dls_score"), payload, format='json')
+
+        response = self.client.get(reverse("api:metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        latency = response.data["scenario_latency"]
+        self.assertEqual(list(latency), [DLSScenarioEnum.SECOND_INNINGS_DELAYED.value])
+        self.assertEqual(latency[DLSScenarioEnum.SECOND_INNINGS_DELAYED.value]["count"], 2)
+        self.assertGreaterEqual(
+            latency[DLSScenarioEnum.SECOND_INNINGS_DELAYED.value]["max_ms"],
+            latency[DLSScenarioEnum.SECOND_INNINGS_DELAYED.value]["mean_ms"],
+        )
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api.cache import result_cache
+from api.enums import DLSScenarioEnum
+from api.services import DLSService, dls_service
+from api.singleflight import SingleFlight
+
+
+class SingleFlightTests(SimpleTestCase):
+
+    def run_concurrently(self, flights, count, function):
+        started = threading.Barrier(count)
+        release = threading.Event()
+        calls = []
+
+        def leader_function():
+            calls.append(1)
+            release.wait(5)
+            return function()
+
+        def call(_):
+            started.wait()
+            try:
+                return flights.do("key", leader_function)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(count) as executor:
+            futures = [executor.submit(call, index) for index in range(count)]
+            while flights.stats()["collapsed"] < count - 1:
+                threading.Event().wait(0.001)
+            release.set()
+            return [future.result() for future in futures], calls
+
+    def test_identical_concurrent_calls_share_one_call(self):
+        flights = SingleFlight()
+
+        results, calls = self.run_concurrently(flights, 8, lambda: object())
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(flights.stats(), {"executed": 1, "collapsed": 7, "collapsed_ratio": 7 / 8, "in_flight": 0})
+
+    def test_errors_are_shared(self):
+        def fail():
+            raise ValueError("no resources")
+
+        results, calls = self.run_concurrently(SingleFlight(), 4, fail)
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    def test_finished_calls_are_not_reused(self):
+        flights = SingleFlight()
+
+        self.assertEqual([flights.do("key", lambda value=value: value) for value in range(3)], [0, 1, 2])
+        self.assertEqual(flights.stats()["collapsed"], 0)
+
+
+class AsyncSingleFlightTests(SimpleTestCase):
+
+    def test_identical_concurrent_coroutines_share_one_call(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        async def main():
+            return await asyncio.gather(*(flights.ado("key", compute) for _ in range(10)))
+
+        self.assertEqual(asyncio.run(main()), [1] * 10)
+        self.assertEqual(flights.stats()["collapsed"], 9)
+        self.assertEqual(flights.stats()["in_flight"], 0)
+
+    def test_cancelled_caller_does_not_cancel_the_call(self):
+        flights = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def main():
+            first = asyncio.ensure_future(flights.ado("key", compute))
+            second = asyncio.ensure_future(flights.ado("key", compute))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second, first.cancelled()
+
+        self.assertEqual(asyncio.run(main()), ("done", True))
+
+    @override_settings(DLS_MICRO_BATCHING={"ENABLED": True, "WINDOW_MS": 1, "MAX_SIZE": 64})
+    def test_service_coalesces_batched_async_calculations(self):
+        result_cache.clear()
+        service = DLSService()
+        validated_data = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+            "match_format": "T20",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 20.0,
+                "runs_scored_by_team_1": 180,
+                "overs_available_to_team_2_at_start": 14.0,
+            },
+        }
+
+        async def main():
+            return await asyncio.gather(*(service.acalculate(validated_data) for _ in range(5)))
+
+        par_scores = asyncio.run(main())
+
+        self.assertEqual(par_scores, [service._calculate(validated_data)] * 5)
+        self.assertEqual(service.batcher.stats()["requests"], 1)
+        self.assertEqual(service.flights.stats()["collapsed"], 4)
+
+
+class SingleFlightMetricsTests(APITestCase):
+
+    def setUp(self):
+        dls_service.flights.clear()
+
+    def test_metrics_report_coalescing(self):
+        payload = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+            "match_format": "T20",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 20.0,
+                "runs_scored_by_team_1": 180,
+                "overs_available_to_team_2_at_start": 14.0,
+            },
+        }
+        calculation = self.client.post(reverse("api:calculate_dls_score"), payload, format='json')
+        response = self.client.get(reverse("api:metrics"))
+
+        self.assertEqual(calculation.status_code, status.HTTP_200_OK)
+        self.assertEqual(calculation["Content-Type"], "application/json")
+        single_flight = response.data["single_flight"]
+        self.assertEqual(single_flight["calculations"]["executed"], 1)
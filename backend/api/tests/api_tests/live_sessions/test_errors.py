@@ -0,0 +1,104 @@
+from unittest.mock import patch
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from api.services import LiveSession, live_sessions
+
+
+class LiveSessionErrorTests(APITestCase):
+
+    def setUp(self):
+        self.url = reverse("api:live_sessions")
+        self.payload = {
+            "match_format": "T20",
+            "oversAvailableToTeam1AtStart": 20.0,
+            "runsScoredByTeam1": 180,
+            "oversAvailableToTeam2AtStart": 1.0,
+        }
+
+    def create_session(self):
+        return self.client.post(self.url, self.payload, format='json').data['session_id']
+
+    def test_team_two_overs_greater_than_team_one(self):
+        payload = dict(self.payload, oversAvailableToTeam2AtStart=21.0)
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('overs_available_to_team_2_at_start', response.data)
+
+    def test_team_one_without_overs(self):
+        payload = dict(self.payload, oversAvailableToTeam1AtStart=0, oversAvailableToTeam2AtStart=0)
+        session_count = len(live_sessions._sessions)
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('overs_available_to_team_1_at_start', response.data)
+        self.assertEqual(len(live_sessions._sessions), session_count)
+
+    def test_failed_start_keeps_no_session(self):
+        session_count = len(live_sessions._sessions)
+
+        with patch.object(LiveSession, "snapshot", side_effect=ValueError("boom")):
+            response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["message"], "boom")
+        self.assertEqual(len(live_sessions._sessions), session_count)
+
+    def test_missing_required_field(self):
+        payload = dict(self.payload)
+        del payload['runsScoredByTeam1']
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('runs_scored_by_team_1', response.data)
+
+    def test_unknown_session(self):
+        url = reverse("api:live_session_events", args=["missing"])
+
+        response = self.client.post(url, {"event": "ball"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_event(self):
+        url = reverse("api:live_session_events", args=[self.create_session()])
+
+        response = self.client.post(url, {"event": "boundary"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('event', response.data)
+
+    def test_state_event_requires_values(self):
+        url = reverse("api:live_session_events", args=[self.create_session()])
+
+        response = self.client.post(url, {"event": "state"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ball_after_innings_complete(self):
+        url = reverse("api:live_session_events", args=[self.create_session()])
+        for _ in range(6):
+            self.client.post(url, {"event": "ball"}, format='json')
+
+        response = self.client.post(url, {"event": "ball"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['status'], "error")
+
+    @override_settings(DLS_LIVE_SESSION_MAX_COUNT=1)
+    def test_least_recently_used_session_is_evicted(self):
+        first = self.create_session()
+        second = self.create_session()
+
+        self.assertEqual(
+            self.client.get(reverse("api:live_session_detail", args=[first])).status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+        self.assertEqual(
+            self.client.get(reverse("api:live_session_detail", args=[second])).status_code,
+            status.HTTP_200_OK
+        )
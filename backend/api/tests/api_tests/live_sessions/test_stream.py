@@ -0,0 +1,111 @@
+import asyncio
+import json
+from django.test import SimpleTestCase
+from django.urls import reverse
+from api.broker import LocalBroker, live_broker
+
+
+class LiveSessionStreamTests(SimpleTestCase):
+
+    async def create_session(self):
+        response = await self.async_client.post(reverse("api:live_sessions"), {
+            "match_format": "T20",
+            "oversAvailableToTeam1AtStart": 20.0,
+            "runsScoredByTeam1": 180,
+            "oversAvailableToTeam2AtStart": 20.0,
+        }, content_type="application/json")
+        return response.json()["sessionId"]
+
+    async def next_event(self, stream):
+        chunk = await asyncio.wait_for(anext(stream), 2)
+        event, data = chunk.decode().strip().split("\n")
+        return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+    async def test_subscribers_receive_par_updates(self):
+        """
+        Every subscriber receives the current par, then one push per posted event.
+        """
+        session_id = await self.create_session()
+        url = reverse("api:live_session_stream", args=[session_id])
+        first = aiter((await self.async_client.get(url)).streaming_content)
+        second = aiter((await self.async_client.get(url)).streaming_content)
+
+        self.assertEqual(await self.next_event(first), ("par", await self.snapshot(session_id)))
+        await self.next_event(second)
+
+        response = await self.async_client.post(
+            reverse("api:live_session_events", args=[session_id]),
+            {"event": "state", "oversUsed": 10.0, "wicketsLost": 2},
+            content_type="application/json"
+        )
+
+        for stream in (first, second):
+            event, data = await self.next_event(stream)
+            self.assertEqual(event, "par")
+            self.assertEqual(data, response.json())
+            self.assertEqual(data["ballsUsed"], 60)
+
+    async def test_stream_ends_when_session_is_deleted(self):
+        session_id = await self.create_session()
+        stream = aiter((await self.async_client.get(
+            reverse("api:live_session_stream", args=[session_id])
+        )).streaming_content)
+        await self.next_event(stream)
+
+        await self.async_client.delete(reverse("api:live_session_detail", args=[session_id]))
+
+        self.assertEqual(await self.next_event(stream), ("end", {"sessionId": session_id}))
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+        self.assertEqual(live_broker.subscriber_count(session_id), 0)
+
+    async def test_unknown_session(self):
+        response = await self.async_client.get(reverse("api:live_session_stream", args=["missing"]))
+
+        self.assertEqual(response.status_code, 404)
+
+    async def snapshot(self, session_id):
+        response = await self.async_client.get(reverse("api:live_session_detail", args=[session_id]))
+        return response.json()
+
+
+class LocalBrokerTests(SimpleTestCase):
+
+    async def test_publish_fans_out_to_channel_subscribers(self):
+        broker = LocalBroker()
+        first = broker.subscribe("match-1")
+        second = broker.subscribe("match-1")
+        other = broker.subscribe("match-2")
+
+        self.assertEqual(broker.publish("match-1", {"par_score": 50}), 2)
+        await asyncio.sleep(0)
+
+        self.assertEqual(await first.get(), {"par_score": 50})
+        self.assertEqual(await second.get(), {"par_score": 50})
+        self.assertTrue(other.queue.empty())
+
+    async def test_publish_from_another_thread(self):
+        broker = LocalBroker()
+        subscription = broker.subscribe("match-1")
+
+        await asyncio.to_thread(broker.publish, "match-1", "update")
+
+        self.assertEqual(await asyncio.wait_for(subscription.get(), 1), "update")
+
+    async def test_slow_subscriber_keeps_latest_messages(self):
+        broker = LocalBroker(max_queue_size=2)
+        subscription = broker.subscribe("match-1")
+
+        for message in range(5):
+            broker.publish("match-1", message)
+        await asyncio.sleep(0)
+
+        self.assertEqual([await subscription.get(), await subscription.get()], [3, 4])
+
+    async def test_unsubscribe(self):
+        broker = LocalBroker()
+        subscription = broker.subscribe("match-1")
+        subscription.close()
+
+        self.assertEqual(broker.subscriber_count("match-1"), 0)
+        self.assertEqual(broker.publish("match-1", "update"), 0)
@@ -0,0 +1,79 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from api.enums import DLSScenarioEnum
+
+
+class LiveSessionSuccessTests(APITestCase):
+
+    def setUp(self):
+        self.url = reverse("api:live_sessions")
+        self.payload = {
+            "match_format": "T20",
+            "oversAvailableToTeam1AtStart": 20.0,
+            "runsScoredByTeam1": 180,
+            "oversAvailableToTeam2AtStart": 20.0,
+        }
+        response = self.client.post(self.url, self.payload, format='json')
+        self.session_id = response.data['session_id']
+        self.events_url = reverse("api:live_session_events", args=[self.session_id])
+
+    def curtailed_par(self, overs_used, wickets_lost):
+        response = self.client.post(reverse("api:calculate_dls_score"), {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_CURTAILED.value,
+            "match_format": "T20",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 20.0,
+                "runs_scored_by_team_1": 180,
+                "overs_available_to_team_2_at_start": 20.0,
+                "overs_used_by_team_2_during_curtailed": overs_used,
+                "wickets_lost_by_team_2_during_curtailed": wickets_lost,
+            }
+        }, format='json')
+        return response.data['par_score']
+
+    def test_create_session(self):
+        """
+        A new session starts at zero balls and zero wickets.
+        """
+        response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['balls_used'], 0)
+        self.assertEqual(response.data['wickets_lost'], 0)
+        self.assertEqual(response.data['par_score'], 0)
+
+    def test_ball_events_update_par(self):
+        """
+        Each event returns the same par as the SecondInningsCurtailed calculation.
+        """
+        for _ in range(6):
+            response = self.client.post(self.events_url, {"event": "ball"}, format='json')
+        response = self.client.post(self.events_url, {"event": "ball", "wicket": True}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['balls_used'], 7)
+        self.assertEqual(response.data['overs_used'], 1.1)
+        self.assertEqual(response.data['wickets_lost'], 1)
+        self.assertEqual(response.data['par_score'], self.curtailed_par(1.1, 1))
+        self.assertEqual(response.data['revised_target'], response.data['par_score'] + 1)
+
+    def test_state_event(self):
+        response = self.client.post(
+            self.events_url, {"event": "state", "oversUsed": 12.4, "wicketsLost": 3}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['par_score'], self.curtailed_par(12.4, 3))
+
+    def test_get_and_delete_session(self):
+        self.client.post(self.events_url, {"event": "wicket"}, format='json')
+        detail_url = reverse("api:live_session_detail", args=[self.session_id])
+
+        response = self.client.get(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['wickets_lost'], 1)
+
+        response = self.client.delete(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(detail_url).status_code, status.HTTP_404_NOT_FOUND)
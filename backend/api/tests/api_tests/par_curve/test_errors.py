@@ -0,0 +1,65 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+
+
+class ParCurveErrorTests(APITestCase):
+
+    def setUp(self):
+        self.url = reverse("api:par_curve")
+        self.payload = {
+            "match_format": "T20",
+            "oversAvailableToTeam1AtStart": 20.0,
+            "runsScoredByTeam1": 180,
+            "oversAvailableToTeam2AtStart": 20.0,
+        }
+
+    def test_team_two_overs_greater_than_team_one(self):
+        payload = dict(self.payload, oversAvailableToTeam2AtStart=21.0)
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('overs_available_to_team_2_at_start', response.data)
+
+    def test_partial_interruption(self):
+        payload = dict(self.payload, oversUsedByTeam2DuringInterruption=5.0)
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('wickets_lost_by_team_2_during_interruption', response.data)
+        self.assertIn('revised_overs_to_team_2_after_resumption', response.data)
+
+    def test_revised_overs_not_greater_than_used(self):
+        payload = dict(
+            self.payload,
+            oversUsedByTeam2DuringInterruption=8.0,
+            wicketsLostByTeam2DuringInterruption=2,
+            revisedOversToTeam2AfterResumption=7.0,
+        )
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('overs_used_by_team_2_during_interruption', response.data)
+
+    def test_invalid_encoding(self):
+        response = self.client.post(self.url, dict(self.payload, encoding="xml"), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('encoding', response.data)
+
+    def test_no_team_one_resources(self):
+        payload = dict(self.payload, oversAvailableToTeam1AtStart=0, oversAvailableToTeam2AtStart=0)
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['status'], "error")
+
+    def test_unknown_table_version(self):
+        response = self.client.post(self.url, dict(self.payload, tableVersion="T20-1999"), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('table_version', response.data)
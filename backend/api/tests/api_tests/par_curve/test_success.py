@@ -0,0 +1,113 @@
+import base64
+import numpy as np
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from api.enums import DLSScenarioEnum
+
+
+class ParCurveSuccessTests(APITestCase):
+
+    def setUp(self):
+        self.url = reverse("api:par_curve")
+        self.payload = {
+            "match_format": "T20",
+            "oversAvailableToTeam1AtStart": 20.0,
+            "runsScoredByTeam1": 180,
+            "oversAvailableToTeam2AtStart": 20.0,
+        }
+
+    def single_par(self, scenario, inputs):
+        response = self.client.post(reverse("api:calculate_dls_score"), {
+            "scenario_type": scenario,
+            "match_format": "T20",
+            "inputs": inputs,
+        }, format='json')
+        return response.data['par_score']
+
+    def test_curve_matches_curtailed_scenario(self):
+        """
+        Each entry equals the SecondInningsCurtailed par at that ball and wicket count.
+        """
+        response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['wickets'], 10)
+        self.assertEqual(response.data['balls'], 120)
+        par_scores = response.data['par_scores']
+        self.assertEqual(len(par_scores), 10)
+        self.assertEqual(len(par_scores[0]), 121)
+
+        for wickets_lost, balls_used in [(0, 6), (3, 61), (5, 90), (9, 119)]:
+            expected = self.single_par(DLSScenarioEnum.SECOND_INNINGS_CURTAILED.value, {
+                "overs_available_to_team_1_at_start": 20.0,
+                "runs_scored_by_team_1": 180,
+                "overs_available_to_team_2_at_start": 20.0,
+                "overs_used_by_team_2_during_curtailed": balls_used // 6 + (balls_used % 6) / 10,
+                "wickets_lost_by_team_2_during_curtailed": wickets_lost,
+            })
+            self.assertEqual(par_scores[wickets_lost][balls_used], expected)
+
+    def test_curve_with_interruption(self):
+        """
+        The end of the revised innings matches the SecondInningsInterrupted par.
+        """
+        payload = dict(
+            self.payload,
+            oversUsedByTeam2DuringInterruption=5.0,
+            wicketsLostByTeam2DuringInterruption=4,
+            revisedOversToTeam2AfterResumption=7.0,
+        )
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['balls'], 42)
+        expected = self.single_par(DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value, {
+            "overs_available_to_team_1_at_start": 20.0,
+            "runs_scored_by_team_1": 180,
+            "overs_available_to_team_2_at_start": 20.0,
+            "overs_used_by_team_2_during_interruption": 5.0,
+            "wickets_lost_by_team_2_during_interruption": 4,
+            "revised_overs_to_team_2_after_resumption": 7.0,
+        })
+        self.assertEqual(response.data['par_scores'][4][42], expected)
+
+    def test_base64_encoding(self):
+        """
+        The base64 encoding decodes to the same matrix as the JSON encoding.
+        """
+        as_json = self.client.post(self.url, dict(self.payload, match_format="ODI",
+                                                  oversAvailableToTeam1AtStart=50.0,
+                                                  oversAvailableToTeam2AtStart=50.0), format='json')
+        as_base64 = self.client.post(self.url, dict(self.payload, match_format="ODI",
+                                                    oversAvailableToTeam1AtStart=50.0,
+                                                    oversAvailableToTeam2AtStart=50.0,
+                                                    encoding="base64"), format='json')
+
+        self.assertEqual(as_base64.status_code, status.HTTP_200_OK)
+        decoded = np.frombuffer(base64.b64decode(as_base64.data['par_scores']), dtype=as_base64.data['dtype'])
+        self.assertEqual(decoded.reshape(10, 301).tolist(), as_json.data['par_scores'])
+        self.assertLess(len(as_base64.content), len(as_json.content))
+
+    def test_base64_falls_back_to_json_outside_int16(self):
+        """
+        Par scores that do not fit in int16 are sent as nested lists.
+        """
+        response = self.client.post(self.url, dict(self.payload, runsScoredByTeam1=40000, encoding="base64"),
+                                    format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['encoding'], "json")
+        self.assertNotIn('dtype', response.data)
+        self.assertGreater(max(max(row) for row in response.data['par_scores']), np.iinfo(np.int16).max)
+
+    def test_table_version(self):
+        """
+        A pinned table version gives the same curve as the active table it names.
+        """
+        active = self.client.post(self.url, self.payload, format='json')
+        pinned = self.client.post(self.url, dict(self.payload, tableVersion="standard"), format='json')
+
+        self.assertEqual(pinned.status_code, status.HTTP_200_OK)
+        self.assertEqual(pinned.data['par_scores'], active.data['par_scores'])
@@ -0,0 +1,101 @@
+import gc
+import weakref
+from unittest import mock
+from django.test import SimpleTestCase
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from api.responses import RenderedBodies
+from api.services import get_resource_table_payload
+from calculators.resource_table import RESOURCE_DATA, ResourceTable
+from calculators.table_provider import resource_tables
+
+
+class ResourceTableCachingTests(APITestCase):
+
+    def setUp(self):
+        self.url = reverse("api:resource_table")
+
+    def test_data_matches_resource_table(self):
+        for match_format in ["T20", "ODI", "T10"]:
+            response = self.client.get(self.url, {"match_format": match_format})
+            table = RESOURCE_DATA[match_format]
+            rows = [[float(table[column][index]) for column in table] for index in range(len(table["balls"]))]
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data["columns"], list(table))
+            self.assertEqual(response.data["data"], rows)
+
+    def test_cache_headers(self):
+        response = self.client.get(self.url, {"match_format": "ODI"})
+
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("max-age", response["Cache-Control"])
+        self.assertEqual(response["Content-Type"], "application/json")
+
+    def test_repeated_requests_return_identical_bodies(self):
+        first = self.client.get(self.url, {"match_format": "ODI"})
+        second = self.client.get(self.url, {"match_format": "ODI"})
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+        self.assertEqual(second.json()["columns"][0], "balls")
+
+    def test_formats_have_different_etags(self):
+        t20 = self.client.get(self.url, {"match_format": "T20"})
+        t10 = self.client.get(self.url, {"match_format": "T10"})
+
+        self.assertNotEqual(t20["ETag"], t10["ETag"])
+
+    def test_if_none_match_returns_not_modified(self):
+        etag = self.client.get(self.url, {"match_format": "T20"})["ETag"]
+
+        response = self.client.get(self.url, {"match_format": "T20"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_stale_etag_returns_table(self):
+        response = self.client.get(self.url, {"match_format": "T20"}, HTTP_IF_NONE_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("data", response.data)
+
+    def test_unknown_match_format(self):
+        response = self.client.get(self.url, {"match_format": "Test"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["status"], "error")
+
+
+class RenderedBodiesTests(SimpleTestCase):
+
+    def test_least_recently_used_bodies_are_evicted(self):
+        bodies = RenderedBodies(max_size=2)
+        renders = []
+
+        def render(key):
+            renders.append(key)
+            return f"{key}".encode(), "application/json"
+
+        for key in ["a", "b", "a", "c", "a", "b"]:
+            self.assertEqual(bodies.get_or_render(key, lambda: render(key))[0], key.encode())
+
+        self.assertEqual(renders, ["a", "b", "c", "b"])
+        self.assertEqual(len(bodies), 2)
+
+
+class ResourceTablePayloadTests(SimpleTestCase):
+
+    def test_payload_is_dropped_with_its_table(self):
+        table = ResourceTable("T20")
+        with mock.patch.object(resource_tables, "get", return_value=table):
+            payload = get_resource_table_payload("T20")
+            self.assertIs(get_resource_table_payload("T20"), payload)
+        table_ref = weakref.ref(table)
+
+        del table
+        gc.collect()
+
+        self.assertIsNone(table_ref())
@@ -0,0 +1,80 @@
+import os
+import tempfile
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api.cache import result_cache
+from api.enums import DLSScenarioEnum
+from calculators.resource_table import RESOURCE_DATA, WICKET_COLUMNS
+from calculators.table_file import expand_to_balls, write_table_file
+from calculators.table_provider import BundledTableProvider, TableFileProvider, resource_tables
+
+
+class ResourceTableVersionTests(APITestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        write_table_file(
+            os.path.join(directory.name, "odi-2024.dlstable"),
+            "ODI-2024",
+            "ODI",
+            100 * (expand_to_balls(RESOURCE_DATA["ODI"], WICKET_COLUMNS) / 100) ** 0.8,
+        )
+
+        providers = resource_tables.providers
+        resource_tables.providers = [BundledTableProvider(), TableFileProvider(directory.name)]
+        resource_tables.reload()
+        self.addCleanup(resource_tables.reload)
+        self.addCleanup(setattr, resource_tables, "providers", providers)
+        result_cache.clear()
+
+    def calculate(self, **extra):
+        payload = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value,
+            "match_format": "ODI",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 50.0,
+                "runs_scored_by_team_1": 287,
+                "overs_available_to_team_2_at_start": 50.0,
+                "overs_used_by_team_2_during_interruption": 23.4,
+                "wickets_lost_by_team_2_during_interruption": 4,
+                "revised_overs_to_team_2_after_resumption": 41.0,
+            },
+            **extra,
+        }
+        return self.client.post(reverse("api:calculate_dls_score"), payload, format="json")
+
+    def test_pinned_version_is_used(self):
+        standard = self.calculate()
+        pinned = self.calculate(tableVersion="ODI-2024")
+
+        self.assertEqual(standard.status_code, status.HTTP_200_OK)
+        self.assertEqual(pinned.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(pinned.data["par_score"], standard.data["par_score"])
+        self.assertEqual(self.calculate(tableVersion="standard").data, standard.data)
+
+    def test_activated_version_becomes_the_default(self):
+        pinned = self.calculate(tableVersion="ODI-2024")
+        resource_tables.activate("ODI", "ODI-2024")
+
+        self.assertEqual(self.calculate().data, pinned.data)
+
+    def test_unknown_version_is_rejected(self):
+        response = self.calculate(tableVersion="T20-2024")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("table_version", response.data)
+
+    def test_resource_table_by_version(self):
+        url = reverse("api:resource_table")
+        standard = self.client.get(url, {"match_format": "ODI"})
+        pinned = self.client.get(url, {"match_format": "ODI", "version": "ODI-2024"})
+
+        self.assertEqual(pinned.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(pinned["ETag"], standard["ETag"])
+        self.assertEqual(len(pinned.data["data"]), 301)
+        self.assertEqual(
+            self.client.get(url, {"match_format": "ODI", "version": "ODI-2030"}).status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
@@ -0,0 +1,149 @@
+from unittest.mock import patch
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from api.cache import DjangoCacheBackend, LocalLRUBackend, ResultCacheBackend, ResultCache, result_cache, result_cache_key
+from api.enums import DLSScenarioEnum
+from api.services import DLSService
+
+
+class ResultCacheKeyTests(SimpleTestCase):
+
+    def validated_data(self, **inputs):
+        return {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+            "match_format": "T20",
+            "inputs": dict({
+                "overs_available_to_team_1_at_start": 20.0,
+                "runs_scored_by_team_1": 180,
+                "overs_available_to_team_2_at_start": 15.0,
+            }, **inputs),
+        }
+
+    def test_overs_are_normalized_to_balls(self):
+        self.assertEqual(
+            result_cache_key(self.validated_data(overs_available_to_team_2_at_start=15.0)),
+            result_cache_key(self.validated_data(overs_available_to_team_2_at_start=15)),
+        )
+        self.assertEqual(
+            result_cache_key(self.validated_data()),
+            (DLSScenarioEnum.SECOND_INNINGS_DELAYED.value, "T20", "standard", (120, 180, 90)),
+        )
+
+    def test_unused_inputs_are_ignored(self):
+        self.assertEqual(
+            result_cache_key(self.validated_data()),
+            result_cache_key(self.validated_data(wickets_lost_by_team_2_during_curtailed=3)),
+        )
+
+    def test_different_inputs_give_different_keys(self):
+        self.assertNotEqual(
+            result_cache_key(self.validated_data()),
+            result_cache_key(self.validated_data(runs_scored_by_team_1=181)),
+        )
+
+
+class ResultCacheBackendTests(SimpleTestCase):
+
+    def test_local_backend_evicts_least_recently_used(self):
+        cache = ResultCache(LocalLRUBackend(max_size=2))
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 0)
+        cache.get_or_compute("c", lambda: 3)
+
+        self.assertEqual(cache.get_or_compute("a", lambda: 0), 1)
+        self.assertEqual(cache.get_or_compute("b", lambda: 0), 0)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 4)
+
+    def test_local_backend_ttl(self):
+        cache = ResultCache(LocalLRUBackend(ttl=10))
+        with patch("api.cache.time.monotonic", return_value=100):
+            cache.get_or_compute("a", lambda: 1)
+        with patch("api.cache.time.monotonic", return_value=111):
+            self.assertEqual(cache.get_or_compute("a", lambda: 2), 2)
+
+    def test_django_backend(self):
+        cache = ResultCache(DjangoCacheBackend(alias="default"))
+        cache.clear()
+
+        self.assertEqual(cache.get_or_compute(("key", 1), lambda: 10), 10)
+        self.assertEqual(cache.get_or_compute(("key", 1), lambda: 20), 10)
+        self.assertEqual(cache.stats()["hit_ratio"], 0.5)
+
+    def test_django_backend_clears_only_its_results(self):
+        cache = ResultCache(DjangoCacheBackend(alias="default"))
+        caches["default"].set("other", "kept")
+        cache.get_or_compute(("key", 1), lambda: 10)
+
+        cache.clear()
+
+        self.assertEqual(cache.get_or_compute(("key", 1), lambda: 20), 20)
+        self.assertEqual(caches["default"].get("other"), "kept")
+
+    def test_in_process_backends(self):
+        caches = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "shared": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        }
+        with override_settings(CACHES=caches):
+            self.assertTrue(ResultCache(LocalLRUBackend()).in_process)
+            self.assertTrue(ResultCache(DjangoCacheBackend(alias="default")).in_process)
+            self.assertFalse(ResultCache(DjangoCacheBackend(alias="shared")).in_process)
+            self.assertTrue(ResultCache(DjangoCacheBackend(alias="shared"), enabled=False).in_process)
+
+    def test_incomplete_backend_cannot_be_built(self):
+        class GetOnlyBackend(ResultCacheBackend):
+            def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnlyBackend()
+
+    def test_exceptions_are_not_cached(self):
+        cache = ResultCache(LocalLRUBackend())
+
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            cache.get_or_compute("a", fail)
+        self.assertEqual(cache.get_or_compute("a", lambda: 1), 1)
+
+    def test_disabled_cache_always_computes(self):
+        cache = ResultCache(LocalLRUBackend(), enabled=False)
+        cache.get_or_compute("a", lambda: 1)
+
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 2)
+        self.assertEqual(cache.stats()["misses"], 0)
+
+
+class ResultCacheAPITests(APITestCase):
+
+    def setUp(self):
+        result_cache.clear()
+        self.url = reverse("api:calculate_dls_score")
+        self.payload = {
+            "scenario_type": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+            "match_format": "ODI",
+            "inputs": {
+                "overs_available_to_team_1_at_start": 50.0,
+                "runs_scored_by_team_1": 250,
+                "overs_available_to_team_2_at_start": 40.0,
+            }
+        }
+
+    def test_repeated_requests_hit_the_cache(self):
+        first = self.client.post(self.url, self.payload, format='json')
+        with patch.object(DLSService, "_calculate", side_effect=AssertionError("not cached")):
+            second = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data, second.data)
+
+        metrics = self.client.get(reverse("api:metrics"))
+        self.assertEqual(metrics.data["result_cache"]["hits"], 1)
+        self.assertEqual(metrics.data["result_cache"]["misses"], 1)
@@ -0,0 +1,41 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+
+
+class DLSTimelineErrorTests(APITestCase):
+
+    def setUp(self):
+        self.url = reverse("api:calculate_dls_score_timeline")
+        self.payload = {
+            "match_format": "ODI",
+            "oversAvailableToTeam1AtStart": 50.0,
+            "runsScoredByTeam1": 250,
+            "oversAvailableToTeam2AtStart": 50.0,
+            "interruptions": [],
+        }
+
+    def test_team_two_overs_greater_than_team_one(self):
+        response = self.client.post(self.url, dict(self.payload, oversAvailableToTeam2AtStart=51.0), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('overs_available_to_team_2_at_start', response.data)
+
+    def test_invalid_innings(self):
+        interruptions = [{"innings": 3, "oversUsed": 10.0, "wicketsLost": 1, "revisedOvers": 40.0}]
+
+        response = self.client.post(self.url, dict(self.payload, interruptions=interruptions), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('interruptions', response.data)
+
+    def test_out_of_order_interruptions(self):
+        interruptions = [
+            {"innings": 2, "oversUsed": 20.0, "wicketsLost": 3, "revisedOvers": 40.0},
+            {"innings": 2, "oversUsed": 15.0, "wicketsLost": 3, "revisedOvers": 35.0},
+        ]
+
+        response = self.client.post(self.url, dict(self.payload, interruptions=interruptions), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["status"], "error")
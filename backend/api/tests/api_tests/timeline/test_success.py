@@ -0,0 +1,48 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from calculators.dls_calculator import DLSCalculator
+
+
+class DLSTimelineSuccessTests(APITestCase):
+
+    def setUp(self):
+        self.url = reverse("api:calculate_dls_score_timeline")
+
+    def test_three_interruptions(self):
+        payload = {
+            "match_format": "ODI",
+            "oversAvailableToTeam1AtStart": 50.0,
+            "runsScoredByTeam1": 250,
+            "oversAvailableToTeam2AtStart": 40.0,
+            "interruptions": [
+                {"innings": 1, "oversUsed": 20.0, "wicketsLost": 2, "revisedOvers": 45.0},
+                {"innings": 2, "oversUsed": 10.0, "wicketsLost": 1, "revisedOvers": 36.0},
+                {"innings": 2, "oversUsed": 25.0, "wicketsLost": 4, "revisedOvers": 30.0},
+            ],
+        }
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        steps = response.data["steps"]
+        self.assertEqual(len(steps), 3)
+        self.assertEqual(steps[0]["innings"], 1)
+        self.assertEqual(response.data["par_score"], steps[-1]["par_score"])
+        self.assertEqual(response.data["revised_target"], steps[-1]["par_score"] + 1)
+        self.assertGreater(steps[1]["par_score"], steps[2]["par_score"])
+
+    def test_single_interruption_matches_scenario_endpoint(self):
+        payload = {
+            "match_format": "T20",
+            "oversAvailableToTeam1AtStart": 20.0,
+            "runsScoredByTeam1": 180,
+            "oversAvailableToTeam2AtStart": 20.0,
+            "interruptions": [{"innings": 2, "oversUsed": 8.2, "wicketsLost": 3, "revisedOvers": 14.0}],
+        }
+        expected = round(DLSCalculator("T20").calculate_par_score_second_innings_interrupted(20.0, 180, 20.0, 8.2, 3, 14.0))
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["par_score"], expected)
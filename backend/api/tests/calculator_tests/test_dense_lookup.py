@@ -0,0 +1,45 @@
+import numpy as np
+from django.test import SimpleTestCase
+from calculators.dls_calculator import DLSCalculator
+from calculators.resource_table import RESOURCE_DATA, WICKET_COLUMNS
+
+
+class DenseLookupParityTests(SimpleTestCase):
+
+    def test_dense_lookup_matches_interpolation(self):
+        """
+        Every (balls, wickets) pair matches np.interp over the tabulated points.
+        """
+        for match_type, data in RESOURCE_DATA.items():
+            calculator = DLSCalculator(match_type)
+            reversed_balls = data["balls"][::-1]
+            max_balls = data["balls"][0]
+
+            for wickets_lost, column in enumerate(WICKET_COLUMNS):
+                reversed_resources = data[column][::-1]
+                for balls_remaining in range(-6, max_balls + 7):
+                    expected = np.interp(balls_remaining, reversed_balls, reversed_resources)
+                    actual = calculator._get_resource_percentage(balls_remaining, wickets_lost)
+                    self.assertEqual(
+                        actual, expected,
+                        f"{match_type}: balls={balls_remaining}, wickets={wickets_lost}"
+                    )
+
+    def test_dense_grid_shape(self):
+        """
+        The dense grid covers 10 wicket states and every ball from 0 to the maximum.
+        """
+        self.assertEqual(DLSCalculator("T20").resource_table.dense.shape, (10, 121))
+        self.assertEqual(DLSCalculator("ODI").resource_table.dense.shape, (10, 301))
+        self.assertEqual(DLSCalculator("T10").resource_table.dense.shape, (10, 61))
+
+    def test_out_of_range_wickets(self):
+        """
+        Wicket counts outside 0-9 are rejected rather than wrapping around.
+        """
+        calculator = DLSCalculator("T20")
+
+        with self.assertRaises(KeyError):
+            calculator._get_resource_percentage(60, 10)
+        with self.assertRaises(KeyError):
+            calculator._get_resource_percentage(60, -1)
@@ -0,0 +1,61 @@
+from django.test import SimpleTestCase
+from calculators.dls_calculator import DLSCalculator
+from calculators.live_tracker import LiveParTracker
+
+
+class LiveParTrackerTests(SimpleTestCase):
+
+    def setUp(self):
+        self.calculator = DLSCalculator("T20")
+        self.tracker = LiveParTracker("T20", 20.0, 180, 20.0)
+
+    def expected_par(self, overs_used, wickets_lost):
+        return self.calculator.calculate_par_score_second_innings_cut_short(
+            overs_available_to_team_1_at_start=20.0,
+            runs_scored_by_team_1=180,
+            overs_available_to_team_2_at_start=20.0,
+            overs_used_by_team_2_during_curtailed=overs_used,
+            wickets_lost_by_team_2_during_curtailed=wickets_lost,
+        )
+
+    def test_ball_by_ball_matches_curtailed_scenario(self):
+        """
+        After every ball the par equals the SecondInningsCurtailed calculation at that point.
+        """
+        for ball in range(1, 121):
+            par_score = self.tracker.record_ball(wicket=ball % 15 == 0)
+            self.assertEqual(par_score, self.expected_par(self.tracker.overs_used, self.tracker.wickets_lost))
+
+        self.assertEqual(self.tracker.wickets_lost, 8)
+        self.assertEqual(self.tracker.overs_used, 20.0)
+
+    def test_wicket_without_legal_delivery(self):
+        self.tracker.update(overs_used=10.3)
+        par_score = self.tracker.record_wicket()
+
+        self.assertEqual(self.tracker.balls_used, 63)
+        self.assertEqual(par_score, self.expected_par(10.3, 1))
+
+    def test_update_sets_state(self):
+        par_score = self.tracker.update(overs_used=12.4, wickets_lost=3)
+
+        self.assertEqual(par_score, self.expected_par(12.4, 3))
+
+    def test_no_balls_remaining(self):
+        self.tracker.update(overs_used=20.0)
+
+        with self.assertRaises(ValueError):
+            self.tracker.record_ball()
+
+    def test_too_many_wickets(self):
+        self.tracker.update(wickets_lost=9)
+
+        with self.assertRaises(ValueError):
+            self.tracker.record_wicket()
+        with self.assertRaises(ValueError):
+            self.tracker.record_ball(wicket=True)
+        self.assertEqual(self.tracker.balls_used, 0)
+
+    def test_update_rejects_overs_beyond_innings(self):
+        with self.assertRaises(ValueError):
+            self.tracker.update(overs_used=20.1)
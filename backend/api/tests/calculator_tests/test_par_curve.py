@@ -0,0 +1,39 @@
+from django.test import SimpleTestCase
+from calculators.dls_calculator import DLSCalculator
+
+
+class ParCurveTests(SimpleTestCase):
+
+    def setUp(self):
+        self.calculator = DLSCalculator("T20")
+
+    @staticmethod
+    def balls_to_overs(balls):
+        return balls // 6 + (balls % 6) / 10
+
+    def test_every_entry_matches_curtailed_scenario(self):
+        par_curve = self.calculator.calculate_par_curve(20.0, 180, 18.0)
+
+        self.assertEqual(par_curve.shape, (10, 109))
+        for wickets_lost in range(10):
+            for balls_used in range(109):
+                self.assertEqual(
+                    par_curve[wickets_lost, balls_used],
+                    self.calculator.calculate_par_score_second_innings_cut_short(
+                        20.0, 180, 18.0, self.balls_to_overs(balls_used), wickets_lost
+                    )
+                )
+
+    def test_interruption_uses_revised_innings(self):
+        par_curve = self.calculator.calculate_par_curve(20.0, 180, 20.0, 5.0, 2, 12.0)
+
+        self.assertEqual(par_curve.shape, (10, 73))
+        # Before the interruption the original innings applies
+        self.assertEqual(
+            par_curve[1, 24],
+            self.calculator.calculate_par_score_second_innings_cut_short(20.0, 180, 20.0, 4.0, 1)
+        )
+        # At the end of the revised innings every wicket count gives the interrupted par
+        expected = self.calculator.calculate_par_score_second_innings_interrupted(20.0, 180, 20.0, 5.0, 2, 12.0)
+        for wickets_lost in range(10):
+            self.assertAlmostEqual(par_curve[wickets_lost, 72], expected)
@@ -0,0 +1,59 @@
+import numpy as np
+from django.test import SimpleTestCase
+from calculators.dls_calculator import DLSCalculator
+from calculators.resource_table import RESOURCE_DATA
+
+
+class PrecomputedIndexTests(SimpleTestCase):
+
+    def test_resource_ratio_matches_lookups(self):
+        """
+        Every ratio entry equals the ratio of the two full-innings resources.
+        """
+        for match_type in RESOURCE_DATA:
+            calculator = DLSCalculator(match_type)
+            max_balls = calculator.resource_table.max_balls
+            for team_one_balls in range(1, max_balls + 1):
+                team_one_resource = calculator._get_resource_percentage(team_one_balls, 0)
+                for team_two_balls in range(0, max_balls + 1, 7):
+                    team_two_resource = calculator._get_resource_percentage(team_two_balls, 0)
+                    self.assertEqual(
+                        calculator.resource_table.resource_ratio[team_one_balls, team_two_balls],
+                        team_two_resource / team_one_resource
+                    )
+
+    def test_resource_used_matches_lookups(self):
+        """
+        Every resource-used entry equals the difference of the two lookups.
+        """
+        calculator = DLSCalculator("ODI")
+        for wickets_lost in range(10):
+            for balls_available in range(0, 301, 5):
+                initially = calculator._get_resource_percentage(balls_available, 0)
+                for balls_remaining in range(0, balls_available + 1, 3):
+                    remaining = calculator._get_resource_percentage(balls_remaining, wickets_lost)
+                    self.assertEqual(
+                        calculator._get_resource_used(balls_available, balls_remaining, wickets_lost),
+                        initially - remaining
+                    )
+
+    def test_delayed_par_score_unchanged(self):
+        """
+        Delayed-start targets match the direct resource calculation.
+        """
+        calculator = DLSCalculator("T20")
+        for overs in np.arange(1, 20.1, 0.1):
+            overs = round(float(overs), 1)
+            expected = 180 * (
+                calculator._get_resource_percentage(calculator._convert_overs_to_balls(overs), 0) /
+                calculator._get_resource_percentage(120, 0)
+            )
+            self.assertEqual(calculator.calculate_par_score_second_innings_delayed(20, 180, overs), expected)
+
+    def test_indexes_are_read_only(self):
+        table = DLSCalculator("T10").resource_table
+
+        with self.assertRaises(ValueError):
+            table.resource_ratio[0, 0] = 1
+        with self.assertRaises(ValueError):
+            table.resource_used[0, 0, 0] = 1
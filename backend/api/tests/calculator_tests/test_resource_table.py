@@ -0,0 +1,40 @@
+from django.test import SimpleTestCase
+from calculators.dls_calculator import DLSCalculator
+from calculators.resource_table import RESOURCE_DATA, get_resource_table
+
+
+class ResourceTableRegistryTests(SimpleTestCase):
+
+    def test_calculators_share_compiled_table(self):
+        """
+        Calculators for the same format reuse one precompiled table.
+        """
+        self.assertIs(DLSCalculator("ODI").resource_table, DLSCalculator("ODI").resource_table)
+        self.assertIs(DLSCalculator("T20").resource_table, get_resource_table("T20"))
+
+    def test_compiled_arrays_are_read_only(self):
+        """
+        Shared arrays cannot be modified by a calculator.
+        """
+        table = get_resource_table("T20")
+
+        with self.assertRaises(ValueError):
+            table.balls[0] = 1
+        with self.assertRaises(ValueError):
+            table.resources[0, 0] = 1
+
+    def test_compiled_arrays_are_pre_reversed(self):
+        """
+        Balls and wicket columns are stored in ascending ball order.
+        """
+        for match_type, data in RESOURCE_DATA.items():
+            table = get_resource_table(match_type)
+            self.assertEqual(table.balls.tolist(), data["balls"][::-1])
+            self.assertEqual(table.resources[4].tolist(), data["4"][::-1])
+
+    def test_unknown_match_type(self):
+        """
+        Unknown formats raise a KeyError, as before.
+        """
+        with self.assertRaises(KeyError):
+            DLSCalculator("Test")
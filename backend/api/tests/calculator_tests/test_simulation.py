@@ -0,0 +1,88 @@
+import csv
+import os
+import tempfile
+import numpy as np
+from django.test import SimpleTestCase
+from api.validators import SCENARIO_RULES
+from calculators.dls_calculator import DLSCalculator
+from calculators.simulation import (
+    SCENARIO_METHODS, MonteCarloSimulator, ScoreDistribution, generate_scenarios, simulate_chunk
+)
+
+
+class ScenarioGenerationTests(SimpleTestCase):
+
+    def test_generated_matches_satisfy_the_scenario_rules(self):
+        rng = np.random.default_rng(7)
+        for match_type in ["ODI", "T20", "T10"]:
+            for scenario, rule in SCENARIO_RULES.items():
+                columns = generate_scenarios(scenario, match_type, 500, rng)
+                self.assertEqual(set(columns), set(rule.required_inputs))
+                for index in range(500):
+                    inputs = {field: values[index].item() for field, values in columns.items()}
+                    self.assertEqual(rule.validator(inputs), {}, (match_type, scenario, inputs))
+
+    def test_chunks_match_the_scalar_calculator(self):
+        calculator = DLSCalculator("T20")
+        for scenario, method_name in SCENARIO_METHODS.items():
+            _, columns, rows = simulate_chunk(("T20", scenario, 50, np.random.SeedSequence(3), (0.7, 1.7), True))
+            scalar_method = getattr(calculator, method_name.removesuffix("_many"))
+            for index in range(50):
+                inputs = {field: values[index].item() for field, values in columns.items()}
+                self.assertEqual(columns["par_score"][index], round(scalar_method(**inputs)))
+            np.testing.assert_array_equal(columns["revised_target"], columns["par_score"] + 1)
+            self.assertEqual(len(rows.splitlines()), 50)
+
+
+class ScoreDistributionTests(SimpleTestCase):
+
+    def test_summary_of_chunked_updates(self):
+        scores = np.arange(1, 101)
+        distribution = ScoreDistribution()
+        distribution.update(scores[:30])
+        distribution.update(scores[30:])
+
+        summary = distribution.summary(percentiles=(50, 95))
+
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["mean"], scores.mean())
+        self.assertAlmostEqual(summary["std"], scores.std())
+        self.assertEqual((summary["min"], summary["max"]), (1, 100))
+        self.assertEqual((summary["p50"], summary["p95"]), (50, 95))
+
+    def test_empty_summary(self):
+        self.assertEqual(ScoreDistribution().summary(), {"count": 0})
+
+
+class MonteCarloSimulatorTests(SimpleTestCase):
+
+    def test_results_are_reproducible_across_chunkings_and_workers(self):
+        serial = MonteCarloSimulator("T10", size=1000, chunk_size=300, seed=11).run()
+        parallel = MonteCarloSimulator("T10", size=1000, chunk_size=300, seed=11, workers=2).run()
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(set(serial), set(SCENARIO_METHODS))
+        self.assertEqual(serial["SecondInningsDelayed"]["par_score"]["count"], 1000)
+
+    def test_results_are_streamed_to_csv(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            summary = MonteCarloSimulator(
+                "ODI", scenarios=["SecondInningsInterrupted"], size=250, chunk_size=100, seed=5
+            ).run(output_dir)
+
+            self.assertEqual(os.listdir(output_dir), ["ODI_SecondInningsInterrupted.csv"])
+            with open(os.path.join(output_dir, "ODI_SecondInningsInterrupted.csv")) as output:
+                rows = list(csv.DictReader(output))
+
+        self.assertEqual(len(rows), 250)
+        self.assertEqual(
+            list(rows[0]),
+            SCENARIO_RULES["SecondInningsInterrupted"].required_inputs + ["par_score", "revised_target"],
+        )
+        par_scores = [int(row["par_score"]) for row in rows]
+        self.assertEqual(summary["SecondInningsInterrupted"]["par_score"]["max"], max(par_scores))
+        self.assertEqual(summary["SecondInningsInterrupted"]["revised_target"]["min"], min(par_scores) + 1)
+
+    def test_unknown_scenario(self):
+        with self.assertRaises(ValueError):
+            MonteCarloSimulator("T20", scenarios=["RainedOff"])
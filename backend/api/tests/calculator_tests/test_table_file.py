@@ -0,0 +1,173 @@
+import csv
+import json
+import os
+import tempfile
+import numpy as np
+from django.conf import settings
+from django.test import SimpleTestCase
+from calculators.dls_calculator import DLSCalculator
+from calculators.resource_table import (
+    RESOURCE_DATA, RESOURCE_TABLES, TABLE_FILES, WICKET_COLUMNS, ResourceTable, get_resource_table,
+    register_table_file
+)
+from calculators.table_file import (
+    INTERPOLATIONS, expand_to_balls, open_table_file, read_table_header, read_table_source, write_table_file
+)
+from calculators.table_provider import validate_resource_table
+
+
+class TableFileTests(SimpleTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "odi-2024.dlstable")
+        write_table_file(self.path, "ODI-2024", "ODI", expand_to_balls(RESOURCE_DATA["ODI"], WICKET_COLUMNS))
+
+    def tearDown(self):
+        TABLE_FILES.pop("ODI-2024", None)
+        RESOURCE_TABLES.pop("ODI-2024", None)
+
+    def test_header_round_trip(self):
+        header, resources = open_table_file(self.path)
+
+        self.assertEqual((header.name, header.match_type, header.max_balls, header.wickets), ("ODI-2024", "ODI", 300, 10))
+        self.assertIsInstance(resources, np.memmap)
+        self.assertEqual(resources.dtype, np.float32)
+        self.assertFalse(resources.flags.writeable)
+        np.testing.assert_allclose(resources, get_resource_table("ODI").dense, atol=1e-4)
+
+    def test_table_is_selected_by_name(self):
+        self.assertEqual(register_table_file(self.path), "ODI-2024")
+        table = get_resource_table("ODI-2024")
+
+        self.assertIs(table, get_resource_table("ODI-2024"))
+        self.assertEqual((table.name, table.match_type, table.max_balls), ("ODI-2024", "ODI", 300))
+        self.assertIsInstance(table.dense, np.memmap)
+
+    def test_calculator_results_match_the_bundled_table(self):
+        register_table_file(self.path)
+        bundled, mapped = DLSCalculator("ODI"), DLSCalculator("ODI-2024")
+        inputs = {
+            "overs_available_to_team_1_at_start": 50.0,
+            "runs_scored_by_team_1": 287,
+            "overs_available_to_team_2_at_start": 50.0,
+            "overs_used_by_team_2_during_interruption": 23.4,
+            "wickets_lost_by_team_2_during_interruption": 4,
+            "revised_overs_to_team_2_after_resumption": 41.0,
+        }
+
+        self.assertAlmostEqual(
+            mapped.calculate_par_score_second_innings_interrupted(**inputs),
+            bundled.calculate_par_score_second_innings_interrupted(**inputs),
+            places=3,
+        )
+        np.testing.assert_allclose(
+            mapped.calculate_par_score_second_innings_interrupted_many(**{key: [value] * 3 for key, value in inputs.items()}),
+            bundled.calculate_par_score_second_innings_interrupted_many(**{key: [value] * 3 for key, value in inputs.items()}),
+            atol=1e-3,
+        )
+
+    def test_from_file(self):
+        table = ResourceTable.from_file(self.path)
+        self.assertEqual(table.name, "ODI-2024")
+        self.assertIn("ODI-2024", TABLE_FILES)
+
+    def test_invalid_files_are_rejected(self):
+        with open(self.path, "r+b") as file:
+            file.write(b"NOTATABL")
+        with self.assertRaises(ValueError):
+            read_table_header(self.path)
+
+        write_table_file(self.path, "ODI-2024", "ODI", np.zeros((10, 301)))
+        with open(self.path, "ab") as file:
+            file.write(b"\0")
+        with self.assertRaises(ValueError):
+            read_table_header(self.path)
+
+    def test_bundled_names_are_reserved(self):
+        write_table_file(self.path, "T20", "T20", expand_to_balls(RESOURCE_DATA["T20"], WICKET_COLUMNS))
+        with self.assertRaises(ValueError):
+            register_table_file(self.path)
+
+    def test_unknown_table(self):
+        with self.assertRaises(KeyError):
+            get_resource_table("ODI-1999")
+
+
+class TableSourceTests(SimpleTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_legacy_csv_round_trip(self):
+        path = os.path.join(self.directory, "t20-legacy.dlstable")
+        data = read_table_source(str(settings.BASE_DIR.parent / "dls_resource_data_for_t20s.csv"), WICKET_COLUMNS)
+
+        write_table_file(path, "T20-legacy", "T20", expand_to_balls(data, WICKET_COLUMNS))
+        header, resources = open_table_file(path)
+
+        self.assertEqual((header.match_type, header.max_balls), ("T20", 120))
+        np.testing.assert_allclose(resources, get_resource_table("T20").dense, atol=1e-4)
+
+    def test_csv_and_json_sources_agree(self):
+        csv_path = os.path.join(self.directory, "odi.csv")
+        json_path = os.path.join(self.directory, "odi.json")
+        data = RESOURCE_DATA["ODI"]
+        with open(csv_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["balls", *WICKET_COLUMNS])
+            writer.writerows(zip(*(data[column] for column in ["balls", *WICKET_COLUMNS])))
+        with open(json_path, "w") as file:
+            json.dump(data, file)
+
+        self.assertEqual(read_table_source(csv_path, WICKET_COLUMNS), read_table_source(json_path, WICKET_COLUMNS))
+
+    def test_missing_column(self):
+        path = os.path.join(self.directory, "partial.csv")
+        with open(path, "w") as file:
+            file.write("balls,0,1\n120,100,96.8\n")
+
+        with self.assertRaises(ValueError):
+            read_table_source(path, WICKET_COLUMNS)
+
+
+class InterpolationTests(SimpleTestCase):
+
+    def test_tabulated_points_are_kept(self):
+        for interpolation in INTERPOLATIONS:
+            for match_type, data in RESOURCE_DATA.items():
+                with self.subTest(interpolation=interpolation, match_type=match_type):
+                    resources = expand_to_balls(data, WICKET_COLUMNS, interpolation)
+                    tabulated = np.array([data[column] for column in WICKET_COLUMNS])
+                    np.testing.assert_array_equal(resources[:, data["balls"]], tabulated)
+
+    def test_monotone_cubic_tables_are_valid(self):
+        for match_type in RESOURCE_DATA:
+            with self.subTest(match_type=match_type):
+                table = ResourceTable(match_type, "pchip")
+                validate_resource_table(table)
+                self.assertFalse(np.array_equal(table.dense, get_resource_table(match_type).dense))
+
+    def test_monotone_cubic_does_not_overshoot(self):
+        data = {"balls": [0, 6, 12, 18, 24], "0": [0, 10, 10, 10, 40]}
+        resources = expand_to_balls(data, ["0"], "pchip")[0]
+
+        np.testing.assert_array_equal(resources[6:19], 10)
+        self.assertTrue((np.diff(resources) >= 0).all())
+
+    def test_monotone_cubic_is_exact_for_linear_data(self):
+        data = {"balls": [0, 6, 12, 18], "0": [0, 3, 6, 9]}
+        np.testing.assert_allclose(expand_to_balls(data, ["0"], "pchip")[0], np.arange(19) / 2)
+
+    def test_ball_level_tables_are_stored_as_is(self):
+        balls = list(range(61))
+        data = {"balls": balls, "0": [100 * (1 - (1 - ball / 60) ** 2) for ball in balls]}
+        for interpolation in INTERPOLATIONS:
+            np.testing.assert_array_equal(expand_to_balls(data, ["0"], interpolation)[0], data["0"])
+
+    def test_unknown_interpolation(self):
+        with self.assertRaises(ValueError):
+            expand_to_balls(RESOURCE_DATA["T20"], WICKET_COLUMNS, "spline")
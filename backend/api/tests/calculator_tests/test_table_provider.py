@@ -0,0 +1,166 @@
+import json
+import os
+import tempfile
+from unittest.mock import patch
+import numpy as np
+from django.test import SimpleTestCase
+from calculators.resource_table import RESOURCE_DATA, RESOURCE_TABLES, WICKET_COLUMNS, ResourceTable
+from calculators.table_file import expand_to_balls, write_table_file
+from calculators.table_provider import (
+    ACTIVE_VERSIONS_FILE, BundledTableProvider, ResourceTableProvider, ResourceTableRegistry, TableFileProvider,
+    validate_resource_table
+)
+
+
+def write_scaled_table(directory, name, scale, match_type="ODI"):
+    path = os.path.join(directory, f"{name}.dlstable")
+    write_table_file(path, name, match_type, expand_to_balls(RESOURCE_DATA[match_type], WICKET_COLUMNS) * scale)
+    return path
+
+
+class ValidateResourceTableTests(SimpleTestCase):
+
+    def test_bundled_tables_are_valid(self):
+        for match_type in RESOURCE_DATA:
+            validate_resource_table(RESOURCE_TABLES[match_type])
+
+    def test_invalid_tables_are_rejected(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        resources = expand_to_balls(RESOURCE_DATA["T10"], WICKET_COLUMNS)
+        increasing = resources.copy()
+        increasing[3, 30] = increasing[3, 31] + 1
+        cases = {
+            "outside 0 to 100": resources * 2,
+            "no balls remaining": np.minimum(resources + 1, 100),
+            "as balls run out": increasing,
+            "as wickets fall": resources[::-1],
+        }
+        for problem, data in cases.items():
+            with self.subTest(problem):
+                path = os.path.join(directory.name, "bad.dlstable")
+                write_table_file(path, "bad", "T10", data)
+                with self.assertRaisesRegex(ValueError, problem):
+                    validate_resource_table(ResourceTable.from_file(path))
+
+
+class ResourceTableRegistryTests(SimpleTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        write_scaled_table(self.directory, "ODI-2024", 0.9)
+
+    def registry(self, check_interval=0):
+        return ResourceTableRegistry(
+            [BundledTableProvider(), TableFileProvider(self.directory)],
+            directory=self.directory,
+            check_interval=check_interval,
+        )
+
+    def test_versions_are_loaded_and_standard_is_active(self):
+        registry = self.registry()
+
+        self.assertEqual(registry.versions()["ODI"], ["ODI-2024", "standard"])
+        self.assertEqual(registry.active_version("ODI"), "standard")
+        self.assertIs(registry.get("ODI"), RESOURCE_TABLES["ODI"])
+        self.assertEqual(registry.get("ODI", "ODI-2024").name, "ODI-2024")
+        self.assertTrue(registry.has_version("ODI", "ODI-2024"))
+        self.assertFalse(registry.has_version("T20", "ODI-2024"))
+
+    def test_activate_swaps_the_active_table(self):
+        registry = self.registry()
+        standard = registry.get("ODI")
+
+        registry.activate("ODI", "ODI-2024")
+
+        self.assertEqual(registry.get("ODI").name, "ODI-2024")
+        self.assertIs(registry.get("ODI", "standard"), standard)
+        self.assertIs(registry.get("T20"), RESOURCE_TABLES["T20"])
+        with self.assertRaises(KeyError):
+            registry.activate("ODI", "ODI-2030")
+
+    def test_active_versions_file_is_picked_up_when_polling(self):
+        registry = self.registry(check_interval=1)
+        with open(os.path.join(self.directory, ACTIVE_VERSIONS_FILE), "w") as file:
+            json.dump({"ODI": "ODI-2024"}, file)
+
+        self.assertEqual(registry.active_version("ODI"), "standard")
+        with patch("calculators.table_provider.time.monotonic", return_value=registry._next_check):
+            self.assertEqual(registry.active_version("ODI"), "ODI-2024")
+
+    def test_unchanged_tables_are_reused_on_reload(self):
+        registry = self.registry()
+        table = registry.get("ODI", "ODI-2024")
+        table.resource_ratio
+
+        write_scaled_table(self.directory, "ODI-2025", 0.8)
+        registry.reload()
+
+        self.assertIs(registry.get("ODI", "ODI-2024"), table)
+        self.assertIn("resource_ratio", vars(table))
+        self.assertEqual(registry.versions()["ODI"], ["ODI-2024", "ODI-2025", "standard"])
+
+    def test_invalid_table_leaves_the_registry_unchanged(self):
+        registry = self.registry()
+        broken = ResourceTable.from_file(write_scaled_table(self.directory, "ODI-broken", 2.0))
+
+        class BrokenProvider(ResourceTableProvider):
+            def load(self):
+                return {("ODI", "ODI-broken"): broken}
+
+        registry.providers.append(BrokenProvider())
+        with self.assertRaises(ValueError):
+            registry.reload()
+
+        self.assertEqual(registry.versions()["ODI"], ["ODI-2024", "standard"])
+
+    def test_invalid_table_files_are_skipped(self):
+        write_scaled_table(self.directory, "ODI-broken", 2.0)
+        with open(os.path.join(self.directory, "garbage.dlstable"), "wb") as file:
+            file.write(b"not a table")
+
+        with self.assertLogs("calculators.table_provider", "WARNING") as logs:
+            registry = self.registry()
+
+        self.assertEqual(registry.versions()["ODI"], ["ODI-2024", "standard"])
+        self.assertEqual(len(logs.records), 2)
+
+    def test_unknown_active_version_keeps_the_previous_one(self):
+        with open(os.path.join(self.directory, ACTIVE_VERSIONS_FILE), "w") as file:
+            json.dump({"ODI": "ODI-1999"}, file)
+
+        with self.assertLogs("calculators.table_provider", "WARNING"):
+            registry = self.registry()
+        self.assertEqual(registry.active_version("ODI"), "standard")
+
+        registry.activate("ODI", "ODI-2024")
+        with self.assertLogs("calculators.table_provider", "WARNING"):
+            registry.reload()
+        self.assertEqual(registry.active_version("ODI"), "ODI-2024")
+
+    def test_unreadable_active_versions_file_is_ignored(self):
+        with open(os.path.join(self.directory, ACTIVE_VERSIONS_FILE), "w") as file:
+            file.write("{")
+
+        with self.assertLogs("calculators.table_provider", "WARNING"):
+            registry = self.registry()
+
+        self.assertEqual(registry.active_version("ODI"), "standard")
+
+    def test_running_calculations_keep_their_table(self):
+        registry = self.registry()
+        table = registry.get("ODI")
+        registry.activate("ODI", "ODI-2024")
+
+        np.testing.assert_array_equal(table.dense, RESOURCE_TABLES["ODI"].dense)
+        self.assertIsNot(registry.get("ODI"), table)
+
+    def test_provider_must_implement_load(self):
+        class SignatureOnlyProvider(ResourceTableProvider):
+            def signature(self):
+                return 1
+
+        with self.assertRaises(TypeError):
+            SignatureOnlyProvider()
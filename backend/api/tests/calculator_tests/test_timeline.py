@@ -0,0 +1,109 @@
+import numpy as np
+from django.test import SimpleTestCase
+from calculators.dls_calculator import DLSCalculator
+from calculators.timeline import Interruption, MatchTimeline, calculate_timelines_many
+
+
+class MatchTimelineTests(SimpleTestCase):
+
+    def setUp(self):
+        self.calculator = DLSCalculator("ODI")
+
+    def test_no_interruptions_matches_delayed_scenario(self):
+        timeline = MatchTimeline("ODI", 50.0, 287, 45.0)
+
+        self.assertEqual(timeline.par_score, self.calculator.calculate_par_score_second_innings_delayed(50.0, 287, 45.0))
+
+    def test_single_interruption_matches_scenarios(self):
+        step = MatchTimeline("ODI", 50.0, 287, 50.0).add_interruption(2, 23.4, 4, 41.0)
+        self.assertEqual(
+            step.par_score,
+            self.calculator.calculate_par_score_second_innings_interrupted(50.0, 287, 50.0, 23.4, 4, 41.0),
+        )
+
+        step = MatchTimeline("ODI", 50.0, 250, 45.0).add_interruption(1, 30.0, 3, 45.0)
+        self.assertEqual(
+            step.par_score,
+            self.calculator.calculate_par_score_first_innings_interrupted(50.0, 3, 30.0, 45.0, 250, 45.0),
+        )
+
+    def test_resource_losses_accumulate(self):
+        timeline = MatchTimeline("ODI", 50.0, 287, 50.0)
+        first = timeline.add_interruption(2, 10.0, 1, 45.0)
+        second = timeline.add_interruption(2, 25.0, 3, 38.0)
+
+        # The second stoppage starts from the 45 overs left by the first
+        expected_loss = (
+            self.calculator._get_resource_percentage(45 * 6 - 25 * 6, 3)
+            - self.calculator._get_resource_percentage(38 * 6 - 25 * 6, 3)
+        )
+        self.assertAlmostEqual(first.team_two_resource - second.team_two_resource, expected_loss)
+        self.assertLess(second.par_score, first.par_score)
+        self.assertEqual(second.revised_target, round(second.par_score) + 1)
+        self.assertEqual(timeline.steps, [first, second])
+
+    def test_interruptions_must_follow_each_other(self):
+        cases = [
+            [Interruption(3, 10.0, 1, 40.0)],
+            [Interruption(2, 10.0, 1, 40.0), Interruption(1, 20.0, 2, 40.0)],
+            [Interruption(2, 20.0, 3, 40.0), Interruption(2, 15.0, 3, 35.0)],
+            [Interruption(2, 20.0, 3, 40.0), Interruption(2, 25.0, 2, 35.0)],
+            [Interruption(2, 20.0, 3, 40.0), Interruption(2, 42.0, 5, 45.0)],
+            [Interruption(1, 20.0, 3, 19.0)],
+            [Interruption(1, 20.0, 10, 40.0)],
+        ]
+        for interruptions in cases:
+            with self.subTest(interruptions=interruptions):
+                with self.assertRaises(ValueError):
+                    MatchTimeline("ODI", 50.0, 287, 50.0).run(interruptions)
+
+
+class CalculateTimelinesManyTests(SimpleTestCase):
+
+    timelines = [
+        (50.0, 250, 40.0, [
+            Interruption(1, 20.0, 2, 45.0),
+            Interruption(1, 35.2, 5, 40.0),
+            Interruption(2, 10.0, 1, 36.0),
+            Interruption(2, 25.0, 4, 30.0),
+        ]),
+        (50.0, 287, 50.0, [Interruption(2, 10.0, 1, 36.0), Interruption(2, 30.0, 6, 33.0)]),
+        (45.0, 201, 45.0, []),
+        (50.0, 310, 50.0, [Interruption(1, 41.3, 7, 46.0)]),
+    ]
+
+    def columns(self, timelines):
+        width = max(len(interruptions) for *_, interruptions in timelines)
+        padding = Interruption(0, 0.0, 0, 0.0)
+        rows = [interruptions + [padding] * (width - len(interruptions)) for *_, interruptions in timelines]
+        return {
+            field: [[getattr(interruption, field) for interruption in row] for row in rows]
+            for field in ["innings", "overs_used", "wickets_lost", "revised_overs"]
+        }
+
+    def test_matches_single_timelines(self):
+        par_scores = calculate_timelines_many(
+            "ODI",
+            [timeline[0] for timeline in self.timelines],
+            [timeline[1] for timeline in self.timelines],
+            [timeline[2] for timeline in self.timelines],
+            **self.columns(self.timelines),
+        )
+
+        self.assertEqual(par_scores.shape, (4, 4))
+        for row, (team_one_overs, runs, team_two_overs, interruptions) in zip(par_scores, self.timelines):
+            steps = MatchTimeline("ODI", team_one_overs, runs, team_two_overs).run(interruptions)
+            expected = [step.par_score for step in steps] + [np.nan] * (4 - len(steps))
+            np.testing.assert_allclose(row, expected, rtol=1e-12)
+
+    def test_invalid_timeline_is_rejected(self):
+        timelines = self.timelines[:1] + [(50.0, 287, 50.0, [Interruption(2, 20.0, 3, 40.0), Interruption(1, 5.0, 0, 45.0)])]
+
+        with self.assertRaisesRegex(ValueError, "match 1"):
+            calculate_timelines_many(
+                "ODI",
+                [timeline[0] for timeline in timelines],
+                [timeline[1] for timeline in timelines],
+                [timeline[2] for timeline in timelines],
+                **self.columns(timelines),
+            )
@@ -0,0 +1,94 @@
+import numpy as np
+from django.test import SimpleTestCase
+from calculators.dls_calculator import DLSCalculator
+
+
+class VectorizedCalculatorParityTests(SimpleTestCase):
+
+    size = 2000
+
+    def setUp(self):
+        rng = np.random.default_rng(2023)
+        self.calculator = DLSCalculator("ODI")
+        self.columns = {
+            "overs_available_to_team_1_at_start": rng.integers(0, 51, self.size) + rng.integers(0, 6, self.size) / 10,
+            "overs_available_to_team_2_at_start": rng.integers(0, 50, self.size) + rng.integers(0, 6, self.size) / 10,
+            "runs_scored_by_team_1": rng.integers(0, 400, self.size),
+            "overs_used_by_team_1_during_curtailed": rng.integers(0, 50, self.size) + rng.integers(0, 6, self.size) / 10,
+            "overs_used_by_team_1_during_interruption": rng.integers(0, 50, self.size) + rng.integers(0, 6, self.size) / 10,
+            "revised_overs_to_team_1_after_resumption": rng.integers(0, 50, self.size) + rng.integers(0, 6, self.size) / 10,
+            "overs_used_by_team_2_during_curtailed": rng.integers(0, 50, self.size) + rng.integers(0, 6, self.size) / 10,
+            "overs_used_by_team_2_during_interruption": rng.integers(0, 50, self.size) + rng.integers(0, 6, self.size) / 10,
+            "revised_overs_to_team_2_after_resumption": rng.integers(0, 50, self.size) + rng.integers(0, 6, self.size) / 10,
+            "wickets_lost_by_team_1_during_curtailed": rng.integers(0, 10, self.size),
+            "wickets_lost_by_team_1_during_interruption": rng.integers(0, 10, self.size),
+            "wickets_lost_by_team_2_during_curtailed": rng.integers(0, 10, self.size),
+            "wickets_lost_by_team_2_during_interruption": rng.integers(0, 10, self.size),
+        }
+
+    def assert_parity(self, method_name):
+        vectorized = getattr(self.calculator, f"{method_name}_many")(**self.columns)
+        scalar_method = getattr(self.calculator, method_name)
+
+        self.assertEqual(vectorized.shape, (self.size,))
+        for index in range(self.size):
+            row = {key: values[index].item() for key, values in self.columns.items()}
+            with np.errstate(divide='ignore', invalid='ignore'):
+                expected = scalar_method(**row)
+            if np.isnan(expected):
+                self.assertTrue(np.isnan(vectorized[index]))
+            else:
+                self.assertEqual(vectorized[index], expected, f"{method_name}: {row}")
+
+    def test_first_innings_cut_short(self):
+        self.assert_parity("calculate_par_score_first_innings_cut_short")
+
+    def test_first_innings_interrupted(self):
+        self.assert_parity("calculate_par_score_first_innings_interrupted")
+
+    def test_second_innings_cut_short(self):
+        self.assert_parity("calculate_par_score_second_innings_cut_short")
+
+    def test_second_innings_delayed(self):
+        self.assert_parity("calculate_par_score_second_innings_delayed")
+
+    def test_second_innings_interrupted(self):
+        self.assert_parity("calculate_par_score_second_innings_interrupted")
+
+    def test_scalars_broadcast_against_arrays(self):
+        """
+        Scalar inputs broadcast against array inputs.
+        """
+        par_scores = self.calculator.calculate_par_score_second_innings_delayed_many(
+            overs_available_to_team_1_at_start=50,
+            runs_scored_by_team_1=280,
+            overs_available_to_team_2_at_start=np.array([50, 45, 40]),
+        )
+
+        self.assertEqual(par_scores[0], 280)
+        self.assertEqual(
+            par_scores[2],
+            self.calculator.calculate_par_score_second_innings_delayed(50, 280, 40)
+        )
+
+    def test_overs_to_balls_conversion(self):
+        """
+        Vectorized overs conversion matches the scalar conversion.
+        """
+        overs = np.array([0, 0.1, 0.5, 10.3, 19.5, 49.9, 20.0])
+        expected = [DLSCalculator._convert_overs_to_balls(value) for value in overs.tolist()]
+
+        self.assertEqual(DLSCalculator._convert_overs_to_balls_many(overs).tolist(), expected)
+
+    def test_out_of_range_wickets(self):
+        """
+        Wicket counts outside 0-9 raise a KeyError, as in the scalar method.
+        """
+        with self.assertRaises(KeyError):
+            self.calculator.calculate_par_score_second_innings_cut_short_many(
+                overs_available_to_team_1_at_start=50,
+                runs_scored_by_team_1=250,
+                overs_available_to_team_2_at_start=50,
+                overs_used_by_team_2_during_curtailed=np.array([20, 30]),
+                wickets_lost_by_team_2_during_curtailed=np.array([3, 10]),
+            )
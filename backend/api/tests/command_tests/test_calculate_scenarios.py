@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+import os
+import tempfile
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+from api.enums import DLSScenarioEnum
+from api.services import dls_service
+
+
+CSV_HEADER = (
+    "scenario_type,match_format,overs_available_to_team_1_at_start,runs_scored_by_team_1,"
+    "overs_available_to_team_2_at_start,overs_used_by_team_2_during_interruption,"
+    "wickets_lost_by_team_2_during_interruption,revised_overs_to_team_2_after_resumption\n"
+)
+
+
+class CalculateScenariosCommandTests(SimpleTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write(self, name, content):
+        with open(self.path(name), "w") as file:
+            file.write(content)
+        return self.path(name)
+
+    def run_command(self, *args, **options):
+        stderr = io.StringIO()
+        call_command("calculate_scenarios", *args, stderr=stderr, **options)
+        return stderr.getvalue()
+
+    def expected_par_score(self, scenario, match_format, **inputs):
+        return dls_service._calculate({"scenario_type": scenario, "match_format": match_format, "inputs": inputs})
+
+    def test_csv_results_are_written_in_input_order(self):
+        rows = [
+            ("SecondInningsInterrupted", "ODI", 50, 250 + index, 50, f"{10 + index % 20}.2", index % 10, 45)
+            for index in range(120)
+        ]
+        source = self.write("scenarios.csv", CSV_HEADER + "".join(",".join(map(str, row)) + "\n" for row in rows))
+
+        for workers in [1, 2]:
+            report = self.run_command(source, output=self.path("results.csv"), chunk_size=25, workers=workers)
+            with open(self.path("results.csv")) as output:
+                results = list(csv.DictReader(output))
+
+            self.assertIn("120 rows in", report)
+            self.assertEqual([int(result["index"]) for result in results], list(range(120)))
+            for row, result in zip(rows, results):
+                self.assertEqual(result["status"], "success")
+                par_score = self.expected_par_score(
+                    row[0], row[1],
+                    overs_available_to_team_1_at_start=50.0,
+                    runs_scored_by_team_1=row[3],
+                    overs_available_to_team_2_at_start=50.0,
+                    overs_used_by_team_2_during_interruption=float(row[5]),
+                    wickets_lost_by_team_2_during_interruption=row[6],
+                    revised_overs_to_team_2_after_resumption=45.0,
+                )
+                self.assertEqual(int(result["par_score"]), par_score)
+                self.assertEqual(int(result["revised_target"]), par_score + 1)
+
+    def test_jsonl_records_report_errors_in_place(self):
+        valid = {
+            "scenarioType": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+            "matchFormat": "T20",
+            "inputs": {"oversAvailableToTeam1AtStart": 20, "runsScoredByTeam1": 180, "oversAvailableToTeam2AtStart": 12},
+        }
+        lines = [
+            json.dumps(valid),
+            "{not json",
+            "",
+            json.dumps(dict(valid, inputs={"oversAvailableToTeam1AtStart": 20})),
+            json.dumps(dict(valid, scenarioType="RainedOff")),
+        ]
+        source = self.write("scenarios.jsonl", "\n".join(lines) + "\n")
+
+        self.run_command(source, output=self.path("results.jsonl"), workers=1)
+        with open(self.path("results.jsonl")) as output:
+            results = [json.loads(line) for line in output]
+
+        self.assertEqual([result["index"] for result in results], [0, 1, 2, 3])
+        self.assertEqual(results[0]["parScore"], self.expected_par_score(
+            DLSScenarioEnum.SECOND_INNINGS_DELAYED.value, "T20",
+            overs_available_to_team_1_at_start=20.0, runs_scored_by_team_1=180, overs_available_to_team_2_at_start=12.0,
+        ))
+        self.assertEqual(results[1]["status"], "error")
+        self.assertTrue(results[1]["message"].startswith("JSON parse error"))
+        self.assertEqual(
+            results[2]["errors"],
+            {"inputs": {"runsScoredByTeam1": ["This field is required."], "oversAvailableToTeam2AtStart": ["This field is required."]}},
+        )
+        self.assertIn("scenarioType", results[3]["errors"])
+
+    def test_output_format_can_differ_from_input(self):
+        source = self.write("scenarios.csv", CSV_HEADER + "SecondInningsDelayed,ODI,50,abc,40,,,\n")
+
+        self.run_command(source, output=self.path("results.jsonl"), workers=1)
+        with open(self.path("results.jsonl")) as output:
+            self.assertEqual(json.loads(output.readline()), {
+                "index": 0, "status": "error", "errors": {"inputs": {"runsScoredByTeam1": ["Must be a number."]}}
+            })
+
+    def test_unknown_input_format(self):
+        with self.assertRaises(CommandError):
+            self.run_command(self.write("scenarios.txt", ""), workers=1)
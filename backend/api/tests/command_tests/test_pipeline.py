@@ -0,0 +1,75 @@
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from django.test import SimpleTestCase
+from api.enums import DLSScenarioEnum
+from api.pipeline import chunked, guess_format, read_records, stream_results
+
+
+RECORD = json.dumps({
+    "scenarioType": DLSScenarioEnum.SECOND_INNINGS_DELAYED.value,
+    "matchFormat": "ODI",
+    "inputs": {"oversAvailableToTeam1AtStart": 50, "runsScoredByTeam1": 250, "oversAvailableToTeam2AtStart": 40},
+}) + "\n"
+
+
+class CountingLines:
+    """
+    An endless JSONL source that records how many lines have been read.
+    """
+
+    def __init__(self):
+        self.read = 0
+
+    def __iter__(self):
+        for _ in itertools.count():
+            self.read += 1
+            yield RECORD
+
+
+class StreamingPipelineTests(SimpleTestCase):
+
+    def test_input_is_read_lazily(self):
+        source = CountingLines()
+        results = stream_results(source, "jsonl", "jsonl", chunk_size=100)
+
+        for _ in range(3):
+            count, output = next(results)
+            self.assertEqual(count, 100)
+            self.assertEqual(len(output.splitlines()), 100)
+
+        self.assertEqual(source.read, 300)
+
+    def test_executor_is_held_back_by_the_consumer(self):
+        source = CountingLines()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = stream_results(source, "jsonl", "csv", chunk_size=50, executor=executor, max_in_flight=4)
+            header = next(results)
+            first = next(results)
+
+            self.assertEqual(header, (0, "index,status,par_score,revised_target,error\n"))
+            self.assertEqual(first[1].splitlines()[0], "0,success,223,224,")
+            self.assertLessEqual(source.read, 4 * 50)
+            results.close()
+
+    def test_csv_records(self):
+        lines = [
+            "scenarioType,match_format,runs_scored_by_team_1,overs_available_to_team_1_at_start\n",
+            "SecondInningsDelayed,ODI,250,50\n",
+            "\n",
+            "SecondInningsDelayed,T20,180,\n",
+        ]
+
+        self.assertEqual(list(read_records(lines, "csv")), [
+            {"scenario_type": "SecondInningsDelayed", "match_format": "ODI",
+             "inputs": {"runs_scored_by_team_1": "250", "overs_available_to_team_1_at_start": "50"}},
+            {"scenario_type": "SecondInningsDelayed", "match_format": "T20", "inputs": {"runs_scored_by_team_1": "180"}},
+        ])
+
+    def test_chunks_carry_their_start_index(self):
+        self.assertEqual(list(chunked(range(5), 2)), [(0, [0, 1]), (2, [2, 3]), (4, [4])])
+
+    def test_guess_format(self):
+        self.assertEqual(guess_format("archive/2024.CSV"), "csv")
+        self.assertEqual(guess_format("feed.ndjson"), "jsonl")
+        self.assertIsNone(guess_format("-"))
@@ -1,14 +1,33 @@
+from django.conf import settings
 from django.urls import path
-from .views import DLSScoreView, ResourceTableView, HealthCheckView, APIRootView, SwaggerSchemaView, PrivacyPolicyView
+from .async_views import AsyncDLSScoreView, AsyncHealthCheckView, AsyncResourceTableView
+from .views import (
+    DLSScoreView, DLSBatchScoreView, DLSTimelineView, ParCurveView,
+    LiveSessionView, LiveSessionDetailView, LiveSessionEventView, LiveSessionStreamView,
+    ResourceTableView, HealthCheckView, MetricsView, APIRootView, SwaggerSchemaView, PrivacyPolicyView
+)
 
 
 app_name = "api"
 
+# The async-native views of the hot endpoints, when enabled
+score_view = AsyncDLSScoreView if settings.DLS_ASYNC_VIEWS else DLSScoreView
+resource_table_view = AsyncResourceTableView if settings.DLS_ASYNC_VIEWS else ResourceTableView
+health_check_view = AsyncHealthCheckView if settings.DLS_ASYNC_VIEWS else HealthCheckView
+
 urlpatterns = [
     path("", APIRootView.as_view(), name="api_root"),
-    path("calculate-dls-score/", DLSScoreView.as_view(), name="calculate_dls_score"),
-    path("resource-table/", ResourceTableView.as_view(), name="resource_table"),
-    path("health-check/", HealthCheckView.as_view(), name="health_check"),
+    path("calculate-dls-score/", score_view.as_view(), name="calculate_dls_score"),
+    path("calculate-dls-score/batch/", DLSBatchScoreView.as_view(), name="calculate_dls_score_batch"),
+    path("calculate-dls-score/timeline/", DLSTimelineView.as_view(), name="calculate_dls_score_timeline"),
+    path("par-curve/", ParCurveView.as_view(), name="par_curve"),
+    path("live-sessions/", LiveSessionView.as_view(), name="live_sessions"),
+    path("live-sessions/<str:session_id>/", LiveSessionDetailView.as_view(), name="live_session_detail"),
+    path("live-sessions/<str:session_id>/events/", LiveSessionEventView.as_view(), name="live_session_events"),
+    path("live-sessions/<str:session_id>/stream/", LiveSessionStreamView.as_view(), name="live_session_stream"),
+    path("resource-table/", resource_table_view.as_view(), name="resource_table"),
+    path("health-check/", health_check_view.as_view(), name="health_check"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     path("privacy-policy/", PrivacyPolicyView.as_view(), name="privacy_policy"),
     path("openapi-schema.yaml", SwaggerSchemaView.as_view(), name="openapi_schema"),
 ]
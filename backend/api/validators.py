@@ -1,14 +1,30 @@
 from __future__ import annotations
+import operator
 from dataclasses import dataclass
-from typing import Dict, List, Callable, Optional
+from typing import Dict, List, Callable, Optional, Tuple
 from calculators.dls_calculator import DLSCalculator
 from .enums import DLSScenarioEnum
 
 
+@dataclass(frozen=True)
+class Comparison:
+    """
+    A cross-field rule: ``larger`` must be greater than ``smaller`` (or
+    equal to it, if not ``strict``). The error is reported under
+    ``error_key``, ``smaller`` by default.
+    """
+
+    larger: str
+    smaller: str
+    strict: bool = True
+    error_key: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class ScenarioRule:
     required_inputs: List[str]
     validator: Callable
+    comparisons: Tuple[Comparison, ...] = ()
 
 
 class ScenarioValidator:
@@ -46,141 +62,93 @@ class ScenarioValidator:
                 is_invalid = True
         
         if is_invalid:
-            target_key = error_key or smaller_key
-            if target_key == smaller_key:
-                msg = f"Must be lesser than {cls.field_map[larger_key]}"
-                if not strict:
-                    msg = f"Must be lesser than or equal to {cls.field_map[larger_key]}"
-            else:
-                msg = f"Must be greater than {cls.field_map[smaller_key]}"
+            target_key, msg = cls._comparison_error(Comparison(larger_key, smaller_key, strict, error_key))
             errors[target_key] = [msg]
 
     @classmethod
-    def validate_first_innings_curtailed_inputs(cls, data):
-        errors = {}
+    def _comparison_error(cls, comparison: Comparison) -> Tuple[str, str]:
+        """
+        The field and message of the error reported when a comparison fails.
+        """
+        target_key = comparison.error_key or comparison.smaller
+        if target_key == comparison.smaller:
+            msg = f"Must be lesser than {cls.field_map[comparison.larger]}"
+            if not comparison.strict:
+                msg = f"Must be lesser than or equal to {cls.field_map[comparison.larger]}"
+        else:
+            msg = f"Must be greater than {cls.field_map[comparison.smaller]}"
+        return target_key, msg
 
-        cls._validate_greater(
-            data, errors, 
-            "overs_available_to_team_1_at_start", 
-            "overs_available_to_team_2_at_start"
-        )
+    @classmethod
+    def _validate_comparisons(cls, data, comparisons: Tuple[Comparison, ...]):
+        errors = {}
+        for comparison in comparisons:
+            cls._validate_greater(
+                data, errors,
+                comparison.larger,
+                comparison.smaller,
+                strict=comparison.strict,
+                error_key=comparison.error_key
+            )
+        return errors
 
-        cls._validate_greater(
-            data, errors,
+    first_innings_curtailed_comparisons = (
+        Comparison("overs_available_to_team_1_at_start", "overs_available_to_team_2_at_start"),
+        Comparison(
             "overs_available_to_team_1_at_start",
             "overs_used_by_team_1_during_curtailed",
             error_key="overs_used_by_team_1_during_curtailed"
-        )
-
-        cls._validate_greater(
-            data, errors,
-            "overs_used_by_team_1_during_curtailed",
-            "overs_available_to_team_2_at_start",
-            strict=False
-        )
-
-        return errors
-
-    @classmethod
-    def validate_first_innings_interrupted_inputs(cls, data):
-        errors = {}
+        ),
+        Comparison("overs_used_by_team_1_during_curtailed", "overs_available_to_team_2_at_start", strict=False),
+    )
 
-        cls._validate_greater(
-            data, errors,
+    first_innings_interrupted_comparisons = (
+        Comparison(
             "overs_available_to_team_1_at_start",
             "overs_used_by_team_1_during_interruption",
             error_key="overs_available_to_team_1_at_start"
-        )
-
-        cls._validate_greater(
-            data, errors,
-            "overs_available_to_team_1_at_start",
-            "overs_available_to_team_2_at_start"
-        )
+        ),
+        Comparison("overs_available_to_team_1_at_start", "overs_available_to_team_2_at_start"),
+        Comparison("overs_available_to_team_1_at_start", "revised_overs_to_team_1_after_resumption"),
+        Comparison("revised_overs_to_team_1_after_resumption", "overs_available_to_team_2_at_start", strict=False),
+    )
+
+    second_innings_curtailed_comparisons = (
+        Comparison("overs_available_to_team_1_at_start", "overs_available_to_team_2_at_start", strict=False),
+        Comparison("overs_available_to_team_1_at_start", "overs_used_by_team_2_during_curtailed"),
+        Comparison("overs_available_to_team_2_at_start", "overs_used_by_team_2_during_curtailed"),
+    )
+
+    second_innings_delayed_comparisons = (
+        Comparison("overs_available_to_team_1_at_start", "overs_available_to_team_2_at_start", strict=False),
+    )
+
+    second_innings_interrupted_comparisons = (
+        Comparison("overs_available_to_team_1_at_start", "overs_available_to_team_2_at_start", strict=False),
+        Comparison("overs_available_to_team_2_at_start", "overs_used_by_team_2_during_interruption"),
+        Comparison("overs_available_to_team_2_at_start", "revised_overs_to_team_2_after_resumption"),
+        Comparison("revised_overs_to_team_2_after_resumption", "overs_used_by_team_2_during_interruption"),
+    )
 
-        cls._validate_greater(
-            data, errors,
-            "overs_available_to_team_1_at_start",
-            "revised_overs_to_team_1_after_resumption"
-        )
-
-        cls._validate_greater(
-            data, errors,
-            "revised_overs_to_team_1_after_resumption",
-            "overs_available_to_team_2_at_start",
-            strict=False
-        )
+    @classmethod
+    def validate_first_innings_curtailed_inputs(cls, data):
+        return cls._validate_comparisons(data, cls.first_innings_curtailed_comparisons)
 
-        return errors
+    @classmethod
+    def validate_first_innings_interrupted_inputs(cls, data):
+        return cls._validate_comparisons(data, cls.first_innings_interrupted_comparisons)
 
     @classmethod
     def validate_second_innings_curtailed_inputs(cls, data):
-        errors = {}
-
-        cls._validate_greater(
-            data, errors,
-            "overs_available_to_team_1_at_start",
-            "overs_available_to_team_2_at_start",
-            strict=False
-        )
-
-        cls._validate_greater(
-            data, errors,
-            "overs_available_to_team_1_at_start",
-            "overs_used_by_team_2_during_curtailed",
-        )
-
-        cls._validate_greater(
-            data, errors,
-            "overs_available_to_team_2_at_start",
-            "overs_used_by_team_2_during_curtailed",
-        )
-
-        return errors
+        return cls._validate_comparisons(data, cls.second_innings_curtailed_comparisons)
 
     @classmethod
     def validate_second_innings_delayed_inputs(cls, data):
-        errors = {}
-
-        cls._validate_greater(
-            data, errors,
-            "overs_available_to_team_1_at_start",
-            "overs_available_to_team_2_at_start",
-            strict=False
-        )
-
-        return errors
+        return cls._validate_comparisons(data, cls.second_innings_delayed_comparisons)
 
     @classmethod
     def validate_second_innings_interrupted_inputs(cls, data):
-        errors = {}
-
-        cls._validate_greater(
-            data, errors,
-            "overs_available_to_team_1_at_start",
-            "overs_available_to_team_2_at_start",
-            strict=False
-        )
-
-        cls._validate_greater(
-            data, errors,
-            "overs_available_to_team_2_at_start",
-            "overs_used_by_team_2_during_interruption",
-        )
-
-        cls._validate_greater(
-            data, errors,
-            "overs_available_to_team_2_at_start",
-            "revised_overs_to_team_2_after_resumption",
-        )
-
-        cls._validate_greater(
-            data, errors,
-            "revised_overs_to_team_2_after_resumption",
-            "overs_used_by_team_2_during_interruption",
-        )
-
-        return errors
+        return cls._validate_comparisons(data, cls.second_innings_interrupted_comparisons)
 
 
 SCENARIO_RULES = {
@@ -193,6 +161,7 @@ SCENARIO_RULES = {
             "overs_available_to_team_2_at_start",
         ],
         validator=ScenarioValidator.validate_first_innings_curtailed_inputs,
+        comparisons=ScenarioValidator.first_innings_curtailed_comparisons,
     ),
 
     DLSScenarioEnum.FIRST_INNINGS_INTERRUPTED.value: ScenarioRule(
@@ -205,6 +174,7 @@ SCENARIO_RULES = {
             "overs_available_to_team_2_at_start",
         ],
         validator=ScenarioValidator.validate_first_innings_interrupted_inputs,
+        comparisons=ScenarioValidator.first_innings_interrupted_comparisons,
     ),
 
     DLSScenarioEnum.SECOND_INNINGS_CURTAILED.value: ScenarioRule(
@@ -216,6 +186,7 @@ SCENARIO_RULES = {
             "wickets_lost_by_team_2_during_curtailed",
         ],
         validator=ScenarioValidator.validate_second_innings_curtailed_inputs,
+        comparisons=ScenarioValidator.second_innings_curtailed_comparisons,
     ),
 
     DLSScenarioEnum.SECOND_INNINGS_DELAYED.value: ScenarioRule(
@@ -225,6 +196,7 @@ SCENARIO_RULES = {
             "overs_available_to_team_2_at_start",
         ],
         validator=ScenarioValidator.validate_second_innings_delayed_inputs,
+        comparisons=ScenarioValidator.second_innings_delayed_comparisons,
     ),
 
     DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value: ScenarioRule(
@@ -237,5 +209,66 @@ SCENARIO_RULES = {
             "revised_overs_to_team_2_after_resumption",
         ],
         validator=ScenarioValidator.validate_second_innings_interrupted_inputs,
+        comparisons=ScenarioValidator.second_innings_interrupted_comparisons,
     ),
 }
+
+
+def _to_int(value) -> int:
+    return int(float(value))
+
+
+def _input_converter(field: str) -> Callable:
+    """
+    Numeric type of an input, guessed from its name as the API always has.
+    """
+    return _to_int if "wickets" in field or "runs" in field else float
+
+
+def compile_scenario_rule(rule: ScenarioRule) -> Callable[[Dict], Tuple[Optional[Dict], Dict[str, List[str]]]]:
+    """
+    Generates the fast-path checker of a scenario.
+
+    The checker performs the same required-field check, numeric coercion
+    and cross-field comparisons as ``DLSRequestSerializer`` with the rule's
+    validator and produces the same errors, but everything that does not
+    depend on the request (the required fields, each field's converter,
+    each comparison's operator, error field and message) is resolved once
+    here, so a request costs one conversion per input and one operator
+    call per comparison.
+
+    The checker returns a tuple of the converted inputs (``None`` when they
+    could not be converted) and the input errors, keyed by field name.
+    """
+    required_inputs = tuple(rule.required_inputs)
+    converters = {field: _input_converter(field) for field in ScenarioValidator.field_map}
+    checks = tuple(
+        (comparison.larger, comparison.smaller, operator.le if comparison.strict else operator.lt)
+        + ScenarioValidator._comparison_error(comparison)
+        for comparison in rule.comparisons
+    )
+
+    def check(inputs: Dict) -> Tuple[Optional[Dict], Dict[str, List[str]]]:
+        missing = [field for field in required_inputs if inputs.get(field) is None]
+        if missing:
+            return None, {field: ["This field is required."] for field in missing}
+
+        converted = {}
+        for key, value in inputs.items():
+            convert = converters.get(key) or _input_converter(key)
+            try:
+                converted[key] = convert(value)
+            except (ValueError, TypeError):
+                return None, {key: ["Must be a number."]}
+
+        errors = {}
+        for larger, smaller, fails, error_key, message in checks:
+            if fails(converted[larger], converted[smaller]):
+                errors[error_key] = [message]
+        return converted, errors
+
+    check.required_inputs = required_inputs
+    return check
+
+
+COMPILED_SCENARIO_RULES = {scenario: compile_scenario_rule(rule) for scenario, rule in SCENARIO_RULES.items()}
@@ -1,12 +1,27 @@
+import asyncio
+import base64
 import os
+import numpy as np
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.http import parse_etags
+from django.views import View
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from calculators.dls_calculator import DLSCalculator
-from .serializers import DLSRequestSerializer
-from .services import DLSService
+from calculators.live_tracker import LiveParTracker
+from calculators.timeline import MatchTimeline
+from .serializers import (
+    DLSBatchRequestSerializer, DLSRequestSerializer, LiveEventSerializer, LiveSessionSerializer,
+    ParCurveRequestSerializer, TimelineRequestSerializer
+)
+from .broker import live_broker
+from .cache import result_cache
+from .responses import CachedRenderResponse
+from .services import dls_service, get_resource_table_payload, live_sessions
 from .constants import PRIVACY_POLICY_DATA
 
 
@@ -21,7 +36,6 @@ class DLSScoreView(APIView):
         """
         serializer = DLSRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        dls_service = DLSService()
 
         try:
             par_score = dls_service.calculate(serializer.validated_data)
@@ -40,24 +54,344 @@ class DLSScoreView(APIView):
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
 
+class DLSBatchScoreView(APIView):
+    """
+    API View for calculating DLS par scores for many scenarios in one request.
+    """
+
+    def post(self, request):
+        """
+        Calculates par scores for a list of scenarios.
+
+        Each item is validated and calculated independently; the response holds
+        one result per item, in request order, with per-item errors.
+        """
+        serializer = DLSBatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data
+
+        valid_indices = [index for index, item in enumerate(items) if not isinstance(item, ValidationError)]
+        par_scores = dls_service.calculate_many([items[index] for index in valid_indices])
+        outcomes = dict(zip(valid_indices, par_scores))
+
+        results = []
+        for index, item in enumerate(items):
+            outcome = outcomes.get(index, item)
+            if isinstance(outcome, ValidationError):
+                results.append({"index": index, "status": "error", "errors": outcome.detail})
+            elif isinstance(outcome, Exception):
+                results.append({"index": index, "status": "error", "message": str(outcome)})
+            else:
+                results.append({
+                    "index": index,
+                    "status": "success",
+                    "par_score": outcome,
+                    "revised_target": outcome + 1,
+                })
+
+        succeeded = sum(1 for result in results if result["status"] == "success")
+        response_data = {
+            "count": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results,
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class DLSTimelineView(APIView):
+    """
+    API View for calculating DLS par scores for a match with several interruptions.
+    """
+
+    def post(self, request):
+        """
+        Applies the interruptions of both innings in match order and returns
+        the par score and revised target after each of them.
+        """
+        serializer = TimelineRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        try:
+            timeline = MatchTimeline(
+                data["match_format"],
+                data["overs_available_to_team_1_at_start"],
+                data["runs_scored_by_team_1"],
+                data["overs_available_to_team_2_at_start"],
+                data.get("table_version"),
+            )
+            steps = []
+            for interruption in data["interruptions"]:
+                step = timeline.add_interruption(**interruption)
+                steps.append({
+                    **interruption,
+                    "par_score": round(step.par_score),
+                    "revised_target": step.revised_target,
+                })
+            par_score = round(timeline.par_score)
+
+        except Exception as e:
+            response_data = {
+                "status": "error",
+                "message": str(e)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        response_data = {
+            "par_score": par_score,
+            "revised_target": par_score + 1,
+            "steps": steps,
+            "messages": ["Target calculated successfully."]
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class ParCurveView(APIView):
+    """
+    API View for the full par-score curve of a chasing innings.
+    """
+
+    def post(self, request):
+        """
+        Returns the par score at every ball for every wicket count.
+
+        ``par_scores[wickets][balls]`` is the par after ``balls`` balls with
+        ``wickets`` down. With ``encoding=base64`` the matrix is sent as
+        row-major little-endian int16 bytes instead of nested lists, unless
+        a par score does not fit in int16, in which case the response falls
+        back to the JSON encoding.
+        """
+        serializer = ParCurveRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        try:
+            calculator = DLSCalculator(data["match_format"], data.get("table_version"))
+            par_curve = calculator.calculate_par_curve(
+                data["overs_available_to_team_1_at_start"],
+                data["runs_scored_by_team_1"],
+                data["overs_available_to_team_2_at_start"],
+                *(data.get(field) for field in ParCurveRequestSerializer.interruption_fields)
+            )
+            if not np.isfinite(par_curve).all():
+                raise ValueError("Par curve is undefined when Team 1 has no resources available.")
+            par_scores = np.round(par_curve).astype(np.int64)
+
+        except Exception as e:
+            response_data = {
+                "status": "error",
+                "message": str(e)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        response_data = {
+            "match_format": data["match_format"],
+            "wickets": par_scores.shape[0],
+            "balls": par_scores.shape[1] - 1,
+        }
+        int16 = np.iinfo(np.int16)
+        encoding = data["encoding"]
+        if encoding == "base64" and not (int16.min <= par_scores.min() and par_scores.max() <= int16.max):
+            encoding = "json"
+        response_data["encoding"] = encoding
+        if encoding == "base64":
+            response_data["dtype"] = "<i2"
+            response_data["par_scores"] = base64.b64encode(par_scores.astype("<i2").tobytes()).decode()
+        else:
+            response_data["par_scores"] = par_scores.tolist()
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class LiveSessionView(APIView):
+    """
+    API View for starting a live par-score session for a chasing innings.
+    """
+
+    def post(self, request):
+        """
+        Starts a session and returns its id with the par score at the start of the chase.
+        """
+        serializer = LiveSessionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        session = None
+        try:
+            tracker = LiveParTracker(
+                serializer.validated_data["match_format"],
+                serializer.validated_data["overs_available_to_team_1_at_start"],
+                serializer.validated_data["runs_scored_by_team_1"],
+                serializer.validated_data["overs_available_to_team_2_at_start"],
+            )
+            session = live_sessions.create(tracker)
+            return Response(session.snapshot(), status=status.HTTP_201_CREATED)
+
+        except Exception as e:
+            # Don't keep a session the client was never given the id of
+            if session is not None:
+                live_sessions.delete(session.session_id)
+            response_data = {
+                "status": "error",
+                "message": str(e)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+
+class LiveSessionDetailView(APIView):
+    """
+    API View for reading or ending a live par-score session.
+    """
+
+    def get(self, request, session_id):
+        session = live_sessions.get(session_id)
+        if session is None:
+            return Response({"status": "error", "message": "Live session not found."}, status=status.HTTP_404_NOT_FOUND)
+        with session.lock:
+            return Response(session.snapshot(), status=status.HTTP_200_OK)
+
+    def delete(self, request, session_id):
+        if not live_sessions.delete(session_id):
+            return Response({"status": "error", "message": "Live session not found."}, status=status.HTTP_404_NOT_FOUND)
+        live_broker.publish(session_id, None)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class LiveSessionEventView(APIView):
+    """
+    API View for posting scoring events to a live par-score session.
+    """
+
+    def post(self, request, session_id):
+        """
+        Applies a ball, wicket or state event and returns the updated par score.
+        """
+        session = live_sessions.get(session_id)
+        if session is None:
+            return Response({"status": "error", "message": "Live session not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = LiveEventSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        event = serializer.validated_data
+
+        try:
+            with session.lock:
+                if event["event"] == "ball":
+                    session.tracker.record_ball(wicket=event["wicket"])
+                elif event["event"] == "wicket":
+                    session.tracker.record_wicket()
+                else:
+                    session.tracker.update(event.get("overs_used"), event.get("wickets_lost"))
+                response_data = session.snapshot()
+            live_broker.publish(session_id, response_data)
+            return Response(response_data, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            response_data = {
+                "status": "error",
+                "message": str(e)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+
+class LiveSessionStreamView(View):
+    """
+    Server-Sent Events stream of par-score updates for a live session.
+
+    Every event posted to the session is calculated once and pushed to all
+    subscribers as a ``par`` event; an ``end`` event is sent when the session
+    is deleted. The stream holds a connection open, so it is meant to be
+    served by the ASGI application in ``config/asgi.py``.
+    """
+
+    heartbeat_interval = 15
+
+    async def get(self, request, session_id):
+        session = live_sessions.get(session_id)
+        if session is None:
+            return JsonResponse({"status": "error", "message": "Live session not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        # Subscribe before taking the snapshot so no update can fall in between
+        subscription = live_broker.subscribe(session_id)
+        with session.lock:
+            snapshot = session.snapshot()
+
+        response = StreamingHttpResponse(self._stream(subscription, snapshot), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def _stream(self, subscription, snapshot):
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        try:
+            yield self._format_event(renderer, "par", snapshot)
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscription.get(), self.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+
+                if message is None:
+                    yield self._format_event(renderer, "end", {"session_id": subscription.channel})
+                    return
+                yield self._format_event(renderer, "par", message)
+        finally:
+            subscription.close()
+
+    @staticmethod
+    def _format_event(renderer, event, data):
+        return b"event: " + event.encode() + b"\ndata: " + renderer.render(data) + b"\n\n"
+
+
 class ResourceTableView(APIView):
     """
     API View for retrieving the DLS resource table.
+
+    Tables never change once loaded, so responses carry a strong ETag and may
+    be cached by clients and CDNs; ``If-None-Match`` requests are answered
+    with 304. A table pinned with ``version`` is cached for a day; the active
+    table only briefly, since another version may be activated.
     """
 
+    cache_max_age = 24 * 60 * 60
+    active_cache_max_age = 5 * 60
+
     def get(self, request):
         """
         Returns the DLS resource table data.
         """
         match_format = request.query_params.get("match_format", "T20")
-        calculator = DLSCalculator(match_format)
-        df = calculator.resource_table_df
+        table_version = request.query_params.get("version") or None
+        try:
+            data, etag = get_resource_table_payload(match_format, table_version)
+        except KeyError:
+            response_data = {
+                "status": "error",
+                "message": self.unknown_table_message(match_format, table_version)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
-        data = {
-            "columns": list(df.columns),
-            "data": df.values.tolist()
+        max_age = self.active_cache_max_age if table_version is None else self.cache_max_age
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={max_age}",
         }
-        return Response(data, status=status.HTTP_200_OK)
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in if_none_match or "*" in if_none_match:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return CachedRenderResponse(
+            data,
+            cache_key=("resource-table", etag),
+            status=status.HTTP_200_OK,
+            headers=headers
+        )
+
+    @staticmethod
+    def unknown_table_message(match_format, table_version):
+        if table_version is None:
+            return f"Unknown match format: {match_format}"
+        return f"Unknown resource table version {table_version} for match format {match_format}"
 
 
 class PrivacyPolicyView(APIView):
@@ -81,6 +415,25 @@ class HealthCheckView(APIView):
         return Response({"status": "ok"}, status=status.HTTP_200_OK)
 
 
+class MetricsView(APIView):
+    """
+    API View for in-process monitoring counters.
+    """
+
+    def get(self, request):
+        """
+        Returns the counters of the worker that serves the request.
+        """
+        return Response({
+            "result_cache": result_cache.stats(),
+            "scenario_latency": dls_service.latency.stats(),
+            "micro_batching": dls_service.batcher.stats(),
+            "single_flight": {
+                "calculations": dls_service.flights.stats(),
+            },
+        }, status=status.HTTP_200_OK)
+
+
 class APIRootView(APIView):
     """
     Root API View to provide information about available endpoints.
@@ -91,8 +444,13 @@ class APIRootView(APIView):
             "message": "Welcome to the Duckworth-Lewis-Stern (DLS) Score Calculator API",
             "endpoints": {
                 "calculate-dls-score": "/calculate-dls-score/",
+                "calculate-dls-score-batch": "/calculate-dls-score/batch/",
+                "calculate-dls-score-timeline": "/calculate-dls-score/timeline/",
+                "par-curve": "/par-curve/",
+                "live-sessions": "/live-sessions/",
                 "resource-table": "/resource-table/",
                 "health-check": "/health-check/",
+                "metrics": "/metrics/",
                 "privacy-policy": "/privacy-policy/",
                 "openapi-schema": "/openapi-schema.yaml",
             },
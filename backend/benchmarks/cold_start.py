@@ -0,0 +1,69 @@
+"""
+Cold-start benchmark for the serverless entry point.
+
+Starts fresh interpreters that import ``config.wsgi`` and load the URLconf
+(what a cold start of ``api/index.py`` does before serving its first
+request) and reports the latency. Exits with status 1
+if the median exceeds ``--max-ms`` or if pandas was imported, so it can
+guard against regressions in CI.
+
+Usage (from the backend directory):
+    python -m benchmarks.cold_start --runs 10 --max-ms 1500
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import config.wsgi
+from django.urls import get_resolver
+get_resolver().url_patterns
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "pandas": "pandas" in sys.modules}))
+"""
+
+
+def measure_cold_start() -> dict:
+    """
+    Cold-starts the WSGI application in a fresh interpreter and returns the
+    time taken in milliseconds and whether pandas was loaded.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    results = [measure_cold_start() for _ in range(args.runs)]
+    timings = sorted(result["ms"] for result in results)
+    median = statistics.median(timings)
+    pandas_loaded = any(result["pandas"] for result in results)
+
+    print(f"config.wsgi cold start: median {median:.1f} ms, min {timings[0]:.1f} ms, max {timings[-1]:.1f} ms")
+    print(f"pandas imported: {pandas_loaded}")
+
+    if pandas_loaded or (args.max_ms is not None and median > args.max_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
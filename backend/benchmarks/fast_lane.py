@@ -0,0 +1,163 @@
+"""
+Benchmark of POST /calculate-dls-score/ through the fast lane of
+api.fastlane against the full Django stack.
+
+Requests are sent back to back from one client, in-process, to the WSGI
+handler with the DRF views and to the ASGI handler with the async-native
+views, each with and without the fast lane in front, drawn from a fixed set
+of distinct scenarios. Each protocol runs in its own subprocess, since
+``DLS_ASYNC_VIEWS`` selects the views when the URLs are loaded. Reports
+throughput and request latency.
+
+Usage (from the backend directory):
+    python -m benchmarks.fast_lane --requests 20000
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import random
+import subprocess
+import sys
+import time
+
+from benchmarks.wsgi_vs_asgi import PATH, random_request
+
+
+def wsgi_environ(body: bytes):
+    return {
+        "REQUEST_METHOD": "POST",
+        "SCRIPT_NAME": "",
+        "PATH_INFO": PATH,
+        "QUERY_STRING": "",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": "localhost",
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.url_scheme": "http",
+    }
+
+
+def asgi_scope(body: bytes):
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": PATH,
+        "raw_path": PATH.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+    }
+
+
+def run_wsgi(application, bodies):
+    def start_response(status, headers, exc_info=None):
+        if not status.startswith("200"):
+            raise RuntimeError(f"Unexpected response status {status}")
+
+    latencies = []
+    for body in bodies:
+        start = time.perf_counter()
+        result = application(wsgi_environ(body), start_response)
+        b"".join(result)
+        if hasattr(result, "close"):
+            result.close()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_asgi(application, bodies):
+    async def request(body):
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        disconnected = asyncio.Event()
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start" and message["status"] != 200:
+                raise RuntimeError(f"Unexpected response status {message['status']}")
+
+        await application(asgi_scope(body), receive, send)
+
+    async def main():
+        latencies = []
+        for body in bodies:
+            start = time.perf_counter()
+            await request(body)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    return asyncio.run(main())
+
+
+def report(name: str, latencies):
+    latencies = sorted(latencies)
+    print(
+        f"{name:<16} {len(latencies) / sum(latencies):10,.0f} req/s   "
+        f"p50 {latencies[len(latencies) // 2] * 1e6:8.1f} µs   "
+        f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1e6:8.1f} µs"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--server", choices=["wsgi", "asgi"], help="Run only one protocol, in this process")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--distinct", type=int, default=1000, help="Distinct scenarios requested")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.server is None:
+        for server in ("wsgi", "asgi"):
+            subprocess.run([sys.executable, "-m", "benchmarks.fast_lane", "--server", server, *sys.argv[1:]], check=True)
+        return
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    os.environ["DLS_ASYNC_VIEWS"] = "True" if args.server == "asgi" else "False"
+    os.environ["DLS_FAST_LANE"] = "True"
+
+    import django
+
+    django.setup()
+
+    from django.core.handlers.asgi import ASGIHandler
+    from django.core.handlers.wsgi import WSGIHandler
+    from api.fastlane import FastLaneASGI, FastLaneWSGI
+
+    rng = random.Random(args.seed)
+    scenarios = [random_request(rng) for _ in range(args.distinct)]
+    bodies = [rng.choice(scenarios) for _ in range(args.requests)]
+
+    if args.server == "wsgi":
+        run, application, fast_lane = run_wsgi, WSGIHandler(), FastLaneWSGI
+    else:
+        run, application, fast_lane = run_asgi, ASGIHandler(), FastLaneASGI
+    for name, application in (
+        (f"{args.server} django", application),
+        (f"{args.server} fast lane", fast_lane(application)),
+    ):
+        # Warm up the cache and the lookup indexes
+        run(application, scenarios)
+        report(name, run(application, bodies))
+
+
+if __name__ == "__main__":
+    main()
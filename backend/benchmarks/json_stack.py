@@ -0,0 +1,79 @@
+"""
+Benchmark of the orjson camelCase renderer and parser against
+djangorestframework_camel_case's JSON renderer and parser.
+
+Usage (from the backend directory):
+    python -m benchmarks.json_stack --repeat 2000
+"""
+
+import argparse
+import io
+import os
+import time
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+
+django.setup()
+
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from api.parsers import ORJSONCamelCaseParser
+from api.renderers import ORJSONCamelCaseRenderer
+
+
+SINGLE_REQUEST = (
+    b'{"scenarioType": "SecondInningsInterrupted", "matchFormat": "T20", "inputs": {'
+    b'"oversAvailableToTeam1AtStart": 20.0, "runsScoredByTeam1": 230,'
+    b'"oversAvailableToTeam2AtStart": 20.0, "oversUsedByTeam2DuringInterruption": 5.0,'
+    b'"wicketsLostByTeam2DuringInterruption": 4, "revisedOversToTeam2AfterResumption": 7}}'
+)
+SINGLE_RESPONSE = {"par_score": 106, "revised_target": 107, "messages": ["Target calculated successfully."]}
+
+BATCH_SIZE = 1000
+BATCH_REQUEST = b"[" + b",".join([SINGLE_REQUEST] * BATCH_SIZE) + b"]"
+BATCH_RESPONSE = {
+    "count": BATCH_SIZE,
+    "succeeded": BATCH_SIZE,
+    "failed": 0,
+    "results": [
+        {"index": index, "status": "success", "par_score": 106, "revised_target": 107}
+        for index in range(BATCH_SIZE)
+    ],
+}
+
+
+def time_per_call(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    cases = [
+        ("parse single", SINGLE_REQUEST, args.repeat),
+        ("parse batch", BATCH_REQUEST, max(args.repeat // 100, 1)),
+    ]
+    for name, body, repeat in cases:
+        baseline = time_per_call(lambda: CamelCaseJSONParser().parse(io.BytesIO(body)), repeat)
+        candidate = time_per_call(lambda: ORJSONCamelCaseParser().parse(io.BytesIO(body)), repeat)
+        print(f"{name:<16} camel_case {baseline * 1e6:10.1f} us   orjson {candidate * 1e6:10.1f} us   x{baseline / candidate:.1f}")
+
+    cases = [
+        ("render single", SINGLE_RESPONSE, args.repeat),
+        ("render batch", BATCH_RESPONSE, max(args.repeat // 100, 1)),
+    ]
+    for name, data, repeat in cases:
+        baseline = time_per_call(lambda: CamelCaseJSONRenderer().render(data), repeat)
+        candidate = time_per_call(lambda: ORJSONCamelCaseRenderer().render(data), repeat)
+        print(f"{name:<16} camel_case {baseline * 1e6:10.1f} us   orjson {candidate * 1e6:10.1f} us   x{baseline / candidate:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark of micro-batched against direct calculation of concurrent
+single-scenario requests.
+
+Client threads each send requests back to back through DLSService.calculate,
+with the result cache disabled, first calculating each request on its own
+and then through a MicroBatcher. Reports throughput, request latency and the
+batch sizes achieved.
+
+Usage (from the backend directory):
+    python -m benchmarks.micro_batching --clients 64 --requests 200 --window-ms 2
+"""
+
+import argparse
+import os
+import random
+import statistics
+import threading
+import time
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+
+django.setup()
+
+from api.batcher import MicroBatcher
+from api.cache import result_cache
+from api.enums import DLSScenarioEnum
+from api.services import DLSService
+
+
+def random_request(rng: random.Random):
+    overs_used = rng.randint(1, 15) + rng.randint(0, 5) / 10
+    return {
+        "scenario_type": DLSScenarioEnum.SECOND_INNINGS_INTERRUPTED.value,
+        "match_format": rng.choice(["T20", "T10"]) if overs_used < 9 else "T20",
+        "inputs": {
+            "overs_available_to_team_1_at_start": 20.0,
+            "runs_scored_by_team_1": rng.randint(100, 250),
+            "overs_available_to_team_2_at_start": 20.0,
+            "overs_used_by_team_2_during_interruption": overs_used,
+            "wickets_lost_by_team_2_during_interruption": rng.randint(0, 9),
+            "revised_overs_to_team_2_after_resumption": 18.0,
+        },
+    }
+
+
+def run_clients(service: DLSService, clients: int, requests: int, seed: int):
+    workloads = [[random_request(random.Random(seed + client)) for _ in range(requests)] for client in range(clients)]
+    latencies = [[] for _ in range(clients)]
+    barrier = threading.Barrier(clients + 1)
+
+    def client(index):
+        barrier.wait()
+        for request in workloads[index]:
+            start = time.perf_counter()
+            service.calculate(request)
+            latencies[index].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    all_latencies = sorted(latency for client_latencies in latencies for latency in client_latencies)
+    return (
+        len(all_latencies) / elapsed,
+        statistics.mean(all_latencies) * 1000,
+        all_latencies[int(len(all_latencies) * 0.99) - 1] * 1000,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=64, help="Concurrent client threads")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client")
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    parser.add_argument("--max-size", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    result_cache.enabled = False
+    service = DLSService()
+    service.warm_up()
+
+    service.batcher.enabled = False
+    throughput, mean_ms, p99_ms = run_clients(service, args.clients, args.requests, args.seed)
+    print(f"direct   {throughput:10,.0f} req/s   mean {mean_ms:7.2f} ms   p99 {p99_ms:7.2f} ms")
+
+    service.batcher = MicroBatcher(service.calculate_many, window=args.window_ms / 1000, max_size=args.max_size)
+    throughput, mean_ms, p99_ms = run_clients(service, args.clients, args.requests, args.seed)
+    stats = service.batcher.stats()
+    print(
+        f"batched  {throughput:10,.0f} req/s   mean {mean_ms:7.2f} ms   p99 {p99_ms:7.2f} ms   "
+        f"batch size mean {stats['mean_batch_size']:.1f} max {stats['max_batch_size']}   "
+        f"added wait mean {stats['mean_wait_ms']:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark for the vectorized DLSCalculator API.
+
+Evaluates a large population of random scenarios for every scenario type
+with the ``*_many`` methods and reports the elapsed time and throughput.
+
+Usage (from the backend directory):
+    python -m benchmarks.vectorized_calculator --size 1000000 --match-format ODI
+"""
+
+import argparse
+import time
+import numpy as np
+from calculators.dls_calculator import DLSCalculator
+
+
+METHOD_NAMES = [
+    "calculate_par_score_first_innings_cut_short_many",
+    "calculate_par_score_first_innings_interrupted_many",
+    "calculate_par_score_second_innings_cut_short_many",
+    "calculate_par_score_second_innings_delayed_many",
+    "calculate_par_score_second_innings_interrupted_many",
+]
+
+
+def random_columns(size: int, max_overs: int, seed: int = 0):
+    """
+    Random columnar inputs covering every scenario's parameters.
+    """
+    rng = np.random.default_rng(seed)
+
+    def overs():
+        return rng.integers(0, max_overs, size) + rng.integers(0, 6, size) / 10
+
+    return {
+        "overs_available_to_team_1_at_start": np.full(size, float(max_overs)),
+        "overs_available_to_team_2_at_start": overs(),
+        "runs_scored_by_team_1": rng.integers(0, 400, size),
+        "overs_used_by_team_1_during_curtailed": overs(),
+        "overs_used_by_team_1_during_interruption": overs(),
+        "revised_overs_to_team_1_after_resumption": overs(),
+        "overs_used_by_team_2_during_curtailed": overs(),
+        "overs_used_by_team_2_during_interruption": overs(),
+        "revised_overs_to_team_2_after_resumption": overs(),
+        "wickets_lost_by_team_1_during_curtailed": rng.integers(0, 10, size),
+        "wickets_lost_by_team_1_during_interruption": rng.integers(0, 10, size),
+        "wickets_lost_by_team_2_during_curtailed": rng.integers(0, 10, size),
+        "wickets_lost_by_team_2_during_interruption": rng.integers(0, 10, size),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--match-format", default="ODI", choices=["ODI", "T20", "T10"])
+    args = parser.parse_args()
+
+    calculator = DLSCalculator(args.match_format)
+    max_overs = calculator.resource_table.max_balls // 6
+    columns = random_columns(args.size, max_overs)
+
+    for method_name in METHOD_NAMES:
+        method = getattr(calculator, method_name)
+        start = time.perf_counter()
+        method(**columns)
+        elapsed = time.perf_counter() - start
+        print(f"{method_name:<55} {elapsed * 1000:9.1f} ms  {args.size / elapsed:14,.0f} scenarios/s")
+
+
+if __name__ == "__main__":
+    main()
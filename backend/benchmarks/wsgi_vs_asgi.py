@@ -0,0 +1,187 @@
+"""
+Benchmark of the calculation endpoint served by the WSGI application with
+the DRF views against the ASGI application with the async-native views.
+
+Both applications are driven in-process, without a network server: the WSGI
+handler by a pool of client threads, as a threaded worker would call it, and
+the ASGI application by concurrent tasks on one event loop, as an ASGI
+server's worker would. Each client sends POST /calculate-dls-score/ requests
+back to back, drawn from a fixed set of distinct scenarios so that the
+result cache sees a realistic mix of hits and misses. Each application runs
+in its own subprocess, since ``DLS_ASYNC_VIEWS`` selects the views when the
+URLs are loaded. Reports throughput and request latency.
+
+Usage (from the backend directory):
+    python -m benchmarks.wsgi_vs_asgi --concurrency 256 --requests 50
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+import orjson
+
+PATH = "/calculate-dls-score/"
+
+
+def random_request(rng: random.Random) -> bytes:
+    return orjson.dumps({
+        "scenarioType": "SecondInningsInterrupted",
+        "matchFormat": "T20",
+        "inputs": {
+            "oversAvailableToTeam1AtStart": 20.0,
+            "runsScoredByTeam1": rng.randint(100, 250),
+            "oversAvailableToTeam2AtStart": 20.0,
+            "oversUsedByTeam2DuringInterruption": rng.randint(1, 15) + rng.randint(0, 5) / 10,
+            "wicketsLostByTeam2DuringInterruption": rng.randint(0, 9),
+            "revisedOversToTeam2AfterResumption": 18.0,
+        },
+    })
+
+
+def workloads(concurrency: int, requests: int, distinct: int, seed: int):
+    rng = random.Random(seed)
+    bodies = [random_request(rng) for _ in range(distinct)]
+    return [[rng.choice(bodies) for _ in range(requests)] for _ in range(concurrency)]
+
+
+def run_wsgi(concurrency: int, requests: int, distinct: int, seed: int):
+    from django.core.wsgi import get_wsgi_application
+
+    application = get_wsgi_application()
+    clients = workloads(concurrency, requests, distinct, seed)
+    latencies = [[] for _ in range(concurrency)]
+    barrier = threading.Barrier(concurrency + 1)
+
+    def start_response(status, headers, exc_info=None):
+        if not status.startswith("200"):
+            raise RuntimeError(f"Unexpected response status {status}")
+
+    def client(index):
+        barrier.wait()
+        for body in clients[index]:
+            environ = {
+                "REQUEST_METHOD": "POST",
+                "SCRIPT_NAME": "",
+                "PATH_INFO": PATH,
+                "QUERY_STRING": "",
+                "CONTENT_TYPE": "application/json",
+                "CONTENT_LENGTH": str(len(body)),
+                "SERVER_NAME": "localhost",
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": "localhost",
+                "wsgi.input": io.BytesIO(body),
+                "wsgi.errors": sys.stderr,
+                "wsgi.url_scheme": "http",
+            }
+            start = time.perf_counter()
+            result = application(environ, start_response)
+            b"".join(result)
+            result.close()
+            latencies[index].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies
+
+
+def run_asgi(concurrency: int, requests: int, distinct: int, seed: int):
+    from django.core.asgi import get_asgi_application
+
+    application = get_asgi_application()
+    clients = workloads(concurrency, requests, distinct, seed)
+    latencies = [[] for _ in range(concurrency)]
+
+    async def request(body):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": PATH,
+            "raw_path": PATH.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"localhost"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+            "client": ("127.0.0.1", 50000),
+            "server": ("localhost", 80),
+        }
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        disconnected = asyncio.Event()
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            # The client stays connected until the handler is done with it
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start" and message["status"] != 200:
+                raise RuntimeError(f"Unexpected response status {message['status']}")
+
+        await application(scope, receive, send)
+
+    async def client(index):
+        for body in clients[index]:
+            start = time.perf_counter()
+            await request(body)
+            latencies[index].append(time.perf_counter() - start)
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(*(client(index) for index in range(concurrency)))
+        return time.perf_counter() - start
+
+    return asyncio.run(main()), latencies
+
+
+def report(server: str, elapsed: float, latencies):
+    all_latencies = sorted(latency for client_latencies in latencies for latency in client_latencies)
+    print(
+        f"{server}  {len(all_latencies) / elapsed:10,.0f} req/s   "
+        f"p50 {all_latencies[len(all_latencies) // 2] * 1000:8.2f} ms   "
+        f"p99 {all_latencies[int(len(all_latencies) * 0.99) - 1] * 1000:8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--server", choices=["wsgi", "asgi"], help="Run only one application, in this process")
+    parser.add_argument("--concurrency", type=int, default=256, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per client")
+    parser.add_argument("--distinct", type=int, default=1000, help="Distinct scenarios requested")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.server is None:
+        for server in ("wsgi", "asgi"):
+            subprocess.run([sys.executable, "-m", "benchmarks.wsgi_vs_asgi", "--server", server, *sys.argv[1:]], check=True)
+        return
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    os.environ["DLS_ASYNC_VIEWS"] = "True" if args.server == "asgi" else "False"
+    run = run_asgi if args.server == "asgi" else run_wsgi
+    elapsed, latencies = run(args.concurrency, args.requests, args.distinct, args.seed)
+    report(args.server, elapsed, latencies)
+
+
+if __name__ == "__main__":
+    main()
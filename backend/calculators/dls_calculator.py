@@ -6,10 +6,14 @@ when interruptions occur, using the DLS resource table method.
 """
 
 import os
-from typing import Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 import numpy as np
-from calculators.resource_table import ResourceTable
+from numpy.typing import ArrayLike
+from calculators.table_provider import resource_tables
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from calculators.resource_table import ResourceTable
 
 
 class DLSCalculator:
@@ -20,15 +24,34 @@ class DLSCalculator:
     affected by weather interruptions or other delays.
     """
     
-    def __init__(self, match_type: str = 'T20'):
+    def __init__(self, match_type: str = 'T20', table_version: Optional[str] = None):
         """
         Initialize the DLS Calculator with resource table data.
+
+        The resource table is looked up from the shared registry, so
+        constructing a calculator does not rebuild any table data.
         
         Args:
             match_type (str): The match type, e.g., 'T20' or 'ODI'.
+            table_version (str): The resource table version; the active one if omitted.
+        """
+        self.resource_table = resource_tables.get(match_type, table_version)
+
+    @classmethod
+    def from_table(cls, resource_table: "ResourceTable") -> "DLSCalculator":
+        """
+        A calculator using the given resource table.
         """
-        self.resource_table = ResourceTable(match_type)
-        self.resource_table_df = self.resource_table.resource_df
+        calculator = cls.__new__(cls)
+        calculator.resource_table = resource_table
+        return calculator
+
+    @property
+    def resource_table_df(self) -> "pd.DataFrame":
+        """
+        The resource table as a DataFrame, for analytics. Requires pandas.
+        """
+        return self.resource_table.resource_df
 
     def calculate_par_score_first_innings_cut_short(
         self,
@@ -184,11 +207,13 @@ class DLSCalculator:
         
         # Get resource percentages
         team_one_resource_available = self._get_resource_percentage(team_one_balls_available, wickets_lost=0)
-        team_two_resource_initially = self._get_resource_percentage(team_two_balls_available, wickets_lost=0)
-        team_two_resource_remaining = self._get_resource_percentage(balls_remaining, wickets_lost_by_team_2_during_curtailed)
         
-        # Calculate resource used by Team 2
-        team_two_resource_used = team_two_resource_initially - team_two_resource_remaining
+        # Resource used by Team 2, read from the precomputed resource-used index
+        team_two_resource_used = self._get_resource_used(
+            team_two_balls_available,
+            balls_remaining,
+            wickets_lost_by_team_2_during_curtailed
+        )
         
         # Calculate par score
         par_score = runs_scored_by_team_1 * (team_two_resource_used / team_one_resource_available)
@@ -220,12 +245,15 @@ class DLSCalculator:
         team_one_balls_available = self._convert_overs_to_balls(overs_available_to_team_1_at_start)
         team_two_balls_available = self._convert_overs_to_balls(overs_available_to_team_2_at_start)
         
-        # Get resource percentages (both teams start with 0 wickets lost)
-        team_one_resource = self._get_resource_percentage(team_one_balls_available, wickets_lost=0)
-        team_two_resource = self._get_resource_percentage(team_two_balls_available, wickets_lost=0)
+        # Both teams start with 0 wickets lost, so the resource ratio comes
+        # straight from the precomputed ratio index
+        resource_ratio = self.resource_table.resource_ratio[
+            self._clip_balls(team_one_balls_available),
+            self._clip_balls(team_two_balls_available)
+        ]
         
         # Calculate revised target
-        par_score = runs_scored_by_team_1 * (team_two_resource / team_one_resource)
+        par_score = runs_scored_by_team_1 * resource_ratio
         
         return par_score
 
@@ -288,6 +316,264 @@ class DLSCalculator:
         
         return par_score
 
+    def calculate_par_curve(
+        self,
+        overs_available_to_team_1_at_start: float,
+        runs_scored_by_team_1: int,
+        overs_available_to_team_2_at_start: float,
+        overs_used_by_team_2_during_interruption: Optional[float] = None,
+        wickets_lost_by_team_2_during_interruption: Optional[int] = None,
+        revised_overs_to_team_2_after_resumption: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Calculate the par score at every ball and wicket count of a chasing innings.
+        
+        Entry ``[wickets, balls]`` is Team 2's par score if their innings were
+        cut short after ``balls`` balls with ``wickets`` wickets down, i.e. the
+        ``SecondInningsCurtailed`` par. When an interruption is given, balls
+        from the interruption onwards are measured against the revised innings
+        with the resource lost to the interruption taken off, as in
+        ``calculate_par_score_second_innings_interrupted``.
+        
+        Args:
+            overs_available_to_team_1_at_start: Overs available to Team 1 at start
+            runs_scored_by_team_1: Total runs scored by Team 1
+            overs_available_to_team_2_at_start: Overs available to Team 2 at start
+            overs_used_by_team_2_during_interruption: Overs used by Team 2 before an interruption
+            wickets_lost_by_team_2_during_interruption: Wickets lost by Team 2 at the interruption
+            revised_overs_to_team_2_after_resumption: Maximum overs allotted to Team 2 after resumption
+            
+        Returns:
+            Array of shape (10, balls + 1) of par scores, where balls is the
+            number of balls available to Team 2 (after any revision)
+        """
+        team_one_balls_available = self._convert_overs_to_balls(overs_available_to_team_1_at_start)
+        team_two_balls_available = self._convert_overs_to_balls(overs_available_to_team_2_at_start)
+        team_one_resource_available = self._get_resource_percentage(team_one_balls_available, wickets_lost=0)
+
+        wickets_lost = np.arange(len(self.resource_table.dense))[:, np.newaxis]
+
+        if overs_used_by_team_2_during_interruption is None:
+            balls_used = np.arange(team_two_balls_available + 1)
+            team_two_resource_used = self._get_resource_used_many(
+                np.int64(team_two_balls_available),
+                team_two_balls_available - balls_used,
+                wickets_lost
+            )
+        else:
+            team_two_balls_used = self._convert_overs_to_balls(overs_used_by_team_2_during_interruption)
+            team_two_balls_available_after = self._convert_overs_to_balls(revised_overs_to_team_2_after_resumption)
+
+            team_two_resource_initially = self._get_resource_percentage(team_two_balls_available, wickets_lost=0)
+            resource_lost = (
+                self._get_resource_percentage(
+                    team_two_balls_available - team_two_balls_used,
+                    wickets_lost_by_team_2_during_interruption
+                ) -
+                self._get_resource_percentage(
+                    team_two_balls_available_after - team_two_balls_used,
+                    wickets_lost_by_team_2_during_interruption
+                )
+            )
+            team_two_total_resource = team_two_resource_initially - resource_lost
+
+            balls_used = np.arange(team_two_balls_available_after + 1)
+            before_interruption = balls_used < team_two_balls_used
+            balls_remaining = np.where(
+                before_interruption,
+                team_two_balls_available - balls_used,
+                team_two_balls_available_after - balls_used
+            )
+            team_two_resource_used = np.where(
+                before_interruption,
+                team_two_resource_initially,
+                team_two_total_resource
+            ) - self._get_resource_percentage_many(balls_remaining, wickets_lost)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return runs_scored_by_team_1 * (team_two_resource_used / team_one_resource_available)
+
+    # Vectorized counterparts.
+    #
+    # Each ``*_many`` method accepts NumPy arrays (or anything broadcastable to
+    # them, including scalars) for every input and returns an array of par
+    # scores, element-for-element identical to calling the scalar method. A
+    # columnar dict can be passed directly with ``**columns``.
+
+    def calculate_par_score_first_innings_cut_short_many(
+        self,
+        overs_available_to_team_1_at_start: ArrayLike,
+        runs_scored_by_team_1: ArrayLike,
+        wickets_lost_by_team_1_during_curtailed: ArrayLike,
+        overs_used_by_team_1_during_curtailed: ArrayLike,
+        overs_available_to_team_2_at_start: ArrayLike,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Vectorized ``calculate_par_score_first_innings_cut_short``.
+        """
+        team_one_balls_initially = self._convert_overs_to_balls_many(overs_available_to_team_1_at_start)
+        team_one_balls_used = self._convert_overs_to_balls_many(overs_used_by_team_1_during_curtailed)
+        team_two_balls_available = self._convert_overs_to_balls_many(overs_available_to_team_2_at_start)
+        runs_scored_by_team_1 = np.asarray(runs_scored_by_team_1)
+
+        balls_remaining_team_one = team_one_balls_initially - team_one_balls_used
+
+        g50_score = self._run_rate_many(runs_scored_by_team_1, team_one_balls_used) * team_one_balls_initially
+
+        team_one_resource_initially = self._get_resource_percentage_many(team_one_balls_initially, 0)
+        team_one_resource_remaining = self._get_resource_percentage_many(
+            balls_remaining_team_one,
+            wickets_lost_by_team_1_during_curtailed
+        )
+        team_one_resource_used = team_one_resource_initially - team_one_resource_remaining
+
+        team_two_resource_available = self._get_resource_percentage_many(team_two_balls_available, 0)
+
+        par_score = runs_scored_by_team_1 + (
+            g50_score * (team_two_resource_available - team_one_resource_used) / 100
+        )
+
+        return np.round(par_score)
+
+    def calculate_par_score_first_innings_interrupted_many(
+        self,
+        overs_available_to_team_1_at_start: ArrayLike,
+        wickets_lost_by_team_1_during_interruption: ArrayLike,
+        overs_used_by_team_1_during_interruption: ArrayLike,
+        revised_overs_to_team_1_after_resumption: ArrayLike,
+        runs_scored_by_team_1: ArrayLike,
+        overs_available_to_team_2_at_start: ArrayLike,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Vectorized ``calculate_par_score_first_innings_interrupted``.
+        """
+        team_one_balls_initially = self._convert_overs_to_balls_many(overs_available_to_team_1_at_start)
+        team_one_balls_used = self._convert_overs_to_balls_many(overs_used_by_team_1_during_interruption)
+        team_one_balls_after = self._convert_overs_to_balls_many(revised_overs_to_team_1_after_resumption)
+        team_two_balls_available = self._convert_overs_to_balls_many(overs_available_to_team_2_at_start)
+        runs_scored_by_team_1 = np.asarray(runs_scored_by_team_1)
+
+        balls_remaining_during_interruption = team_one_balls_initially - team_one_balls_used
+        balls_remaining_after_resumption = team_one_balls_after - team_one_balls_used
+
+        g50_score = self._run_rate_many(runs_scored_by_team_1, team_one_balls_used) * team_one_balls_initially
+
+        team_one_resource_initially = self._get_resource_percentage_many(team_one_balls_initially, 0)
+        team_two_resource_available = self._get_resource_percentage_many(team_two_balls_available, 0)
+
+        team_one_resource_during_interruption = self._get_resource_percentage_many(
+            balls_remaining_during_interruption,
+            wickets_lost_by_team_1_during_interruption
+        )
+        team_one_resource_after_resumption = self._get_resource_percentage_many(
+            balls_remaining_after_resumption,
+            wickets_lost_by_team_1_during_interruption
+        )
+
+        resource_lost = team_one_resource_during_interruption - team_one_resource_after_resumption
+        team_one_total_resource = team_one_resource_initially - resource_lost
+
+        par_score = runs_scored_by_team_1 + (
+            g50_score * (team_two_resource_available - team_one_total_resource) / 100
+        )
+
+        return par_score
+
+    def calculate_par_score_second_innings_cut_short_many(
+        self,
+        overs_available_to_team_1_at_start: ArrayLike,
+        runs_scored_by_team_1: ArrayLike,
+        overs_available_to_team_2_at_start: ArrayLike,
+        overs_used_by_team_2_during_curtailed: ArrayLike,
+        wickets_lost_by_team_2_during_curtailed: ArrayLike,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Vectorized ``calculate_par_score_second_innings_cut_short``.
+        """
+        team_one_balls_available = self._convert_overs_to_balls_many(overs_available_to_team_1_at_start)
+        team_two_balls_available = self._convert_overs_to_balls_many(overs_available_to_team_2_at_start)
+        team_two_balls_used = self._convert_overs_to_balls_many(overs_used_by_team_2_during_curtailed)
+
+        balls_remaining = team_two_balls_available - team_two_balls_used
+
+        team_one_resource_available = self._get_resource_percentage_many(team_one_balls_available, 0)
+        team_two_resource_used = self._get_resource_used_many(
+            team_two_balls_available,
+            balls_remaining,
+            wickets_lost_by_team_2_during_curtailed
+        )
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            par_score = np.asarray(runs_scored_by_team_1) * (team_two_resource_used / team_one_resource_available)
+
+        return par_score
+
+    def calculate_par_score_second_innings_delayed_many(
+        self,
+        overs_available_to_team_1_at_start: ArrayLike,
+        runs_scored_by_team_1: ArrayLike,
+        overs_available_to_team_2_at_start: ArrayLike,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Vectorized ``calculate_par_score_second_innings_delayed``.
+        """
+        team_one_balls_available = self._convert_overs_to_balls_many(overs_available_to_team_1_at_start)
+        team_two_balls_available = self._convert_overs_to_balls_many(overs_available_to_team_2_at_start)
+
+        resource_ratio = self.resource_table.resource_ratio[
+            self._clip_balls(team_one_balls_available),
+            self._clip_balls(team_two_balls_available)
+        ]
+
+        par_score = np.asarray(runs_scored_by_team_1) * resource_ratio
+
+        return par_score
+
+    def calculate_par_score_second_innings_interrupted_many(
+        self,
+        overs_available_to_team_1_at_start: ArrayLike,
+        runs_scored_by_team_1: ArrayLike,
+        overs_available_to_team_2_at_start: ArrayLike,
+        overs_used_by_team_2_during_interruption: ArrayLike,
+        wickets_lost_by_team_2_during_interruption: ArrayLike,
+        revised_overs_to_team_2_after_resumption: ArrayLike,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Vectorized ``calculate_par_score_second_innings_interrupted``.
+        """
+        team_one_balls_available = self._convert_overs_to_balls_many(overs_available_to_team_1_at_start)
+        team_two_balls_available_initially = self._convert_overs_to_balls_many(overs_available_to_team_2_at_start)
+        team_two_balls_used = self._convert_overs_to_balls_many(overs_used_by_team_2_during_interruption)
+        team_two_balls_available_after = self._convert_overs_to_balls_many(revised_overs_to_team_2_after_resumption)
+
+        balls_remaining_during_interruption = team_two_balls_available_initially - team_two_balls_used
+        balls_remaining_after_resumption = team_two_balls_available_after - team_two_balls_used
+
+        team_one_resource_available = self._get_resource_percentage_many(team_one_balls_available, 0)
+        team_two_resource_initially = self._get_resource_percentage_many(team_two_balls_available_initially, 0)
+
+        team_two_resource_during_interruption = self._get_resource_percentage_many(
+            balls_remaining_during_interruption,
+            wickets_lost_by_team_2_during_interruption
+        )
+        team_two_resource_after_resumption = self._get_resource_percentage_many(
+            balls_remaining_after_resumption,
+            wickets_lost_by_team_2_during_interruption
+        )
+
+        resource_lost = team_two_resource_during_interruption - team_two_resource_after_resumption
+        team_two_total_resource = team_two_resource_initially - resource_lost
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            par_score = np.asarray(runs_scored_by_team_1) * (team_two_total_resource / team_one_resource_available)
+
+        return par_score
+
     @staticmethod
     def _convert_overs_to_balls(overs: float) -> int:
         """
@@ -319,8 +605,111 @@ class DLSCalculator:
         Returns:
             Resource percentage available
         """
-        wicket_column = str(wickets_lost)
-        reversed_balls = self.resource_table_df["balls"][::-1]
-        reversed_resources = self.resource_table_df[wicket_column][::-1]
+        table = self.resource_table
+        if not 0 <= wickets_lost < len(table.dense):
+            raise KeyError(str(wickets_lost))
+
+        return np.float64(table.dense[wickets_lost, self._clip_balls(balls_remaining)])
+
+    def _get_resource_used(
+        self,
+        balls_available: int,
+        balls_remaining: int,
+        wickets_lost: int
+    ) -> float:
+        """
+        Get the resource used by an innings that started with no wickets lost.
         
-        return np.interp(balls_remaining, reversed_balls, reversed_resources)
+        Args:
+            balls_available: Number of balls available at the start of the innings
+            balls_remaining: Number of balls remaining in the innings
+            wickets_lost: Number of wickets already lost
+            
+        Returns:
+            Resource percentage used
+        """
+        table = self.resource_table
+        if not 0 <= wickets_lost < len(table.dense):
+            raise KeyError(str(wickets_lost))
+
+        return table.resource_used[
+            wickets_lost,
+            self._clip_balls(balls_available),
+            self._clip_balls(balls_remaining)
+        ]
+
+    def _clip_balls(self, balls: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+        """
+        Clamp ball counts to the table's range.
+
+        The dense grid holds the interpolated value for every whole ball;
+        clamping mirrors np.interp's behaviour outside the tabulated range.
+        """
+        if isinstance(balls, np.ndarray):
+            return np.clip(balls, 0, self.resource_table.max_balls)
+        return min(max(balls, 0), self.resource_table.max_balls)
+
+    @staticmethod
+    def _convert_overs_to_balls_many(overs: ArrayLike) -> np.ndarray:
+        """
+        Vectorized ``_convert_overs_to_balls``.
+
+        ``np.rint`` rounds half to even, matching Python's ``round``.
+        """
+        overs = np.asarray(overs, dtype=float)
+        complete_overs = np.trunc(overs)
+        remaining_balls = np.rint((overs - complete_overs) * 10)
+        return (complete_overs * 6 + remaining_balls).astype(np.int64)
+
+    @staticmethod
+    def _run_rate_many(runs: np.ndarray, balls_used: np.ndarray) -> np.ndarray:
+        """
+        Runs per ball, or 0 where no balls have been used.
+        """
+        runs, balls_used = np.broadcast_arrays(runs, balls_used)
+        run_rate = np.zeros(runs.shape, dtype=float)
+        np.divide(runs, balls_used, out=run_rate, where=balls_used > 0)
+        return run_rate
+
+    def _get_resource_percentage_many(
+        self,
+        balls_remaining: ArrayLike,
+        wickets_lost: ArrayLike
+    ) -> np.ndarray:
+        """
+        Vectorized ``_get_resource_percentage``.
+
+        Raises:
+            KeyError: If any wicket count is outside the table.
+        """
+        wickets_lost = self._check_wickets_many(wickets_lost)
+        return np.asarray(self.resource_table.dense[wickets_lost, self._clip_balls(balls_remaining)], dtype=float)
+
+    def _get_resource_used_many(
+        self,
+        balls_available: np.ndarray,
+        balls_remaining: np.ndarray,
+        wickets_lost: ArrayLike
+    ) -> np.ndarray:
+        """
+        Vectorized ``_get_resource_used``.
+
+        Raises:
+            KeyError: If any wicket count is outside the table.
+        """
+        wickets_lost = self._check_wickets_many(wickets_lost)
+        return self.resource_table.resource_used[
+            wickets_lost,
+            self._clip_balls(balls_available),
+            self._clip_balls(balls_remaining)
+        ]
+
+    def _check_wickets_many(self, wickets_lost: ArrayLike) -> np.ndarray:
+        """
+        Wicket counts as an integer array, rejecting any outside the table.
+        """
+        wickets_lost = np.asarray(wickets_lost, dtype=np.int64)
+        invalid = (wickets_lost < 0) | (wickets_lost >= len(self.resource_table.dense))
+        if invalid.any():
+            raise KeyError(str(wickets_lost[invalid].flat[0]))
+        return wickets_lost
@@ -0,0 +1,125 @@
+"""
+Live par-score tracking for a chasing innings.
+
+This module provides a stateful tracker that fixes the context of a second
+innings once and then keeps the par score up to date, ball by ball, as the
+chase progresses.
+"""
+
+from typing import Optional
+from calculators.dls_calculator import DLSCalculator
+
+
+class LiveParTracker:
+    """
+    Incremental par-score tracker for Team 2's innings.
+
+    The par score at any point is the score Team 2 would need if their
+    innings were cut short there (the ``SecondInningsCurtailed`` scenario).
+    Everything that does not change during the chase (balls available to
+    both teams and Team 1's resources) is resolved once at construction, so
+    each delivered ball or wicket costs one lookup in the precomputed
+    resource-used index.
+    """
+
+    def __init__(
+        self,
+        match_type: str,
+        overs_available_to_team_1_at_start: float,
+        runs_scored_by_team_1: int,
+        overs_available_to_team_2_at_start: float,
+    ):
+        """
+        Initialize the tracker for the start of Team 2's innings.
+
+        Args:
+            match_type: The match type, e.g., 'T20' or 'ODI'
+            overs_available_to_team_1_at_start: Overs available to Team 1 at start
+            runs_scored_by_team_1: Total runs scored by Team 1
+            overs_available_to_team_2_at_start: Overs available to Team 2 at start
+        """
+        self.calculator = DLSCalculator(match_type)
+        self.match_type = match_type
+        self.runs_scored_by_team_1 = runs_scored_by_team_1
+        self.team_two_balls_available = self.calculator._convert_overs_to_balls(overs_available_to_team_2_at_start)
+        self.team_one_resource_available = self.calculator._get_resource_percentage(
+            self.calculator._convert_overs_to_balls(overs_available_to_team_1_at_start),
+            wickets_lost=0
+        )
+        self.balls_used = 0
+        self.wickets_lost = 0
+
+    @property
+    def par_score(self) -> float:
+        """
+        Par score for Team 2 at the current state of the innings.
+        """
+        team_two_resource_used = self.calculator._get_resource_used(
+            self.team_two_balls_available,
+            self.team_two_balls_available - self.balls_used,
+            self.wickets_lost
+        )
+        return self.runs_scored_by_team_1 * (team_two_resource_used / self.team_one_resource_available)
+
+    @property
+    def overs_used(self) -> float:
+        """
+        Overs bowled so far, in decimal format (e.g., 10.3).
+        """
+        return self.balls_used // 6 + (self.balls_used % 6) / 10
+
+    def record_ball(self, wicket: bool = False) -> float:
+        """
+        Record a legal delivery, optionally taking a wicket.
+
+        Returns:
+            The updated par score
+        """
+        if self.balls_used >= self.team_two_balls_available:
+            raise ValueError("No balls remaining in the innings.")
+        if wicket:
+            self._check_wicket_available()
+
+        self.balls_used += 1
+        if wicket:
+            self.wickets_lost += 1
+        return self.par_score
+
+    def record_wicket(self) -> float:
+        """
+        Record a wicket that does not use up a legal delivery (e.g., a run out off a wide).
+
+        Returns:
+            The updated par score
+        """
+        self._check_wicket_available()
+        self.wickets_lost += 1
+        return self.par_score
+
+    def update(self, overs_used: Optional[float] = None, wickets_lost: Optional[int] = None) -> float:
+        """
+        Set the state of the innings directly, e.g., to correct a scoring error.
+
+        Args:
+            overs_used: Overs used by Team 2 so far
+            wickets_lost: Wickets lost by Team 2 so far
+
+        Returns:
+            The updated par score
+        """
+        balls_used = self.balls_used
+        if overs_used is not None:
+            balls_used = self.calculator._convert_overs_to_balls(overs_used)
+            if not 0 <= balls_used <= self.team_two_balls_available:
+                raise ValueError("Overs used must be within the overs available to Team 2.")
+        if wickets_lost is not None and not 0 <= wickets_lost <= 9:
+            raise ValueError("Wickets lost must be between 0 and 9.")
+
+        self.balls_used = balls_used
+        if wickets_lost is not None:
+            self.wickets_lost = wickets_lost
+        return self.par_score
+
+    def _check_wicket_available(self):
+        if self.wickets_lost >= 9:
+            raise ValueError("Team 2 cannot lose more than 9 wickets while the chase is live.")
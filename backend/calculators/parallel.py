@@ -0,0 +1,38 @@
+"""
+Helpers for spreading calculator work across processes.
+"""
+
+from collections import deque
+from concurrent.futures import Executor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_map(
+    function: Callable[[T], R],
+    tasks: Iterable[T],
+    executor: Optional[Executor] = None,
+    max_in_flight: int = 8,
+) -> Iterator[R]:
+    """
+    Lazily maps a function over tasks, yielding results in task order.
+
+    Unlike ``Executor.map``, at most ``max_in_flight`` tasks are submitted
+    ahead of the consumer, so a slow consumer (e.g. one writing results to
+    disk) holds back the producers instead of letting results pile up in
+    memory. Without an executor the tasks run one by one in this process.
+    """
+    if executor is None:
+        for task in tasks:
+            yield function(task)
+        return
+
+    pending = deque()
+    for task in tasks:
+        pending.append(executor.submit(function, task))
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
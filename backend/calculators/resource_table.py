@@ -1,4 +1,11 @@
-import pandas as pd
+import os
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Hashable
+import numpy as np
+from calculators.table_file import expand_to_balls, open_table_file, read_table_header
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 DLS_T20_RESOURCE_DATA = {
     'balls': [120, 114, 108, 102, 96, 90, 84, 78, 72, 66, 60, 54, 48, 42, 36, 30, 24, 18, 12, 6, 0],
@@ -100,11 +107,159 @@ DLS_T10_RESOURCE_DATA = {
 }
 
 
+RESOURCE_DATA = {
+    'T20': DLS_T20_RESOURCE_DATA,
+    'ODI': DLS_ODI_RESOURCE_DATA,
+    'T10': DLS_T10_RESOURCE_DATA
+}
+
+WICKET_COLUMNS = [str(wickets) for wickets in range(10)]
+
+
+def _read_only(values) -> np.ndarray:
+    array = np.array(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
 class ResourceTable:
-    def __init__(self, match_type: str = 'T20'):
-        resource = {
-            'T20': DLS_T20_RESOURCE_DATA,
-            'ODI': DLS_ODI_RESOURCE_DATA,
-            'T10': DLS_T10_RESOURCE_DATA
-        }
-        self.resource_df = pd.DataFrame(resource[match_type])
+    """
+    Compiled, read-only view of a DLS resource table.
+
+    The tabulated points are stored in ascending ball order, and are expanded
+    once, with the table's interpolation, into a dense ``(10, max_balls + 1)``
+    grid so any integer ball count can be answered with a single index.
+    Instances are shared between threads through ``get_resource_table`` and
+    must never be mutated.
+
+    Besides the bundled tables, any table registered in ``TABLE_FILES`` can
+    be selected by name. Its dense grid is the memory-mapped float32 matrix
+    of the table file, shared by every process that maps it.
+    """
+
+    def __init__(self, match_type: str = 'T20', interpolation: str = 'linear'):
+        """
+        Args:
+            match_type: The match type of a bundled table, e.g., 'T20' or
+                'ODI', or the name of a registered table file
+            interpolation: How a bundled table is expanded to every ball, one
+                of ``INTERPOLATIONS``; table files are stored expanded
+
+        Raises:
+            KeyError: If there is no table with that name.
+            ValueError: If the interpolation is unknown.
+        """
+        self.name = match_type
+        self.columns = ['balls'] + WICKET_COLUMNS
+        self.interpolation = interpolation
+
+        if match_type in RESOURCE_DATA:
+            data = RESOURCE_DATA[match_type]
+            self.match_type = match_type
+            self.balls = _read_only(data['balls'][::-1])
+            self.resources = _read_only([data[column][::-1] for column in WICKET_COLUMNS])
+            self.dense = _read_only(expand_to_balls(data, WICKET_COLUMNS, interpolation))
+        else:
+            header, self.dense = open_table_file(TABLE_FILES[match_type])
+            self.match_type = header.match_type
+            self.balls = _read_only(np.arange(header.max_balls + 1))
+            self.resources = self.dense
+
+        self.max_balls = int(self.balls[-1])
+        self._resource_df = None
+        # Objects built from the table by its users, such as bound
+        # calculator methods, kept here so they are dropped with the table
+        # even when they reference it
+        self.memo: Dict[Hashable, Any] = {}
+
+    @classmethod
+    def from_file(cls, path: str) -> "ResourceTable":
+        """
+        Register a table file and return its table.
+        """
+        return cls(register_table_file(path))
+
+    @cached_property
+    def resource_ratio(self) -> np.ndarray:
+        """
+        Ratio index for innings that both start with no wickets lost.
+
+        ``resource_ratio[team_one_balls, team_two_balls]`` is the team 2 to
+        team 1 resource ratio, so a delayed-start target is a single
+        multiplication of the runs scored. Built on first access.
+        """
+        full_innings = self.dense[0].astype(float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _read_only(full_innings[np.newaxis, :] / full_innings[:, np.newaxis])
+
+    @cached_property
+    def resource_used(self) -> np.ndarray:
+        """
+        Resources used by an innings that started with no wickets lost.
+
+        ``resource_used[wickets, balls_available, balls_remaining]`` is the
+        resource at the start of the innings minus the resource remaining.
+        Built on first access.
+        """
+        dense = self.dense.astype(float)
+        return _read_only(dense[0][np.newaxis, :, np.newaxis] - dense[:, np.newaxis, :])
+
+    @property
+    def resource_df(self) -> "pd.DataFrame":
+        """
+        The table as a DataFrame in its original (descending balls) order.
+
+        pandas is an optional dependency used only for analytics, so it is
+        imported here, on first access, rather than at module import.
+        """
+        if self._resource_df is None:
+            import pandas as pd
+            if self.name in RESOURCE_DATA:
+                data = RESOURCE_DATA[self.name]
+            else:
+                data = {'balls': self.balls[::-1].astype(int)}
+                data.update(zip(WICKET_COLUMNS, self.resources[:, ::-1].astype(float)))
+            self._resource_df = pd.DataFrame(data)
+        return self._resource_df
+
+
+# Table files by table name, added by register_table_file
+TABLE_FILES: Dict[str, str] = {}
+
+
+def register_table_file(path: str) -> str:
+    """
+    Make a table file selectable by the name in its header.
+
+    Returns:
+        The table name
+
+    Raises:
+        ValueError: If the file is not a valid table file, or its name is taken by a bundled table.
+    """
+    header = read_table_header(path)
+    if header.name in RESOURCE_DATA:
+        raise ValueError(f"Table name {header.name} is reserved for a bundled table.")
+    TABLE_FILES[header.name] = os.path.abspath(path)
+    RESOURCE_TABLES.pop(header.name, None)
+    return header.name
+
+
+RESOURCE_TABLES: Dict[str, ResourceTable] = {
+    match_type: ResourceTable(match_type) for match_type in RESOURCE_DATA
+}
+
+
+def get_resource_table(match_type: str = 'T20') -> ResourceTable:
+    """
+    Return the shared, precompiled resource table for a match format or table name.
+
+    Tables of table files are mapped on first use.
+
+    Raises:
+        KeyError: If there is no table with that name.
+    """
+    table = RESOURCE_TABLES.get(match_type)
+    if table is None:
+        table = RESOURCE_TABLES.setdefault(match_type, ResourceTable(match_type))
+    return table
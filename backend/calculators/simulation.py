@@ -0,0 +1,340 @@
+"""
+Monte Carlo simulation of rain-affected matches.
+
+This module generates random populations of interrupted matches (random
+interruption points, wicket states and over reductions) for every DLS
+scenario, evaluates them with the vectorized ``DLSCalculator`` methods and
+summarizes the resulting par scores and revised targets. Populations are
+produced in seeded chunks, so a run is reproducible for a given seed
+whatever the number of worker processes, and chunks can be streamed to disk
+instead of being held in memory.
+
+Usage (from the backend directory):
+    python -m calculators.simulation --match-format ODI --size 1000000 --workers 4 --output-dir simulations/
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from calculators.dls_calculator import DLSCalculator
+from calculators.parallel import ordered_map
+from calculators.resource_table import get_resource_table
+
+
+SCENARIO_METHODS: Dict[str, str] = {
+    "FirstInningsCurtailed": "calculate_par_score_first_innings_cut_short_many",
+    "FirstInningsInterrupted": "calculate_par_score_first_innings_interrupted_many",
+    "SecondInningsCurtailed": "calculate_par_score_second_innings_cut_short_many",
+    "SecondInningsDelayed": "calculate_par_score_second_innings_delayed_many",
+    "SecondInningsInterrupted": "calculate_par_score_second_innings_interrupted_many",
+}
+
+SimulationTask = Tuple[str, str, int, np.random.SeedSequence, Tuple[float, float], bool]
+
+
+def balls_to_overs(balls: np.ndarray) -> np.ndarray:
+    """
+    Convert ball counts to overs in decimal format (e.g., 63 balls -> 10.3).
+    """
+    return balls // 6 + (balls % 6) / 10
+
+
+def format_csv_rows(columns: Dict[str, np.ndarray]) -> str:
+    """
+    Format columns as CSV rows, overs with one decimal and counts as integers.
+    """
+    row_format = ",".join("%.1f" if values.dtype.kind == "f" else "%d" for values in columns.values()) + "\n"
+    return "".join([row_format % row for row in zip(*(values.tolist() for values in columns.values()))])
+
+
+def generate_scenarios(
+    scenario: str,
+    match_type: str,
+    size: int,
+    rng: np.random.Generator,
+    runs_per_ball: Tuple[float, float] = (0.7, 1.7),
+) -> Dict[str, np.ndarray]:
+    """
+    Generate a random population of matches for one scenario.
+
+    Both innings are scheduled for the full overs of the format. Interruption
+    points and wicket states are uniform, runs are scored at a uniform random
+    rate per ball, and every generated match satisfies the scenario's input
+    rules.
+
+    Args:
+        scenario: The scenario type, e.g., 'SecondInningsInterrupted'
+        match_type: The match type, e.g., 'T20' or 'ODI'
+        size: Number of matches to generate
+        rng: The random generator to draw from
+        runs_per_ball: Range of Team 1's scoring rate
+
+    Returns:
+        The scenario's inputs as columns, in the calculator's units
+    """
+    max_balls = get_resource_table(match_type).max_balls
+    full_balls = np.full(size, max_balls)
+    scoring_rate = rng.uniform(*runs_per_ball, size)
+    wickets_lost = rng.integers(0, 10, size)
+
+    if scenario == "FirstInningsCurtailed":
+        balls_used = rng.integers(1, max_balls, size)
+        return {
+            "overs_available_to_team_1_at_start": balls_to_overs(full_balls),
+            "runs_scored_by_team_1": np.rint(scoring_rate * balls_used).astype(np.int64),
+            "wickets_lost_by_team_1_during_curtailed": wickets_lost,
+            "overs_used_by_team_1_during_curtailed": balls_to_overs(balls_used),
+            "overs_available_to_team_2_at_start": balls_to_overs(balls_used),
+        }
+
+    if scenario == "FirstInningsInterrupted":
+        balls_used = rng.integers(1, max_balls, size)
+        revised_balls = rng.integers(balls_used, max_balls)
+        return {
+            "overs_available_to_team_1_at_start": balls_to_overs(full_balls),
+            "overs_used_by_team_1_during_interruption": balls_to_overs(balls_used),
+            "wickets_lost_by_team_1_during_interruption": wickets_lost,
+            "revised_overs_to_team_1_after_resumption": balls_to_overs(revised_balls),
+            "runs_scored_by_team_1": np.rint(scoring_rate * revised_balls).astype(np.int64),
+            "overs_available_to_team_2_at_start": balls_to_overs(revised_balls),
+        }
+
+    runs_scored_by_team_1 = np.rint(scoring_rate * max_balls).astype(np.int64)
+
+    if scenario == "SecondInningsCurtailed":
+        return {
+            "overs_available_to_team_1_at_start": balls_to_overs(full_balls),
+            "runs_scored_by_team_1": runs_scored_by_team_1,
+            "overs_available_to_team_2_at_start": balls_to_overs(full_balls),
+            "overs_used_by_team_2_during_curtailed": balls_to_overs(rng.integers(1, max_balls, size)),
+            "wickets_lost_by_team_2_during_curtailed": wickets_lost,
+        }
+
+    if scenario == "SecondInningsDelayed":
+        return {
+            "overs_available_to_team_1_at_start": balls_to_overs(full_balls),
+            "runs_scored_by_team_1": runs_scored_by_team_1,
+            "overs_available_to_team_2_at_start": rng.integers(1, max_balls // 6 + 1, size).astype(float),
+        }
+
+    if scenario == "SecondInningsInterrupted":
+        balls_used = rng.integers(1, max_balls - 1, size)
+        return {
+            "overs_available_to_team_1_at_start": balls_to_overs(full_balls),
+            "runs_scored_by_team_1": runs_scored_by_team_1,
+            "overs_available_to_team_2_at_start": balls_to_overs(full_balls),
+            "overs_used_by_team_2_during_interruption": balls_to_overs(balls_used),
+            "wickets_lost_by_team_2_during_interruption": wickets_lost,
+            "revised_overs_to_team_2_after_resumption": balls_to_overs(rng.integers(balls_used + 1, max_balls)),
+        }
+
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def simulate_chunk(task: SimulationTask) -> Tuple[str, Dict[str, np.ndarray], Optional[str]]:
+    """
+    Generate and evaluate one chunk of matches.
+
+    Module-level so it can run in a worker process; the resource tables are
+    loaded once per process by the calculator registry. Formatting the CSV
+    rows here keeps it in the workers rather than in the process writing
+    the output.
+
+    Returns:
+        The scenario, its columns with ``par_score`` and ``revised_target``
+        appended, and the columns as CSV rows if requested
+    """
+    match_type, scenario, size, seed, runs_per_ball, format_rows = task
+    columns = generate_scenarios(scenario, match_type, size, np.random.default_rng(seed), runs_per_ball)
+
+    calculator = DLSCalculator(match_type)
+    par_scores = np.round(getattr(calculator, SCENARIO_METHODS[scenario])(**columns)).astype(np.int64)
+
+    columns["par_score"] = par_scores
+    columns["revised_target"] = par_scores + 1
+    return scenario, columns, format_csv_rows(columns) if format_rows else None
+
+
+class ScoreDistribution:
+    """
+    Exact distribution of integer scores, built incrementally.
+
+    Only the count of each distinct score is kept, so memory does not grow
+    with the number of matches.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+
+    def update(self, scores: np.ndarray):
+        values, counts = np.unique(scores, return_counts=True)
+        self.counts.update(dict(zip(values.tolist(), counts.tolist())))
+
+    def summary(self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)) -> Dict[str, float]:
+        """
+        Count, mean, standard deviation, extremes and percentiles of the scores.
+        """
+        if not self.counts:
+            return {"count": 0}
+
+        values = np.array(sorted(self.counts), dtype=np.float64)
+        counts = np.array([self.counts[value] for value in sorted(self.counts)], dtype=np.float64)
+        total = counts.sum()
+        mean = (values * counts).sum() / total
+        cumulative = np.cumsum(counts)
+
+        summary = {
+            "count": int(total),
+            "mean": float(mean),
+            "std": float(np.sqrt((counts * (values - mean) ** 2).sum() / total)),
+            "min": int(values[0]),
+            "max": int(values[-1]),
+        }
+        for percentile in percentiles:
+            index = np.searchsorted(cumulative, percentile / 100 * total)
+            summary[f"p{percentile:g}"] = int(values[min(index, len(values) - 1)])
+        return summary
+
+
+class MonteCarloSimulator:
+    """
+    Simulates populations of rain-affected matches for one match format.
+
+    Each scenario's population is split into chunks with independent seeds
+    spawned from the simulation seed, and chunks are evaluated in a process
+    pool when more than one worker is requested. Results are consumed in
+    chunk order, so summaries and output files do not depend on the number
+    of workers.
+    """
+
+    def __init__(
+        self,
+        match_type: str = 'T20',
+        scenarios: Optional[Sequence[str]] = None,
+        size: int = 100000,
+        chunk_size: int = 100000,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        runs_per_ball: Tuple[float, float] = (0.7, 1.7),
+    ):
+        """
+        Initialize the simulator.
+
+        Args:
+            match_type: The match type, e.g., 'T20' or 'ODI'
+            scenarios: Scenario types to simulate, all of them by default
+            size: Number of matches per scenario
+            chunk_size: Number of matches evaluated at once
+            seed: Seed of the random generator; a fresh one is drawn if omitted
+            workers: Number of worker processes
+            runs_per_ball: Range of Team 1's scoring rate
+        """
+        get_resource_table(match_type)
+        self.match_type = match_type
+        self.scenarios: List[str] = list(scenarios or SCENARIO_METHODS)
+        for scenario in self.scenarios:
+            if scenario not in SCENARIO_METHODS:
+                raise ValueError(f"Unknown scenario: {scenario}")
+        self.size = size
+        self.chunk_size = chunk_size
+        self.seed = np.random.SeedSequence(seed)
+        self.workers = workers
+        self.runs_per_ball = runs_per_ball
+
+    def tasks(self, format_rows: bool = False) -> Iterator[SimulationTask]:
+        """
+        The chunks to simulate, scenario by scenario.
+        """
+        chunk_sizes = [self.chunk_size] * (self.size // self.chunk_size)
+        if self.size % self.chunk_size:
+            chunk_sizes.append(self.size % self.chunk_size)
+
+        for scenario, scenario_seed in zip(self.scenarios, self.seed.spawn(len(self.scenarios))):
+            for size, seed in zip(chunk_sizes, scenario_seed.spawn(len(chunk_sizes))):
+                yield self.match_type, scenario, size, seed, self.runs_per_ball, format_rows
+
+    def chunks(self, format_rows: bool = False) -> Iterator[Tuple[str, Dict[str, np.ndarray], Optional[str]]]:
+        """
+        Lazily evaluate every chunk, in order.
+
+        At most two chunks per worker are in flight at once.
+        """
+        with ExitStack() as stack:
+            executor = None
+            if self.workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=self.workers))
+            yield from ordered_map(simulate_chunk, self.tasks(format_rows), executor, max_in_flight=2 * self.workers)
+
+    def run(self, output_dir: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Run the simulation.
+
+        Args:
+            output_dir: If given, every simulated match is appended to
+                ``<output_dir>/<match_type>_<scenario>.csv`` as its chunk completes
+
+        Returns:
+            Distributions of par scores and revised targets per scenario
+        """
+        distributions = {
+            scenario: {"par_score": ScoreDistribution(), "revised_target": ScoreDistribution()}
+            for scenario in self.scenarios
+        }
+
+        with ExitStack() as stack:
+            files = {}
+            for scenario, columns, rows in self.chunks(format_rows=output_dir is not None):
+                for name, distribution in distributions[scenario].items():
+                    distribution.update(columns[name])
+
+                if output_dir is None:
+                    continue
+                if scenario not in files:
+                    os.makedirs(output_dir, exist_ok=True)
+                    path = os.path.join(output_dir, f"{self.match_type}_{scenario}.csv")
+                    files[scenario] = stack.enter_context(open(path, "w"))
+                    files[scenario].write(",".join(columns) + "\n")
+                files[scenario].write(rows)
+
+        return {
+            scenario: {name: distribution.summary() for name, distribution in scenario_distributions.items()}
+            for scenario, scenario_distributions in distributions.items()
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--match-format", default="T20", choices=["ODI", "T20", "T10"])
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIO_METHODS), dest="scenarios")
+    parser.add_argument("--size", type=int, default=100000, help="Matches per scenario")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output-dir", default=None)
+    args = parser.parse_args()
+
+    simulator = MonteCarloSimulator(
+        args.match_format,
+        scenarios=args.scenarios,
+        size=args.size,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    start = time.perf_counter()
+    summary = simulator.run(args.output_dir)
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps(summary, indent=2))
+    matches = args.size * len(simulator.scenarios)
+    print(f"{matches} matches in {elapsed:.2f} s ({matches / elapsed:,.0f} matches/s)")
+
+
+if __name__ == "__main__":
+    main()
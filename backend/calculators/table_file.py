@@ -0,0 +1,292 @@
+"""
+Binary resource-table files.
+
+A table file holds one resource table already expanded to every ball, so it
+can be memory-mapped and used as is: loading it costs no parsing, and every
+process mapping the same file shares its pages.
+
+Layout (little-endian):
+    64-byte header: magic ``DLSTABLE``, format version (uint16), wicket rows
+    (uint16), max balls (uint32), match type (8 bytes, ASCII) and table name
+    (32 bytes, UTF-8), both NUL-padded, then 8 reserved bytes
+    float32 matrix of shape (wickets, max_balls + 1), C order, where
+    ``[wickets_lost, balls_remaining]`` is the resource percentage
+
+Usage (from the backend directory):
+    python -m calculators.table_file build ODI tables/odi-2024.dlstable --name ODI-2024 --source odi-2024.json
+    python -m calculators.table_file build ODI tables/odi-pchip.dlstable --name ODI-pchip --interpolation pchip
+    python -m calculators.table_file build T20 tables/t20-legacy.dlstable --source ../dls_resource_data_for_t20s.csv
+    python -m calculators.table_file inspect tables/odi-2024.dlstable
+"""
+
+import argparse
+import csv
+import json
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+import numpy as np
+
+
+TABLE_FILE_MAGIC = b"DLSTABLE"
+TABLE_FILE_VERSION = 1
+TABLE_FILE_EXTENSION = ".dlstable"
+TABLE_FILE_DTYPE = np.dtype("<f4")
+
+_HEADER = struct.Struct("<8sHHI8s32s8x")
+
+
+@dataclass(frozen=True)
+class TableFileHeader:
+    name: str
+    match_type: str
+    max_balls: int
+    wickets: int = 10
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.wickets, self.max_balls + 1
+
+
+def interpolate_linear(ball_grid: np.ndarray, balls: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Piecewise-linear interpolation between the tabulated points.
+    """
+    return np.interp(ball_grid, balls, values)
+
+
+def interpolate_monotone_cubic(ball_grid: np.ndarray, balls: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Monotone piecewise-cubic (PCHIP, Fritsch-Carlson) interpolation.
+
+    The curve is smooth through the tabulated points but never overshoots
+    them, so a column that never decreases with balls stays that way and
+    flat stretches stay flat.
+    """
+    if len(balls) < 3:
+        return interpolate_linear(ball_grid, balls, values)
+
+    widths = np.diff(balls)
+    slopes = np.diff(values) / widths
+
+    # Interior slopes: weighted harmonic mean of the neighbouring secants, or
+    # zero at a local extremum or flat stretch
+    slopes_at = np.zeros_like(values)
+    w1 = 2 * widths[1:] + widths[:-1]
+    w2 = widths[1:] + 2 * widths[:-1]
+    same_sign = slopes[:-1] * slopes[1:] > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        harmonic = (w1 + w2) / (w1 / slopes[:-1] + w2 / slopes[1:])
+    slopes_at[1:-1] = np.where(same_sign, harmonic, 0.0)
+    slopes_at[0] = _end_slope(widths[0], widths[1], slopes[0], slopes[1])
+    slopes_at[-1] = _end_slope(widths[-1], widths[-2], slopes[-1], slopes[-2])
+
+    ball_grid = np.clip(ball_grid, balls[0], balls[-1])
+    index = np.clip(np.searchsorted(balls, ball_grid, side="right") - 1, 0, len(widths) - 1)
+    width, slope = widths[index], slopes[index]
+    start_slope, end_slope = slopes_at[index], slopes_at[index + 1]
+    t = (ball_grid - balls[index]) / width
+    # Cubic Hermite polynomial written around the interval's start, so flat
+    # intervals reproduce their value exactly
+    return values[index] + width * t * (
+        start_slope
+        + t * (3 * slope - 2 * start_slope - end_slope)
+        + t ** 2 * (start_slope + end_slope - 2 * slope)
+    )
+
+
+def _end_slope(width: float, next_width: float, slope: float, next_slope: float) -> float:
+    # Three-point estimate, limited so the end interval keeps the data's shape
+    end_slope = ((2 * width + next_width) * slope - width * next_slope) / (width + next_width)
+    if np.sign(end_slope) != np.sign(slope):
+        return 0.0
+    if np.sign(slope) != np.sign(next_slope) and abs(end_slope) > 3 * abs(slope):
+        return 3 * slope
+    return end_slope
+
+
+INTERPOLATIONS: Dict[str, Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]] = {
+    "linear": interpolate_linear,
+    "pchip": interpolate_monotone_cubic,
+}
+
+
+def expand_to_balls(
+    data: Dict[str, List[float]],
+    wicket_columns: List[str],
+    interpolation: str = "linear",
+) -> np.ndarray:
+    """
+    Expand a tabulated table (a ``balls`` column plus one column per wicket
+    count, as in ``RESOURCE_DATA``) to a value for every ball.
+
+    Values between the tabulated points come from one of ``INTERPOLATIONS``.
+    Tabulated points are kept exactly, so a ball-level table (one row per
+    ball) is stored as is whatever the interpolation.
+
+    Raises:
+        ValueError: If the interpolation is unknown.
+    """
+    if interpolation not in INTERPOLATIONS:
+        raise ValueError(f"Unknown interpolation {interpolation}; expected one of {', '.join(INTERPOLATIONS)}.")
+    interpolate = INTERPOLATIONS[interpolation]
+
+    order = np.argsort(data["balls"])
+    balls = np.asarray(data["balls"], dtype=float)[order]
+    ball_grid = np.arange(int(balls[-1]) + 1, dtype=float)
+    resources = np.array([
+        interpolate(ball_grid, balls, np.asarray(data[column], dtype=float)[order]) for column in wicket_columns
+    ])
+    if interpolation != "linear":
+        # Curves of neighbouring wicket columns can cross slightly between
+        # tabulated points; losing a wicket must never add resources
+        resources = np.minimum.accumulate(resources, axis=0)
+    return resources
+
+
+def write_table_file(path: str, name: str, match_type: str, resources: np.ndarray):
+    """
+    Write a per-ball resource matrix of shape (wickets, max_balls + 1) to a table file.
+
+    The file is written next to its destination and moved into place, so
+    processes mapping an existing file at that path keep their pages and
+    new readers never see a partly written table.
+    """
+    resources = np.ascontiguousarray(resources, dtype=TABLE_FILE_DTYPE)
+    if resources.ndim != 2:
+        raise ValueError("The resource matrix must have two dimensions (wickets, balls).")
+    if len(name.encode("utf-8")) > 32 or len(match_type) > 8:
+        raise ValueError("Table names are limited to 32 bytes and match types to 8 characters.")
+
+    header = _HEADER.pack(
+        TABLE_FILE_MAGIC,
+        TABLE_FILE_VERSION,
+        resources.shape[0],
+        resources.shape[1] - 1,
+        match_type.encode("ascii"),
+        name.encode("utf-8"),
+    )
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".tmp", delete=False) as file:
+        file.write(header)
+        file.write(resources.tobytes())
+    os.chmod(file.name, 0o644)
+    os.replace(file.name, path)
+
+
+def read_table_header(path: str) -> TableFileHeader:
+    """
+    Read and check the header of a table file.
+
+    Raises:
+        ValueError: If the file is not a table file of a supported version, or is truncated.
+    """
+    with open(path, "rb") as file:
+        raw = file.read(_HEADER.size)
+    if len(raw) < _HEADER.size:
+        raise ValueError(f"{path} is not a resource table file.")
+
+    magic, version, wickets, max_balls, match_type, name = _HEADER.unpack(raw)
+    if magic != TABLE_FILE_MAGIC:
+        raise ValueError(f"{path} is not a resource table file.")
+    if version != TABLE_FILE_VERSION:
+        raise ValueError(f"{path} has unsupported table file version {version}.")
+
+    header = TableFileHeader(
+        name=name.rstrip(b"\0").decode("utf-8"),
+        match_type=match_type.rstrip(b"\0").decode("ascii"),
+        max_balls=max_balls,
+        wickets=wickets,
+    )
+    expected_size = _HEADER.size + header.shape[0] * header.shape[1] * TABLE_FILE_DTYPE.itemsize
+    if os.path.getsize(path) != expected_size:
+        raise ValueError(f"{path} is truncated or has trailing data.")
+    return header
+
+
+def open_table_file(path: str) -> Tuple[TableFileHeader, np.memmap]:
+    """
+    Memory-map a table file.
+
+    Returns:
+        The header and a read-only float32 view of the resource matrix
+    """
+    header = read_table_header(path)
+    resources = np.memmap(path, dtype=TABLE_FILE_DTYPE, mode="r", offset=_HEADER.size, shape=header.shape)
+    return header, resources
+
+
+def read_table_source(path: str, columns: List[str]) -> Dict[str, List[float]]:
+    """
+    Read a tabulated table to build a table file from: a CSV file with a
+    header row (such as the legacy ``dls_resource_data_for_t20s.csv``), or a
+    JSON object of columns, either with a ``balls`` column plus ``columns``.
+
+    Raises:
+        ValueError: If a column is missing or a value is not a number.
+    """
+    if path.lower().endswith(".csv"):
+        # utf-8-sig, as the legacy file starts with a byte order mark
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            reader = csv.DictReader(file)
+            rows = list(reader)
+        data = {column: [row[column] for row in rows] for column in reader.fieldnames or []}
+    else:
+        with open(path) as file:
+            data = json.load(file)
+
+    missing = [column for column in ["balls", *columns] if column not in data]
+    if missing:
+        raise ValueError(f"{path} has no {', '.join(missing)} column.")
+    try:
+        return {column: [float(value) for value in data[column]] for column in ["balls", *columns]}
+    except (TypeError, ValueError):
+        raise ValueError(f"{path} has values that are not numbers.")
+
+
+def main():
+    from calculators.resource_table import RESOURCE_DATA, WICKET_COLUMNS
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Write a table file")
+    build.add_argument("match_type")
+    build.add_argument("path")
+    build.add_argument("--name", help="Table name; defaults to the file name")
+    build.add_argument(
+        "--source",
+        help="CSV or JSON file with a 'balls' column and one column per wicket count (0 to 9), tabulated or "
+             "ball by ball; defaults to the bundled table",
+    )
+    build.add_argument(
+        "--interpolation",
+        choices=list(INTERPOLATIONS),
+        default="linear",
+        help="How to fill in balls between tabulated points",
+    )
+
+    inspect = commands.add_parser("inspect", help="Print the header of a table file")
+    inspect.add_argument("path")
+
+    args = parser.parse_args()
+
+    if args.command == "inspect":
+        header, resources = open_table_file(args.path)
+        print(f"{header.name}: {header.match_type}, {header.max_balls} balls, {header.wickets} wicket rows")
+        print(f"full innings resource: {resources[0, -1]:.1f}")
+        return
+
+    if args.source:
+        data = read_table_source(args.source, WICKET_COLUMNS)
+    else:
+        data = RESOURCE_DATA[args.match_type]
+    name = args.name or os.path.splitext(os.path.basename(args.path))[0]
+    write_table_file(args.path, name, args.match_type, expand_to_balls(data, WICKET_COLUMNS, args.interpolation))
+    print(f"wrote {name} to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
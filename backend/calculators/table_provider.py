@@ -0,0 +1,346 @@
+"""
+Versioned resource tables.
+
+Tables come from providers (the bundled tables, a directory of table files)
+and are held by a registry keyed by (match type, version). Every table is
+validated once when it is loaded, and its compiled lookup arrays are cached
+on its ``ResourceTable``, so each version is compiled at most once.
+
+The registry has one active version per match type. Reloading or activating
+another version builds a new registry state and swaps it in with a single
+assignment, so readers never see a half-updated registry and running
+calculations keep the table they started with. When a table directory is
+configured, its contents and its ``active.json`` (``{"ODI": "ODI-2024"}``)
+are polled, so every worker picks up new tables and active versions without
+a restart. A table file that cannot be read or is invalid, or an active
+version that does not exist, is logged and ignored, so one bad file never
+stops a worker from starting.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from calculators.resource_table import RESOURCE_DATA, RESOURCE_TABLES, ResourceTable, get_resource_table
+from calculators.table_file import TABLE_FILE_EXTENSION
+
+
+DEFAULT_TABLE_VERSION = "standard"
+ACTIVE_VERSIONS_FILE = "active.json"
+
+logger = logging.getLogger(__name__)
+
+TableKey = Tuple[str, str]
+
+
+def validate_resource_table(table: ResourceTable):
+    """
+    Check that a table is usable: one row per wicket count, a value for every
+    ball, percentages between 0 and 100, no resources with no balls left, and
+    resources that never grow as balls run out or wickets fall.
+
+    Raises:
+        ValueError: If the table is invalid.
+    """
+    dense = np.asarray(table.dense, dtype=float)
+    problems = []
+    if dense.shape != (10, table.max_balls + 1) or table.max_balls < 1:
+        problems.append(f"has shape {dense.shape}, expected (10, {table.max_balls + 1})")
+    elif not np.isfinite(dense).all() or dense.min() < 0 or dense.max() > 100:
+        problems.append("has values outside 0 to 100")
+    else:
+        if (dense[:, 0] != 0).any():
+            problems.append("has resources left with no balls remaining")
+        if (np.diff(dense, axis=1) < 0).any():
+            problems.append("has resources that increase as balls run out")
+        if (np.diff(dense, axis=0) > 0).any():
+            problems.append("has resources that increase as wickets fall")
+    if problems:
+        raise ValueError(f"Resource table {table.name} " + " and ".join(problems) + ".")
+
+
+class ResourceTableProvider(ABC):
+    """
+    Source of versioned resource tables.
+    """
+
+    @abstractmethod
+    def load(self) -> Dict[TableKey, ResourceTable]:
+        """
+        Returns every table the provider offers, by (match type, version).
+        """
+
+    def signature(self) -> object:
+        """
+        A value that changes whenever ``load`` would return different tables.
+        """
+        return None
+
+
+class BundledTableProvider(ResourceTableProvider):
+    """
+    The tables bundled in ``resource_table``, as version ``standard``,
+    expanded to every ball with the given interpolation.
+    """
+
+    def __init__(self, interpolation: str = "linear"):
+        self.interpolation = interpolation
+        self._tables: Dict[TableKey, ResourceTable] = {}
+
+    def load(self):
+        if not self._tables:
+            self._tables = {
+                (match_type, DEFAULT_TABLE_VERSION): (
+                    RESOURCE_TABLES[match_type] if self.interpolation == "linear"
+                    else ResourceTable(match_type, self.interpolation)
+                )
+                for match_type in RESOURCE_DATA
+            }
+        return self._tables
+
+
+class TableFileProvider(ResourceTableProvider):
+    """
+    Table files in a directory, versioned by the table name in their header.
+
+    A table whose file has not changed since the previous load is reused,
+    together with its compiled lookup arrays. Files that cannot be read or
+    hold an invalid table are logged and left out.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._tables: Dict[Tuple, ResourceTable] = {}
+
+    def _files(self) -> List[Tuple[str, int, int, int]]:
+        try:
+            names = sorted(os.listdir(self.directory))
+        except FileNotFoundError:
+            return []
+        files = []
+        for name in names:
+            if name.endswith(TABLE_FILE_EXTENSION):
+                path = os.path.join(self.directory, name)
+                stat = os.stat(path)
+                files.append((path, stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return files
+
+    def signature(self):
+        return tuple(self._files())
+
+    def load(self):
+        tables, cache = {}, {}
+        for file in self._files():
+            table = self._tables.get(file)
+            if table is None:
+                try:
+                    table = ResourceTable.from_file(file[0])
+                    validate_resource_table(table)
+                except (OSError, ValueError) as e:
+                    logger.warning("Skipping resource table file %s: %s", file[0], e)
+                    continue
+            cache[file] = table
+            tables[(table.match_type, table.name)] = table
+        self._tables = cache
+        return tables
+
+
+@dataclass(frozen=True)
+class _RegistryState:
+    tables: Dict[TableKey, ResourceTable]
+    active: Dict[str, str]
+    signature: object
+
+
+class ResourceTableRegistry:
+    """
+    Versioned resource tables with an atomically swappable active version per match type.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[ResourceTableProvider],
+        directory: Optional[str] = None,
+        check_interval: float = 5.0,
+    ):
+        """
+        Args:
+            providers: Table sources; later providers override earlier ones
+            directory: Directory holding ``active.json``, polled with the providers
+            check_interval: Seconds between checks for changed tables, or 0 to disable them
+        """
+        self.providers = list(providers)
+        self.directory = directory
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._state = _RegistryState({}, {}, None)
+        self.reload()
+
+    def _active_versions_path(self) -> Optional[str]:
+        return os.path.join(self.directory, ACTIVE_VERSIONS_FILE) if self.directory else None
+
+    def _signature(self) -> object:
+        path = self._active_versions_path()
+        active_mtime = os.stat(path).st_mtime_ns if path and os.path.exists(path) else None
+        return tuple(provider.signature() for provider in self.providers), active_mtime
+
+    def _configured_versions(self) -> Dict[str, str]:
+        path = self._active_versions_path()
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring %s: %s", path, e)
+            return {}
+
+    def reload(self):
+        """
+        Load and validate every provider's tables and swap them in.
+
+        The active version of each match type is the one configured in
+        ``active.json``, else the one active before, else ``standard``; a
+        configured version that does not exist is logged and ignored. If
+        any table is invalid, the registry is left unchanged.
+
+        Raises:
+            ValueError: If a table is invalid.
+        """
+        with self._lock:
+            signature = self._signature()
+            tables: Dict[TableKey, ResourceTable] = {}
+            for provider in self.providers:
+                tables.update(provider.load())
+            for key, table in tables.items():
+                if key not in self._state.tables or self._state.tables[key] is not table:
+                    validate_resource_table(table)
+
+            # A match type without a bundled table starts on its first version
+            active = {}
+            for match_type, version in sorted(tables):
+                if match_type not in active or version == DEFAULT_TABLE_VERSION:
+                    active[match_type] = version
+            active.update({
+                match_type: version for match_type, version in self._state.active.items()
+                if (match_type, version) in tables
+            })
+            for match_type, version in self._configured_versions().items():
+                if (match_type, version) not in tables:
+                    logger.warning(
+                        "Resource table version %s for %s does not exist; keeping %s.",
+                        version, match_type, active.get(match_type)
+                    )
+                    continue
+                active[match_type] = version
+
+            self._state = _RegistryState(tables, active, signature)
+            self._next_check = time.monotonic() + self.check_interval
+
+    def _refresh(self):
+        """
+        Reload if a provider or ``active.json`` changed; checked at most once per interval.
+        """
+        if not self.check_interval or time.monotonic() < self._next_check:
+            return
+        self._next_check = time.monotonic() + self.check_interval
+        if self._signature() != self._state.signature:
+            try:
+                self.reload()
+            except (OSError, ValueError):
+                # Keep serving the current tables until the change is fixed
+                pass
+
+    def activate(self, match_type: str, version: str):
+        """
+        Make a loaded version the active one for a match type.
+
+        Raises:
+            KeyError: If the version does not exist.
+        """
+        with self._lock:
+            state = self._state
+            if (match_type, version) not in state.tables:
+                raise KeyError(f"{match_type} {version}")
+            self._state = _RegistryState(state.tables, {**state.active, match_type: version}, state.signature)
+
+    def active_version(self, match_type: str) -> str:
+        """
+        The active version of a match type.
+
+        Raises:
+            KeyError: If the match type has no tables.
+        """
+        self._refresh()
+        return self._state.active[match_type]
+
+    def has_version(self, match_type: str, version: str) -> bool:
+        self._refresh()
+        return (match_type, version) in self._state.tables
+
+    def tables(self) -> Dict[TableKey, ResourceTable]:
+        """
+        Every loaded table, by (match type, version).
+        """
+        self._refresh()
+        return dict(self._state.tables)
+
+    def versions(self) -> Dict[str, List[str]]:
+        """
+        Loaded versions per match type.
+        """
+        self._refresh()
+        versions: Dict[str, List[str]] = {}
+        for match_type, version in sorted(self._state.tables):
+            versions.setdefault(match_type, []).append(version)
+        return versions
+
+    def get(self, match_type: str, version: Optional[str] = None) -> ResourceTable:
+        """
+        The table of a match type, at the given version or the active one.
+
+        A name that is not a match type is looked up as a table name, among
+        the loaded tables and then as ``get_resource_table`` does.
+
+        Raises:
+            KeyError: If there is no such table.
+        """
+        self._refresh()
+        state = self._state
+        if version is None:
+            version = state.active.get(match_type)
+            if version is None:
+                for table in state.tables.values():
+                    if table.name == match_type:
+                        return table
+                return get_resource_table(match_type)
+        return state.tables[(match_type, version)]
+
+
+def build_resource_table_registry() -> ResourceTableRegistry:
+    """
+    Builds the registry configured by ``DLS_RESOURCE_TABLE_DIR``,
+    ``DLS_RESOURCE_TABLE_CHECK_INTERVAL`` (seconds) and
+    ``DLS_RESOURCE_TABLE_INTERPOLATION`` (``linear`` or ``pchip``, for the
+    bundled tables).
+    """
+    directory = os.environ.get('DLS_RESOURCE_TABLE_DIR')
+    providers: List[ResourceTableProvider] = [
+        BundledTableProvider(os.environ.get('DLS_RESOURCE_TABLE_INTERPOLATION', 'linear'))
+    ]
+    if directory:
+        providers.append(TableFileProvider(directory))
+    return ResourceTableRegistry(
+        providers,
+        directory=directory,
+        check_interval=float(os.environ.get('DLS_RESOURCE_TABLE_CHECK_INTERVAL', '5')) if directory else 0,
+    )
+
+
+resource_tables = build_resource_table_registry()
@@ -0,0 +1,309 @@
+"""
+Par scores for matches with any number of interruptions.
+
+A match timeline holds the resources of both innings and applies
+interruptions to them in order: each one removes the resources lost between
+the overs available before the stoppage and the revised overs after it. The
+par score after each interruption is therefore one lookup pair and a few
+arithmetic operations, and a whole timeline costs O(interruptions).
+
+With a single interruption, or none, the par score is the same as the
+corresponding single-scenario calculation of ``DLSCalculator``: when Team 1's
+innings was interrupted the first-innings formula applies (Team 1's runs plus
+the projected score times the resource difference), otherwise Team 1's runs
+are scaled by the ratio of resources.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+import numpy as np
+from numpy.typing import ArrayLike
+from calculators.dls_calculator import DLSCalculator
+
+
+@dataclass(frozen=True)
+class Interruption:
+    """
+    A stoppage in one innings.
+
+    Attributes:
+        innings: 1 for Team 1's innings, 2 for Team 2's
+        overs_used: Overs used by the batting team before the stoppage
+        wickets_lost: Wickets lost by the batting team before the stoppage
+        revised_overs: Maximum overs of the innings after resumption
+    """
+
+    innings: int
+    overs_used: float
+    wickets_lost: int
+    revised_overs: float
+
+
+@dataclass(frozen=True)
+class TimelineStep:
+    """
+    The state of a match after an interruption.
+    """
+
+    interruption: Interruption
+    team_one_resource: float
+    team_two_resource: float
+    par_score: float
+
+    @property
+    def revised_target(self) -> int:
+        return round(self.par_score) + 1
+
+
+class MatchTimeline:
+    """
+    Incremental par-score calculation for a match with several interruptions.
+
+    Interruptions are applied in match order with ``add_interruption``; all of
+    Team 1's come before any of Team 2's, and within an innings overs used and
+    wickets lost never go down.
+    """
+
+    def __init__(
+        self,
+        match_type: str,
+        overs_available_to_team_1_at_start: float,
+        runs_scored_by_team_1: int,
+        overs_available_to_team_2_at_start: float,
+        table_version: Optional[str] = None,
+    ):
+        """
+        Args:
+            match_type: The match type, e.g., 'T20' or 'ODI'
+            overs_available_to_team_1_at_start: Overs available to Team 1 at start
+            runs_scored_by_team_1: Total runs scored by Team 1
+            overs_available_to_team_2_at_start: Overs available to Team 2 at start
+            table_version: The resource table version; the active one if omitted
+        """
+        self.calculator = DLSCalculator(match_type, table_version)
+        self.match_type = match_type
+        self.runs_scored_by_team_1 = runs_scored_by_team_1
+
+        self.team_one_balls_initially = self.calculator._convert_overs_to_balls(overs_available_to_team_1_at_start)
+        team_two_balls_initially = self.calculator._convert_overs_to_balls(overs_available_to_team_2_at_start)
+        self.balls_available = {1: self.team_one_balls_initially, 2: team_two_balls_initially}
+        self.resources = {
+            1: self.calculator._get_resource_percentage(self.team_one_balls_initially, wickets_lost=0),
+            2: self.calculator._get_resource_percentage(team_two_balls_initially, wickets_lost=0),
+        }
+        self.balls_used = {1: 0, 2: 0}
+        self.wickets_lost = {1: 0, 2: 0}
+        self.innings = 1
+        self.team_one_interrupted = False
+        self.steps: List[TimelineStep] = []
+
+    @property
+    def par_score(self) -> float:
+        """
+        Par score for Team 2 with the interruptions applied so far.
+        """
+        team_one_resource, team_two_resource = self.resources[1], self.resources[2]
+        if not self.team_one_interrupted:
+            return self.runs_scored_by_team_1 * (team_two_resource / team_one_resource)
+
+        # Projected score of an uninterrupted first innings, from the run rate
+        # up to Team 1's last stoppage
+        team_one_balls_used = self.balls_used[1]
+        run_rate = self.runs_scored_by_team_1 / team_one_balls_used if team_one_balls_used > 0 else 0
+        g50_score = run_rate * self.team_one_balls_initially
+        return self.runs_scored_by_team_1 + (
+            g50_score * (team_two_resource - team_one_resource) / 100
+        )
+
+    def add_interruption(
+        self,
+        innings: int,
+        overs_used: float,
+        wickets_lost: int,
+        revised_overs: float,
+    ) -> TimelineStep:
+        """
+        Apply the next interruption.
+
+        Returns:
+            The state of the match after it
+
+        Raises:
+            ValueError: If the interruption does not follow the previous ones.
+        """
+        interruption = Interruption(innings, overs_used, wickets_lost, revised_overs)
+        balls_used = self.calculator._convert_overs_to_balls(overs_used)
+        balls_after = self.calculator._convert_overs_to_balls(revised_overs)
+        self._check(innings, balls_used, wickets_lost, balls_after)
+
+        resource_during_interruption = self.calculator._get_resource_percentage(
+            self.balls_available[innings] - balls_used,
+            wickets_lost
+        )
+        resource_after_resumption = self.calculator._get_resource_percentage(
+            balls_after - balls_used,
+            wickets_lost
+        )
+        self.resources[innings] = self.resources[innings] - (resource_during_interruption - resource_after_resumption)
+        self.balls_available[innings] = balls_after
+        self.balls_used[innings] = balls_used
+        self.wickets_lost[innings] = wickets_lost
+        self.innings = innings
+        if innings == 1:
+            self.team_one_interrupted = True
+
+        step = TimelineStep(interruption, float(self.resources[1]), float(self.resources[2]), float(self.par_score))
+        self.steps.append(step)
+        return step
+
+    def run(self, interruptions: Sequence[Interruption]) -> List[TimelineStep]:
+        """
+        Apply interruptions in order.
+
+        Returns:
+            The state of the match after each of them
+        """
+        return [
+            self.add_interruption(
+                interruption.innings,
+                interruption.overs_used,
+                interruption.wickets_lost,
+                interruption.revised_overs,
+            )
+            for interruption in interruptions
+        ]
+
+    def _check(self, innings: int, balls_used: int, wickets_lost: int, balls_after: int):
+        if innings not in (1, 2):
+            raise ValueError("Innings must be 1 or 2.")
+        if innings < self.innings:
+            raise ValueError("Interruptions in Team 1's innings must come before those in Team 2's.")
+        if not 0 <= wickets_lost <= 9:
+            raise ValueError("Wickets lost must be between 0 and 9.")
+        if balls_used < self.balls_used[innings] or wickets_lost < self.wickets_lost[innings]:
+            raise ValueError("Overs used and wickets lost cannot go down between interruptions of an innings.")
+        if balls_used > self.balls_available[innings]:
+            raise ValueError("Overs used must be within the overs available before the interruption.")
+        if not balls_used <= balls_after <= self.balls_available[innings]:
+            raise ValueError(
+                "Revised overs must be at least the overs used and at most the overs available before the interruption."
+            )
+
+
+def calculate_timelines_many(
+    match_type: str,
+    overs_available_to_team_1_at_start: ArrayLike,
+    runs_scored_by_team_1: ArrayLike,
+    overs_available_to_team_2_at_start: ArrayLike,
+    innings: ArrayLike,
+    overs_used: ArrayLike,
+    wickets_lost: ArrayLike,
+    revised_overs: ArrayLike,
+    table_version: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Vectorized ``MatchTimeline`` for many matches of one match type.
+
+    Match inputs are 1-D arrays with one value per match. Interruptions are
+    2-D arrays of shape (matches, interruptions), one row per match in match
+    order; rows with fewer interruptions are padded at the end with innings 0.
+    The matches are advanced together, one interruption column at a time.
+
+    Returns:
+        Par scores of shape (matches, interruptions) after each interruption,
+        NaN for padding
+
+    Raises:
+        ValueError: If any match's interruptions do not follow each other, as in ``MatchTimeline``.
+    """
+    calculator = DLSCalculator(match_type, table_version)
+    runs = np.asarray(runs_scored_by_team_1, dtype=float)
+    innings = np.atleast_2d(np.asarray(innings, dtype=np.int64))
+    balls_used = calculator._convert_overs_to_balls_many(np.atleast_2d(overs_used))
+    wickets_lost = np.atleast_2d(np.asarray(wickets_lost, dtype=np.int64))
+    balls_after = calculator._convert_overs_to_balls_many(np.atleast_2d(revised_overs))
+
+    team_one_balls_initially = calculator._convert_overs_to_balls_many(overs_available_to_team_1_at_start)
+    team_two_balls_initially = calculator._convert_overs_to_balls_many(overs_available_to_team_2_at_start)
+    zero_wickets = np.zeros(len(runs), dtype=np.int64)
+    balls_available = np.stack([team_one_balls_initially, team_two_balls_initially])
+    resources = np.stack([
+        calculator._get_resource_percentage_many(team_one_balls_initially, zero_wickets),
+        calculator._get_resource_percentage_many(team_two_balls_initially, zero_wickets),
+    ])
+    last_balls_used = np.zeros_like(balls_available)
+    last_wickets_lost = np.zeros_like(balls_available)
+    current_innings = np.ones(len(runs), dtype=np.int64)
+    team_one_interrupted = np.zeros(len(runs), dtype=bool)
+    active = np.ones(len(runs), dtype=bool)
+    matches = np.arange(len(runs))
+
+    par_scores = np.full(innings.shape, np.nan)
+    for column in range(innings.shape[1]):
+        column_innings = innings[:, column]
+        invalid = _invalid_interruptions(
+            column_innings, active, current_innings, balls_used[:, column], wickets_lost[:, column],
+            balls_after[:, column], balls_available, last_balls_used, last_wickets_lost
+        )
+        if invalid.any():
+            raise ValueError(f"Interruption {column} of match {np.flatnonzero(invalid)[0]} does not follow the previous ones.")
+
+        active = column_innings != 0
+        if not active.any():
+            break
+        row = np.where(active, column_innings, current_innings) - 1
+        column_wickets = np.where(active, wickets_lost[:, column], 0)
+        column_balls_used = np.where(active, balls_used[:, column], 0)
+        column_balls_after = np.where(active, balls_after[:, column], balls_available[row, matches])
+
+        resource_lost = (
+            calculator._get_resource_percentage_many(balls_available[row, matches] - column_balls_used, column_wickets)
+            - calculator._get_resource_percentage_many(column_balls_after - column_balls_used, column_wickets)
+        )
+        resources[row, matches] = np.where(active, resources[row, matches] - resource_lost, resources[row, matches])
+        balls_available[row, matches] = column_balls_after
+        last_balls_used[row, matches] = np.where(active, column_balls_used, last_balls_used[row, matches])
+        last_wickets_lost[row, matches] = np.where(active, column_wickets, last_wickets_lost[row, matches])
+        current_innings = np.where(active, column_innings, current_innings)
+
+        team_one_interrupted |= active & (column_innings == 1)
+        run_rate = calculator._run_rate_many(runs, last_balls_used[0])
+        g50_score = run_rate * team_one_balls_initially
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio_par = runs * (resources[1] / resources[0])
+        projected_par = runs + (g50_score * (resources[1] - resources[0]) / 100)
+        par_scores[:, column] = np.where(
+            active,
+            np.where(team_one_interrupted, projected_par, ratio_par),
+            np.nan
+        )
+
+    return par_scores
+
+
+def _invalid_interruptions(
+    innings: np.ndarray,
+    previously_active: np.ndarray,
+    current_innings: np.ndarray,
+    balls_used: np.ndarray,
+    wickets_lost: np.ndarray,
+    balls_after: np.ndarray,
+    balls_available: np.ndarray,
+    last_balls_used: np.ndarray,
+    last_wickets_lost: np.ndarray,
+) -> np.ndarray:
+    """
+    The matches whose interruption in this column breaks the rules of ``MatchTimeline._check``.
+    """
+    active = innings != 0
+    row = np.clip(innings, 1, 2) - 1
+    matches = np.arange(len(innings))
+    available = balls_available[row, matches]
+    return (
+        (active & ~previously_active)
+        | ((innings < 0) | (innings > 2))
+        | (active & (innings < current_innings))
+        | (active & ((wickets_lost < 0) | (wickets_lost > 9)))
+        | (active & ((balls_used < last_balls_used[row, matches]) | (wickets_lost < last_wickets_lost[row, matches])))
+        | (active & ((balls_used > available) | (balls_after < balls_used) | (balls_after > available)))
+    )
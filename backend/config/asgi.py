@@ -2,6 +2,12 @@
 ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Long-lived endpoints such as the live session Server-Sent Events stream
+(``/live-sessions/<session_id>/stream/``) should be served through it.
+The calculation, resource table and health check endpoints are served by
+the async-native views of ``api.async_views`` unless ``DLS_ASYNC_VIEWS`` is
+set to ``False``, and successful calculations are answered by the fast lane
+of ``api.fastlane`` if ``DLS_FAST_LANE`` is set to ``True``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
@@ -12,5 +18,10 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ.setdefault('DLS_ASYNC_VIEWS', 'True')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from api.fastlane import FastLaneASGI
+
+application = FastLaneASGI(django_application)
@@ -17,11 +17,13 @@ INSTALLED_APPS = [
     'corsheaders',
 ]
 
+# Django's security, common and clickjacking middleware, with their hooks
+# run inline rather than in a worker thread under ASGI
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
-    'django.middleware.security.SecurityMiddleware',
-    'django.middleware.common.CommonMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.SecurityMiddleware',
+    'api.middleware.CommonMiddleware',
+    'api.middleware.XFrameOptionsMiddleware',
 ]
 
 CORS_ALLOW_ALL_ORIGINS = True
@@ -52,6 +54,16 @@ DATABASES = {
     }
 }
 
+# Caches
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    }
+}
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -65,11 +77,11 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 # REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": (
-        "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
+        "api.renderers.ORJSONCamelCaseRenderer",
         "rest_framework.renderers.JSONRenderer",
     ),
     "DEFAULT_PARSER_CLASSES": (
-        "djangorestframework_camel_case.parser.CamelCaseJSONParser",
+        "api.parsers.ORJSONCamelCaseParser",
         "rest_framework.parsers.JSONParser",
     ),
     "DEFAULT_AUTHENTICATION_CLASSES": [],
@@ -79,3 +91,46 @@ REST_FRAMEWORK = {
     "UNAUTHENTICATED_USER": None,
     "UNAUTHENTICATED_TOKEN": None,
 }
+
+# Maximum number of scenarios accepted by the batch calculation endpoint
+DLS_BATCH_MAX_SIZE = int(os.environ.get('DLS_BATCH_MAX_SIZE', '10000'))
+
+# Live chase sessions held in memory by each worker
+DLS_LIVE_SESSION_MAX_COUNT = int(os.environ.get('DLS_LIVE_SESSION_MAX_COUNT', '1000'))
+DLS_LIVE_SESSION_TTL = int(os.environ.get('DLS_LIVE_SESSION_TTL', str(6 * 60 * 60)))
+
+# Build the calculators and the cheap lookup indexes when the app starts
+# instead of on the first requests
+DLS_SERVICE_WARM_UP = os.environ.get('DLS_SERVICE_WARM_UP', 'True') == 'True'
+
+# Serve the calculation, resource table and health check endpoints with the
+# async-native views of api.async_views. config/asgi.py enables this by
+# default; under WSGI the DRF views are kept.
+DLS_ASYNC_VIEWS = os.environ.get('DLS_ASYNC_VIEWS', 'False') == 'True'
+
+# Answer successful calculations in the raw WSGI/ASGI fast lane of
+# api.fastlane, in front of the middleware and DRF, in api/index.py and
+# config/asgi.py. Opt-in: the lane adds the middleware's response headers
+# itself, so a change to the middleware must be mirrored in it.
+DLS_FAST_LANE = os.environ.get('DLS_FAST_LANE', 'False') == 'True'
+
+# Opt-in micro-batching of concurrent single-scenario requests: the first
+# request of a batch waits up to WINDOW_MS for others, and a batch is
+# dispatched early once it holds MAX_SIZE requests.
+DLS_MICRO_BATCHING = {
+    'ENABLED': os.environ.get('DLS_MICRO_BATCH_ENABLED', 'False') == 'True',
+    'WINDOW_MS': float(os.environ.get('DLS_MICRO_BATCH_WINDOW_MS', '2')),
+    'MAX_SIZE': int(os.environ.get('DLS_MICRO_BATCH_MAX_SIZE', '256')),
+}
+
+# Memoization of DLSService.calculate results. The backend is any
+# api.cache.ResultCacheBackend; DjangoCacheBackend uses the CACHES alias
+# given in OPTIONS, so a shared cache can be configured for production.
+DLS_RESULT_CACHE = {
+    'ENABLED': os.environ.get('DLS_RESULT_CACHE_ENABLED', 'True') == 'True',
+    'BACKEND': 'api.cache.DjangoCacheBackend',
+    'OPTIONS': {
+        'alias': 'default',
+        'timeout': int(os.environ.get('DLS_RESULT_CACHE_TIMEOUT', '3600')),
+    },
+}